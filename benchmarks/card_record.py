@@ -0,0 +1,80 @@
+"""
+benchmarks/card_record.py
+Compares card dicts with CardRecord views over a compiled dataset: memory to
+materialize every card, and the speed of the advisor/signal stat lookups.
+
+Usage:
+    python -m benchmarks.card_record [--dataset Sets/OTJ_PremierDraft_All_Data.json] [--repeat 20]
+"""
+
+import os
+import argparse
+import tempfile
+import timeit
+import tracemalloc
+
+from src import constants
+from src.dataset import Dataset
+from src.card_logic import get_card_rating
+from src.signals import SignalCalculator
+
+DEFAULT_DATASET = os.path.join("tests", "data", "OTJ_PremierDraft_Data_2024_5_3.json")
+
+
+class _Metrics:
+    def get_metrics(self, color, field):
+        return 54.0, 4.0
+
+
+def traced(build):
+    """Returns (result, bytes still allocated by build)."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def lookups(cards, signals):
+    for card in cards:
+        get_card_rating(card, ["W", "U"])
+    signals.calculate_pack_signals(cards, 5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dataset", default=DEFAULT_DATASET)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        constants.TEMP_FOLDER = temp_folder
+        Dataset().open_file(args.dataset)
+
+        results = {}
+        for label, method in (
+            ("dicts", "get_data_by_id"),
+            ("records", "get_records_by_id"),
+        ):
+            dataset = Dataset()
+            dataset.open_file(args.dataset)
+            ids = list(dataset.get_card_ratings())
+            cards, size = traced(lambda: getattr(dataset, method)(ids))
+            signals = SignalCalculator(_Metrics())
+            seconds = min(
+                timeit.repeat(
+                    lambda: lookups(cards, signals), number=1, repeat=args.repeat
+                )
+            )
+            results[label] = (len(cards), size, seconds)
+
+    print(f"{os.path.basename(args.dataset)}")
+    for label, (count, size, seconds) in results.items():
+        print(
+            f"  {label:8} {count} cards  {size / 2**20:6.2f} MiB"
+            f"  lookups {seconds * 1000:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
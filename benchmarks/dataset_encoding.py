@@ -0,0 +1,98 @@
+"""
+benchmarks/dataset_encoding.py
+Compares dataset size and load time for the dense schema 3 layout, the one record
+per card schema 4 layout and the sparse stats schema 5 layout of a real dataset.
+
+Usage:
+    python -m benchmarks.dataset_encoding [--dataset Sets/OTJ_PremierDraft_All_Data.json] [--repeat 5]
+"""
+
+import os
+import gzip
+import json
+import argparse
+import tempfile
+import time
+
+from src.utils import check_file_integrity
+from server.transform import sparsify_deck_colors
+
+DEFAULT_DATASET = os.path.join("tests", "data", "OTJ_PremierDraft_Data_2024_5_3.json")
+
+
+def one_record_per_card(dataset):
+    """Schema 4: card_ratings keyed by name, plus an arena id index."""
+    records, id_index = {}, {}
+    for arena_id, card in dataset["card_ratings"].items():
+        records.setdefault(card["name"], card)
+        id_index[arena_id] = card["name"]
+    encoded = dict(dataset, card_ratings=records, id_index=id_index)
+    encoded["meta"] = dict(dataset["meta"], version=4.0)
+    return encoded
+
+
+def sparse_stats(dataset):
+    """Schema 5: schema 4 with zero-valued stats and empty archetypes omitted."""
+    encoded = one_record_per_card(dataset)
+    archetypes, defaults = {}, {}
+    for card in encoded["card_ratings"].values():
+        for archetype, stats in card.get("deck_colors", {}).items():
+            archetypes.setdefault(archetype, None)
+            for field, value in stats.items():
+                defaults.setdefault(field, type(value)())
+    encoded["card_ratings"] = {
+        name: dict(
+            card, deck_colors=sparsify_deck_colors(card["deck_colors"], defaults)
+        )
+        for name, card in encoded["card_ratings"].items()
+    }
+    encoded["stat_defaults"] = {"archetypes": list(archetypes), "stats": defaults}
+    encoded["meta"]["version"] = 5.0
+    return encoded
+
+
+def measure(dataset, folder, label, repeat):
+    location = os.path.join(folder, f"{label}.json")
+    raw = json.dumps(dataset, separators=(",", ":")).encode("utf-8")
+    with open(location, "wb") as f:
+        f.write(raw)
+    packed = gzip.compress(raw)
+
+    best_load, best_unzip = float("inf"), float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        gzip.decompress(packed)
+        best_unzip = min(best_unzip, time.perf_counter() - start)
+        start = time.perf_counter()
+        check_file_integrity(location)
+        best_load = min(best_load, time.perf_counter() - start)
+    return len(raw), len(packed), best_unzip, best_load
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dataset", default=DEFAULT_DATASET)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.dataset, "r", encoding="utf-8") as f:
+        dense = json.load(f)
+
+    encodings = [
+        ("schema 3 (dense)", dense),
+        ("schema 4 (records)", one_record_per_card(dense)),
+        ("schema 5 (sparse)", sparse_stats(dense)),
+    ]
+    print(f"{os.path.basename(args.dataset)}")
+    print(f"  {'':20} {'json KiB':>9} {'gz KiB':>8} {'gunzip ms':>10} {'load ms':>8}")
+    with tempfile.TemporaryDirectory() as folder:
+        for index, (label, dataset) in enumerate(encodings):
+            size, packed, unzip, load = measure(dataset, folder, index, args.repeat)
+            print(
+                f"  {label:20} {size / 1024:9.0f} {packed / 1024:8.0f}"
+                f" {unzip * 1000:10.1f} {load * 1000:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
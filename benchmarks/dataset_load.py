@@ -0,0 +1,61 @@
+"""
+benchmarks/dataset_load.py
+Compares opening a dataset from JSON with opening its compiled form.
+
+Usage:
+    python -m benchmarks.dataset_load [--dataset Sets/OTJ_PremierDraft_All_Data.json] [--repeat 5]
+"""
+
+import os
+import argparse
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from src import constants
+from src.dataset import Dataset
+from src.compiled_dataset import compiled_dataset_path
+
+DEFAULT_DATASET = os.path.join("tests", "data", "OTJ_PremierDraft_Data_2024_5_3.json")
+
+
+def measure(location, repeat):
+    """Returns (best seconds, peak traced bytes) for Dataset.open_file."""
+    best, peak = float("inf"), 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        dataset = Dataset()
+        dataset.open_file(location)
+        best = min(best, time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dataset", default=DEFAULT_DATASET)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        constants.TEMP_FOLDER = temp_folder
+        # Keep the JSON runs from compiling, so every run takes the JSON path
+        with patch("src.dataset.compile_dataset"):
+            json_time, json_peak = measure(args.dataset, args.repeat)
+        Dataset().open_file(args.dataset)
+        compiled_size = os.path.getsize(compiled_dataset_path(args.dataset))
+        compiled_time, compiled_peak = measure(args.dataset, args.repeat)
+
+    print(f"{os.path.basename(args.dataset)}")
+    print(f"  json     {json_time * 1000:8.1f} ms  peak {json_peak / 2**20:6.1f} MiB")
+    print(
+        f"  compiled {compiled_time * 1000:8.1f} ms  peak {compiled_peak / 2**20:6.1f} MiB"
+        f"  ({compiled_size / 2**20:.1f} MiB file)"
+    )
+
+
+if __name__ == "__main__":
+    main()
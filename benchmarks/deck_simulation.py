@@ -0,0 +1,81 @@
+"""
+benchmarks/deck_simulation.py
+Times simulate_deck on a two-color 40-card deck with hybrid costs, removal and a
+fixing land, at the iteration counts the deck builder uses, and the exact mana
+analytics on their own.
+
+Usage:
+    python -m benchmarks.deck_simulation [--iterations 300 2000 10000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+
+from src.card_logic import simulate_deck
+from src.deck_analytics import _exact_stats, exact_mana_stats
+from src.deck_simulation import encode_deck
+
+
+def build_deck():
+    def land(name, colors, count, text=""):
+        return {
+            "name": name,
+            "types": ["Land"],
+            "colors": colors,
+            "count": count,
+            "text": text,
+        }
+
+    def spell(name, mana_cost, cmc, count, tags=()):
+        return {
+            "name": name,
+            "types": ["Creature"],
+            "mana_cost": mana_cost,
+            "cmc": cmc,
+            "count": count,
+            "tags": list(tags),
+        }
+
+    return [
+        land("Plains", ["W"], 8),
+        land("Island", ["U"], 8),
+        land("Prismatic Vista", [], 1, "Add one mana of any color."),
+        spell("Scout", "{W}", 1, 2),
+        spell("Bear", "{1}{W}", 2, 4),
+        spell("Hybrid Sprite", "{1}{W/U}", 2, 2),
+        spell("Drake", "{2}{U}", 3, 4),
+        spell("Strike", "{1}{U}{U}", 3, 3, ["removal"]),
+        spell("Knight", "{2}{W}{W}", 4, 4),
+        spell("Sphinx", "{3}{W}{U}", 5, 2),
+        spell("Giant", "{5}{U}", 6, 2, ["removal"]),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, nargs="+", default=[300, 2000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    deck = build_deck()
+    for iterations in args.iterations:
+        elapsed = min(
+            timeit.repeat(
+                lambda: simulate_deck(deck, iterations), number=1, repeat=args.repeat
+            )
+        )
+        print(f"{iterations:>6} iterations {elapsed * 1000:8.1f} ms")
+
+    encoded = encode_deck(deck)
+
+    def analytics():
+        # Time a fresh computation rather than a cache hit
+        _exact_stats.cache_clear()
+        exact_mana_stats(encoded)
+
+    elapsed = min(timeit.repeat(analytics, number=1, repeat=args.repeat))
+    print(f"{'exact':>6} analytics  {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
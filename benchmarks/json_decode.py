@@ -0,0 +1,117 @@
+"""
+benchmarks/json_decode.py
+Compares the legacy process_json + json_find decode with json_find_keys on captured lines.
+
+Usage:
+    python -m benchmarks.json_decode [--log Player.log] [--repeat 2000]
+"""
+
+import argparse
+import json
+import timeit
+
+from src import constants
+from src import log_scanner
+from src.utils import process_json, json_find, json_find_keys
+from tests import test_log_scanner_data
+
+# (label, search string, keys read by the matching scanner parser)
+LINE_TYPES = [
+    ("Event_Join", constants.DRAFT_START_STRING_PREMIER, log_scanner.EVENT_START_KEYS),
+    ("Draft.Notify", constants.DRAFT_PACK_STRING_PREMIER, log_scanner.PACK_NOTIFY_KEYS),
+    ("MakePick", constants.DRAFT_PICK_STRING_PREMIER, log_scanner.PICK_HUMAN_KEYS),
+    ("DraftPack", constants.DRAFT_PACK_STRING_QUICK, log_scanner.PACK_BOT_KEYS),
+    ("BotDraftPick", constants.DRAFT_PICK_STRING_QUICK, log_scanner.PICK_BOT_KEYS),
+]
+
+
+def captured_lines(log_path=None):
+    """Returns the captured lines from the scanner test data, or from a real log."""
+    if log_path:
+        with open(log_path, "r", encoding="utf-8", errors="replace") as log:
+            return [line.rstrip("\n") for line in log]
+
+    lines = []
+    for name in dir(test_log_scanner_data):
+        entries = getattr(test_log_scanner_data, name)
+        if "ENTRIES" in name and isinstance(entries, list):
+            lines.extend(entry[-1] for entry in entries)
+    return lines
+
+
+def legacy_process_json(obj):
+    """process_json as it was before the targeted decoder, kept as the baseline."""
+    if isinstance(obj, dict):
+        return {key: legacy_process_json(value) for key, value in obj.items()}
+    elif isinstance(obj, str):
+        try:
+            return legacy_process_json(json.loads(obj))
+        except json.JSONDecodeError:
+            sanitized = (
+                obj.strip()
+                .replace('"request":"{', '"request":{')
+                .replace('"Payload":"{', '"Payload":{')
+            )
+            if sanitized.endswith('}"}'):
+                sanitized = sanitized[:-3] + "}}"
+            try:
+                return legacy_process_json(json.loads(sanitized))
+            except:
+                pass
+            return obj
+    else:
+        return obj
+
+
+def decode_legacy(payload, keys):
+    data = legacy_process_json(payload)
+    return {key: json_find(key, data) for key in keys}
+
+
+def decode_eager(payload, keys):
+    data = process_json(payload)
+    return {key: json_find(key, data) for key in keys}
+
+
+def decode_targeted(payload, keys):
+    return json_find_keys(keys, payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--log", help="Benchmark lines from an existing Player.log")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    lines = captured_lines(args.log)
+    print(
+        f"{'line type':>14} {'lines':>6} {'avg bytes':>10} {'legacy us':>10} "
+        f"{'eager us':>10} {'targeted us':>12} {'speedup':>8}"
+    )
+
+    for label, search_string, keys in LINE_TYPES:
+        payloads = [
+            line[line.find("{") :]
+            for line in lines
+            if search_string in line and "{" in line
+        ]
+        if not payloads:
+            continue
+
+        timings = []
+        for decode in (decode_legacy, decode_eager, decode_targeted):
+            elapsed = timeit.timeit(
+                lambda: [decode(payload, keys) for payload in payloads],
+                number=args.repeat,
+            )
+            timings.append(elapsed / (args.repeat * len(payloads)) * 1e6)
+
+        avg_bytes = sum(len(p) for p in payloads) / len(payloads)
+        print(
+            f"{label:>14} {len(payloads):>6} {avg_bytes:>10,.0f} {timings[0]:>10.1f} "
+            f"{timings[1]:>10.1f} {timings[2]:>12.1f} {timings[0] / timings[2]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
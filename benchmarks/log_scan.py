@@ -0,0 +1,117 @@
+"""
+benchmarks/log_scan.py
+Compares Player.log scanning throughput of the readline and mmap scanner modes.
+
+Usage:
+    python -m benchmarks.log_scan --size-gb 2
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src import constants
+from src.limited_sets import SetDictionary, SetInfo
+from src.log_scanner import ArenaScanner
+
+DRAFT_LINES = [
+    r'[UnityCrossThreadLogger]==> Event_Join {"id":"11a8f74b-1afb-4d25-bb35-55d43674c808","request":"{\"EventName\":\"PremierDraft_OTJ_20240416\",\"EntryCurrencyType\":\"Gem\",\"EntryCurrencyPaid\":1500,\"CustomTokenId\":null}"}',
+    r'[UnityCrossThreadLogger]Draft.Notify {"draftId":"87b408d1-43e0-4fb5-8c74-a1257fde087c","SelfPick":1,"SelfPack":1,"PackCards":"90734,90584,90631,90362,90440,90349,90486,90527,90406,90439,90488,90480,90388,90459"}',
+    r'[UnityCrossThreadLogger]==> Event_PlayerDraftMakePick {"id":"3","request":"{\"DraftId\":\"87b408d1-43e0-4fb5-8c74-a1257fde087c\",\"Pack\":1,\"Pick\":1,\"GrpId\":90459}"}',
+]
+
+
+def _noise_block(line_count: int) -> bytes:
+    """A block of typical Player.log chatter: timestamps, GRE JSON and Unity output."""
+    rng = random.Random(17)
+    lines = []
+    for i in range(line_count):
+        roll = rng.random()
+        if roll < 0.30:
+            lines.append(f"[UnityCrossThreadLogger]4/16/2024 10:{i % 60:02d}:00 AM")
+        elif roll < 0.65:
+            lines.append(
+                f'[UnityCrossThreadLogger]==> GraphGetGraphState {{"id":"{i}","request":"{{\\"GraphId\\":\\"NPE_Tutorial\\",\\"State\\":{i}}}"}}'
+            )
+        elif roll < 0.75:
+            lines.append(
+                '{ "transactionId": "%d", "greToClientEvent": { "greToClientMessages": [ { "type": "GREMessageType_GameStateMessage", "gameStateId": %d, "zones": [%s] } ] } }'
+                % (i, i, ",".join(str(z) for z in range(40)))
+            )
+        else:
+            lines.append(
+                f"Unloading {i} unused Assets to reduce memory usage. Loaded Objects now: {i * 7}."
+            )
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def build_log(path: str, size_bytes: int) -> int:
+    """Writes a synthetic Player.log of roughly size_bytes and returns its line count."""
+    block = _noise_block(20000)
+    block_lines = block.count(b"\n")
+    line_count = 0
+    with open(path, "wb") as log:
+        written = 0
+        while written < size_bytes:
+            log.write(block)
+            written += len(block)
+            line_count += block_lines
+        for line in DRAFT_LINES:
+            log.write(line.encode("utf-8") + b"\n")
+            line_count += 1
+    return line_count
+
+
+def run_scan(path: str, mode: str, state_dir: str):
+    """Cold-scans the whole log in one mode. Returns (seconds, pack/pick state)."""
+    set_list = SetDictionary(
+        data={"Outlaws": SetInfo(arena=["OTJ"], seventeenlands=["OTJ"], set_code="OTJ")}
+    )
+    # Each mode gets its own journal and log index, so neither run starts warm
+    mode_dir = os.path.join(state_dir, mode)
+    os.makedirs(mode_dir, exist_ok=True)
+    scanner = ArenaScanner(path, set_list, scan_mode=mode, state_folder=mode_dir)
+    scanner.log_enable(False)
+
+    start = time.perf_counter()
+    scanner.scan_log()
+    elapsed = time.perf_counter() - start
+    return elapsed, (scanner.retrieve_current_pack_and_pick(), scanner.taken_cards)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--size-gb", type=float, default=2.0)
+    parser.add_argument("--log", help="Reuse an existing log instead of generating one")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = args.log
+        if path:
+            with open(path, "rb") as log:
+                line_count = sum(1 for _ in log)
+        else:
+            path = os.path.join(temp_dir, "Player.log")
+            print(f"Generating {args.size_gb:.1f} GB synthetic log...")
+            line_count = build_log(path, int(args.size_gb * 1024**3))
+
+        size_mb = os.path.getsize(path) / 1024**2
+        print(f"{size_mb:,.0f} MB, {line_count:,} lines")
+
+        results = {}
+        for mode in [constants.LOG_SCAN_MODE_READLINE, constants.LOG_SCAN_MODE_MMAP]:
+            elapsed, state = run_scan(path, mode, temp_dir)
+            results[mode] = state
+            print(
+                f"{mode:>9}: {elapsed:8.2f} s  {line_count / elapsed:>12,.0f} lines/s  "
+                f"{size_mb / elapsed:8.1f} MB/s"
+            )
+
+        if len({repr(state) for state in results.values()}) != 1:
+            print("WARNING: scanner modes disagree on the parsed draft state")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+benchmarks/set_metrics.py
+Times building SetMetrics for a cube-sized dataset, opened from JSON and from its
+compiled form. The cube is made by repeating a set's cards under new names.
+
+Usage:
+    python -m benchmarks.set_metrics [--dataset Sets/OTJ_PremierDraft_All_Data.json] [--copies 10] [--repeat 5]
+"""
+
+import os
+import copy
+import json
+import argparse
+import tempfile
+import timeit
+from unittest.mock import patch
+
+from src import constants
+from src.dataset import Dataset
+from src.set_metrics import SetMetrics
+
+DEFAULT_DATASET = os.path.join("tests", "data", "OTJ_PremierDraft_Data_2024_5_3.json")
+
+
+def build_cube(source, copies, location):
+    """Writes a dataset holding copies of every card in source, returning the card count."""
+    with open(source, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    ratings = {}
+    for copy_index in range(copies):
+        for arena_id, card in data["card_ratings"].items():
+            card = copy.deepcopy(card)
+            card[constants.DATA_FIELD_NAME] = (
+                f"{card[constants.DATA_FIELD_NAME]} {copy_index}"
+            )
+            ratings[f"{copy_index}{arena_id}"] = card
+    data["card_ratings"] = ratings
+    with open(location, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    return len(ratings)
+
+
+def time_metrics(location, repeat):
+    dataset = Dataset()
+    dataset.open_file(location)
+    return min(timeit.repeat(lambda: SetMetrics(dataset), number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dataset", default=DEFAULT_DATASET)
+    parser.add_argument("--copies", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        constants.TEMP_FOLDER = temp_folder
+        location = os.path.join(temp_folder, "CUBE_PremierDraft_All_Data.json")
+        count = build_cube(args.dataset, args.copies, location)
+        # Keep the JSON runs from compiling, so they take the JSON path
+        with patch("src.dataset.compile_dataset"):
+            json_time = time_metrics(location, args.repeat)
+        Dataset().open_file(location)
+        compiled_time = time_metrics(location, args.repeat)
+
+    print(f"{count} cards ({args.copies} x {os.path.basename(args.dataset)})")
+    print(f"  json     {json_time * 1000:8.1f} ms")
+    print(f"  compiled {compiled_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
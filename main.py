@@ -22,6 +22,7 @@ locale.setlocale = _safe_setlocale
 
 import ttkbootstrap as ttk
 import argparse
+import multiprocessing
 import os
 import sys
 import logging
@@ -29,6 +30,7 @@ from src import constants
 from src.configuration import read_configuration, write_configuration
 from src.limited_sets import LimitedSets
 from src.log_scanner import ArenaScanner
+from src.deck_simulation import get_simulation_executor, shutdown_simulation_executor
 from src.file_extractor import search_arena_log_locations, retrieve_arena_directory
 from src.ui.app import DraftApp
 from src.ui.windows.splash import SplashWindow
@@ -76,11 +78,14 @@ def load_data(args, config, progress_callback):
 
     # 5. SCANNER INITIALIZATION
     progress_callback("Initializing Scanner...")
+    # Start the deck simulation workers so the first deck build does not wait for them
+    get_simulation_executor().warm_up()
     scanner = ArenaScanner(
         filename=log_path,
         set_list=limited_sets,
         retrieve_unknown=True,
         db_path=config.settings.database_location,
+        dataset_cache_mb=config.settings.dataset_cache_mb,
     )
 
     # 6. DRAFT DISCOVERY (Deep Scan)
@@ -258,7 +263,11 @@ def main():
         if root:
             root.destroy()
         sys.exit(0)
+    finally:
+        shutdown_simulation_executor()
 
 
 if __name__ == "__main__":
+    # Required for the log indexer and deck simulator process pools in frozen builds
+    multiprocessing.freeze_support()
     main()
@@ -26,6 +26,19 @@ WAF_COOLDOWN_SEC = 180.0  # 3 minutes of sleep if we get a 403/WAF block
 # Statistical Thresholds
 MIN_GAMES_THRESHOLD = 500  # Increased to reduce API spam and filter out noisy data
 
+# --- DATASET SCHEMA ---
+# 4: card_ratings holds one record per card, keyed by card name, and id_index
+# maps every arena id (one per printing) to its record
+# 5: deck_colors omits default-valued stats and empty archetypes; stat_defaults
+# lists the archetypes and default stats the client fills back in
+DATASET_SCHEMA_VERSION = 5
+# Clients released before schema 4 ignore the manifest's schema field, so each
+# run also publishes a schema 3 copy under the original "datasets" section and
+# filenames. The current schema is written to COMPACT_DATASETS_DIR and listed
+# under "compact_datasets", which only schema-aware clients read.
+LEGACY_DATASET_SCHEMA_VERSION = 3
+COMPACT_DATASETS_DIR = "compact"
+
 # --- DATA TARGETS ---
 ARCHETYPES = [
     "All Decks",
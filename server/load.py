@@ -26,14 +26,19 @@ def atomic_write(filepath, write_func):
         raise
 
 
-def save_dataset(set_code, draft_format, user_group, dataset) -> dict:
+def save_dataset(set_code, draft_format, user_group, dataset, subdir="") -> dict:
     ensure_output_dir()
-    filename = f"{set_code}_{draft_format}_{user_group}_Data.json.gz"
-    filepath = os.path.join(config.OUTPUT_DIR, filename)
+    base_name = f"{set_code}_{draft_format}_{user_group}_Data.json.gz"
+    # The manifest filename is relative to the site root, so it uses URL separators
+    filename = f"{subdir}/{base_name}" if subdir else base_name
+    output_dir = os.path.join(config.OUTPUT_DIR, subdir)
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    filepath = os.path.join(output_dir, base_name)
 
     json_str = json.dumps(dataset, separators=(",", ":"))
 
-    internal_name = filename.replace(".gz", "")
+    internal_name = base_name.replace(".gz", "")
 
     def _write_gz(tmp_path):
         with open(tmp_path, "wb") as f_out:
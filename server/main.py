@@ -15,7 +15,7 @@ from server.extract import (
     get_historical_start_dates,
     extract_basic_lands,
 )
-from server.transform import transform_payload
+from server.transform import legacy_payload, transform_payload
 from server.load import save_dataset, save_manifest, save_report, deploy_web_assets
 from server.report import PipelineReport
 
@@ -92,6 +92,8 @@ def run_pipeline():
     manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
     if "datasets" not in manifest:
         manifest["datasets"] = {}
+    if "compact_datasets" not in manifest:
+        manifest["compact_datasets"] = {}
 
     manifest["active_sets"] = list(active_sets.keys())
 
@@ -216,14 +218,30 @@ def run_pipeline():
                 total_games,
             )
 
-            file_info = save_dataset(set_code, draft_format, user_group, final_dataset)
+            file_info = save_dataset(
+                set_code,
+                draft_format,
+                user_group,
+                final_dataset,
+                config.COMPACT_DATASETS_DIR,
+            )
             file_info["start_date"] = start_date_str
             file_info["end_date"] = end_date_str
+            file_info["schema"] = config.DATASET_SCHEMA_VERSION
+
+            # Older clients read "datasets" without checking the schema
+            legacy_info = save_dataset(
+                set_code, draft_format, user_group, legacy_payload(final_dataset)
+            )
+            legacy_info["start_date"] = start_date_str
+            legacy_info["end_date"] = end_date_str
+            legacy_info["schema"] = config.LEGACY_DATASET_SCHEMA_VERSION
 
             manifest_key = f"{set_code}_{draft_format}_{user_group}"
-            manifest["datasets"][manifest_key] = file_info
+            manifest["compact_datasets"][manifest_key] = file_info
+            manifest["datasets"][manifest_key] = legacy_info
 
-            card_count = len(final_dataset.get("card_ratings", {}))
+            card_count = len(final_dataset.get("id_index", {}))
 
             report.record_dataset(
                 set_code,
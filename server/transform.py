@@ -46,6 +46,37 @@ def parse_scryfall_types(type_line: str):
     return types_list, subtypes_list
 
 
+# Stats of an archetype with no games. Schema 5 datasets omit every field equal
+# to its default, and every archetype left empty, from a card's deck_colors
+DEFAULT_ARCHETYPE_STATS = {
+    "gihwr": 0.0,
+    "ohwr": 0.0,
+    "gpwr": 0.0,
+    "gnswr": 0.0,
+    "gdwr": 0.0,
+    "alsa": 0.0,
+    "ata": 0.0,
+    "iwd": 0.0,
+    "samples": 0,
+    "seen_count": 0,
+    "pick_count": 0,
+    "game_count": 0,
+    "play_rate": 0.0,
+}
+
+
+def sparsify_deck_colors(deck_colors: dict, defaults: dict) -> dict:
+    """Drops default-valued fields, then archetypes with nothing left."""
+    sparse = {}
+    for arch, stats in deck_colors.items():
+        block = {
+            k: v for k, v in stats.items() if k not in defaults or defaults[k] != v
+        }
+        if block:
+            sparse[arch] = block
+    return sparse
+
+
 BASIC_LANDS = {
     "Plains",
     "Island",
@@ -99,11 +130,16 @@ def transform_payload(
             ),
             "start_date": start_date,
             "end_date": end_date,
-            "version": 3.0,
+            "version": float(config.DATASET_SCHEMA_VERSION),
             "game_count": total_games,
         },
         "color_ratings": safe_color_ratings,
         "card_ratings": {},
+        "id_index": {},
+        "stat_defaults": {
+            "archetypes": list(config.ARCHETYPES),
+            "stats": dict(DEFAULT_ARCHETYPE_STATS),
+        },
     }
 
     all_decks_stats_map = seventeenlands_data.get("All Decks", {})
@@ -152,28 +188,20 @@ def transform_payload(
         ata = all_decks_stats.get("ata", 0.0)
 
         for arch in config.ARCHETYPES:
-            card_obj["deck_colors"][arch] = {
-                "gihwr": 0.0,
-                "ohwr": 0.0,
-                "gpwr": 0.0,
-                "gnswr": 0.0,
-                "gdwr": 0.0,
-                "alsa": alsa if arch == "All Decks" else 0.0,
-                "ata": ata if arch == "All Decks" else 0.0,
-                "iwd": 0.0,
-                "samples": 0,
-                "seen_count": 0,
-                "pick_count": 0,
-                "game_count": 0,
-                "play_rate": 0.0,
-            }
+            card_obj["deck_colors"][arch] = dict(DEFAULT_ARCHETYPE_STATS)
+            if arch == "All Decks":
+                card_obj["deck_colors"][arch].update(alsa=alsa, ata=ata)
             if arch_stats := seventeenlands_data.get(arch, {}).get(name):
                 for k, v in arch_stats.items():
                     if k not in ("17lands_images", "arena_id", "rarity"):
                         card_obj["deck_colors"][arch][k] = v
 
+        card_obj["deck_colors"] = sparsify_deck_colors(
+            card_obj["deck_colors"], DEFAULT_ARCHETYPE_STATS
+        )
+        payload["card_ratings"][name] = card_obj
         for a_id in arena_ids:
-            payload["card_ratings"][str(a_id)] = card_obj
+            payload["id_index"][str(a_id)] = name
 
     for name in BASIC_LANDS:
         if name in scryfall_cards and name not in all_decks_stats_map:
@@ -198,24 +226,41 @@ def transform_payload(
                 "tags": card_tags.get(name, []),
             }
 
-            for arch in config.ARCHETYPES:
-                card_obj["deck_colors"][arch] = {
-                    "gihwr": 0.0,
-                    "ohwr": 0.0,
-                    "gpwr": 0.0,
-                    "gnswr": 0.0,
-                    "gdwr": 0.0,
-                    "alsa": 0.0,
-                    "ata": 0.0,
-                    "iwd": 0.0,
-                    "samples": 0,
-                    "seen_count": 0,
-                    "pick_count": 0,
-                    "game_count": 0,
-                    "play_rate": 0.0,
-                }
-
+            # A basic land without 17Lands stats has the defaults in every archetype
+            payload["card_ratings"][name] = card_obj
             for a_id in sf_ids:
-                payload["card_ratings"][str(a_id)] = card_obj
+                payload["id_index"][str(a_id)] = name
 
     return payload
+
+
+def legacy_payload(payload: dict) -> dict:
+    """
+    Schema 3 copy of a transformed payload for clients that predate schema 4:
+    card_ratings keyed by arena id, with every archetype's full stats.
+    """
+    archetypes = payload["stat_defaults"]["archetypes"]
+    defaults = payload["stat_defaults"]["stats"]
+
+    records = {}
+    for name, card in payload["card_ratings"].items():
+        sparse = card.get("deck_colors", {})
+        records[name] = dict(
+            card,
+            deck_colors={
+                arch: {**defaults, **sparse.get(arch, {})} for arch in archetypes
+            },
+        )
+
+    legacy = {
+        k: v
+        for k, v in payload.items()
+        if k not in ("card_ratings", "id_index", "stat_defaults")
+    }
+    legacy["meta"] = dict(
+        payload["meta"], version=float(config.LEGACY_DATASET_SCHEMA_VERSION)
+    )
+    legacy["card_ratings"] = {
+        arena_id: records[name] for arena_id, name in payload["id_index"].items()
+    }
+    return legacy
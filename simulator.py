@@ -1,40 +1,74 @@
-import time
-import os
+"""
+simulator.py
 
-# Put an old, complete Player.log from a previous draft in a folder named 'test_logs'
-SOURCE_LOG = "test_logs/Player_Old_Draft.log"
-TARGET_LOG = "Player.log"
+Replays a recorded Player.log or DraftLog_*.log through a headless
+DraftOrchestrator and reports the pick-to-render latency (p50/p95/p99).
+
+Usage:
+    python simulator.py test_logs/Player_Old_Draft.log --speed 0
+    python simulator.py DraftLog_OTJ_PremierDraft_x.log --speed 10 --json
+    python simulator.py test_logs/Player_Old_Draft.log --draft-only --speed 1 \\
+        --target Player.log   # also lets a running MTGA Draft Tool follow along
+"""
 
+import argparse
+import json
 
-def simulate_draft():
-    print("Starting Draft Simulator... Open the MTGA Draft Tool!")
+from src import constants
+from src.limited_sets import LimitedSets
+from src.replay import LogReplayer
+
+# Put an old, complete Player.log from a previous draft in a folder named 'test_logs'
+SOURCE_LOG = "test_logs/Player_Old_Draft.log"
 
-    with open(TARGET_LOG, "w") as f:
-        f.write("MTG Arena Simulator Started\n")
 
-    time.sleep(2)
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument("source", nargs="?", default=SOURCE_LOG)
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="0 = as fast as possible, 1 = recorded pace, N = N times faster",
+    )
+    parser.add_argument(
+        "--max-gap",
+        type=float,
+        default=5.0,
+        help="Cap on a single recorded pause, in seconds",
+    )
+    parser.add_argument(
+        "--draft-only",
+        action="store_true",
+        help="Only replay the event join, pack and pick lines",
+    )
+    parser.add_argument("--target", help="Write the replayed log to this path")
+    parser.add_argument("--sets", default=constants.SETS_FOLDER)
+    parser.add_argument(
+        "--scan-mode",
+        default=constants.LOG_SCAN_MODE_DEFAULT,
+        choices=[constants.LOG_SCAN_MODE_READLINE, constants.LOG_SCAN_MODE_MMAP],
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
 
-    with open(SOURCE_LOG, "r") as source:
-        with open(TARGET_LOG, "a") as target:
-            for line in source:
-                # Only copy lines that your app actually cares about to speed it up
-                if any(
-                    keyword in line
-                    for keyword in [
-                        "Event_Join",
-                        "CardsInPack",
-                        "Draft.Notify",
-                        "Event_PlayerDraftMakePick",
-                        "BotDraft",
-                    ]
-                ):
-                    print(f"Sending Event -> {line[:60]}...")
-                    target.write(line)
-                    target.flush()  # Force OS to write so your app sees it
+    replayer = LogReplayer(
+        args.source,
+        LimitedSets().retrieve_limited_sets(),
+        speed=args.speed,
+        max_gap=args.max_gap,
+        sets_location=args.sets,
+        draft_only=args.draft_only,
+        target_log=args.target,
+        scan_mode=args.scan_mode,
+    )
+    report = replayer.run()
 
-                    # Pause for 3 seconds between actions so you can watch the UI update
-                    time.sleep(3)
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(report.format())
 
 
 if __name__ == "__main__":
-    simulate_draft()
+    main()
@@ -13,6 +13,7 @@ from typing import List, Dict, Any, Tuple
 from src.advisor.schema import Recommendation
 from src import constants
 from src.card_logic import count_fixing, get_functional_cmc
+from src.card_record import card_stat
 
 logger = logging.getLogger(__name__)
 
@@ -71,9 +72,7 @@ class DraftAdvisor:
         pack_wrs = []
         for c in pack_cards:
             try:
-                wr = float(
-                    c.get("deck_colors", {}).get("All Decks", {}).get("gihwr", 0.0)
-                )
+                wr = card_stat(c, "All Decks", "gihwr")
                 if wr > 0:
                     pack_wrs.append(wr)
             except:
@@ -86,9 +85,7 @@ class DraftAdvisor:
 
         pack_cards_sorted = sorted(
             pack_cards,
-            key=lambda c: float(
-                c.get("deck_colors", {}).get("All Decks", {}).get("gihwr", 0.0) or 0.0
-            ),
+            key=lambda c: card_stat(c, "All Decks", "gihwr"),
             reverse=True,
         )
         pack_ranks = {
@@ -115,11 +112,10 @@ class DraftAdvisor:
         for card in pack_cards:
             try:
                 name = str(card.get("name", "Unknown")).strip()
-                stats = card.get("deck_colors", {}).get("All Decks", {})
                 raw_gihwr, raw_iwd, alsa = (
-                    float(stats.get("gihwr", 0.0)),
-                    float(stats.get("iwd", 0.0)),
-                    float(stats.get("alsa", 0.0)),
+                    card_stat(card, "All Decks", "gihwr"),
+                    card_stat(card, "All Decks", "iwd"),
+                    card_stat(card, "All Decks", "alsa"),
                 )
                 card_colors = card.get("colors", [])
                 reasons, synergy_bonus = [], 0.0
@@ -150,11 +146,7 @@ class DraftAdvisor:
                     else True
                 )
                 if len(self.main_colors) >= 2:
-                    arch_wr = float(
-                        card.get("deck_colors", {})
-                        .get(self.main_archetype, {})
-                        .get("gihwr", 0.0)
-                    )
+                    arch_wr = card_stat(card, self.main_archetype, "gihwr")
                     if arch_wr > 0.0:
                         delta = arch_wr - raw_gihwr
 
@@ -297,9 +289,7 @@ class DraftAdvisor:
         for idx, c in enumerate(self.pool):
             try:
                 colors = c.get("colors", [])
-                wr = float(
-                    c.get("deck_colors", {}).get("All Decks", {}).get("gihwr", 0.0)
-                )
+                wr = card_stat(c, "All Decks", "gihwr")
                 if "Land" not in c.get("types", []):
                     for col in colors:
                         color_counts[col] += 1
@@ -349,9 +339,7 @@ class DraftAdvisor:
                     "Land" in c.get("types", []) and len(c.get("colors", [])) > 1
                 ):
                     fixing_count += 1
-                wr = float(
-                    c.get("deck_colors", {}).get("All Decks", {}).get("gihwr", 0.0)
-                )
+                wr = card_stat(c, "All Decks", "gihwr")
                 if wr > (self.global_mean + (1.5 * self.global_std)):
                     for col in c.get("colors", []):
                         if self.main_colors and col not in self.main_colors:
@@ -473,9 +461,7 @@ class DraftAdvisor:
         if pick >= 9:
             return 1.0, "", 0.0
         try:
-            alsa = float(
-                card.get("deck_colors", {}).get("All Decks", {}).get("alsa", 0.0)
-            )
+            alsa = card_stat(card, "All Decks", "alsa")
             if alsa <= pick:
                 return 1.0, "", 0.0
             coeffs = constants.WHEEL_COEFFICIENTS[min(pick - 1, 5)]
@@ -495,14 +481,13 @@ class DraftAdvisor:
 
     def _calculate_weighted_score(self, card: Dict, pick_number: int) -> float:
         try:
-            stats = card.get("deck_colors", {})
-            global_wr = float(stats.get("All Decks", {}).get("gihwr", 0.0))
+            global_wr = card_stat(card, "All Decks", "gihwr")
             arch_weight = min(0.9, 0.2 + (pick_number / self.TOTAL_PICKS) * 0.7)
-            arch_stats = stats.get(self.main_archetype, {})
-            arch_wr = float(arch_stats.get("gihwr", global_wr))
+            arch_wr = card_stat(card, self.main_archetype, "gihwr", global_wr)
+            samples = card_stat(card, self.main_archetype, "samples")
             blended_wr = (
                 (global_wr * (1.0 - arch_weight)) + (arch_wr * arch_weight)
-                if (arch_wr > 0 and int(arch_stats.get("samples", 0)) >= 100)
+                if (arch_wr > 0 and int(samples) >= 100)
                 else global_wr
             )
             return max(
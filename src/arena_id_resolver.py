@@ -0,0 +1,226 @@
+"""
+src/arena_id_resolver.py
+
+Resolves Arena grpIds that a dataset does not list (new printings, alchemy
+rebalances) to card names using the local Arena card database. Each database file
+gets one read-only connection, a pack's unknown ids are resolved in one
+IN (...) query, and resolutions are persisted to a small cache keyed by the
+database file (Arena names it after its content hash), so they survive restarts
+until Arena ships a new database.
+"""
+
+import os
+import json
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import src.constants as constants
+from src.logger import create_logger
+
+logger = create_logger()
+
+# Stays below SQLite's default limit on bound parameters
+_QUERY_BATCH = 500
+
+_NAME_QUERY = (
+    "SELECT c.GrpId, loc.Loc FROM Cards c JOIN {table} loc "
+    "ON c.TitleId = loc.LocId WHERE c.GrpId IN ({params})"
+)
+_TITLE_QUERY = (
+    "SELECT c.GrpId, loc.Loc FROM Cards c JOIN {table} loc "
+    "ON c.TitleId = loc.LocId WHERE loc.Loc IN ({params})"
+)
+
+
+def _batches(items: list):
+    for start in range(0, len(items), _QUERY_BATCH):
+        yield items[start : start + _QUERY_BATCH]
+
+
+def _numeric(grp_id: str):
+    try:
+        return int(grp_id)
+    except ValueError:
+        return grp_id
+
+
+class ArenaIdResolver:
+    """Batched grpId to card name lookups against the newest Arena card database."""
+
+    def __init__(self, db_path: str, cache_file: str = None):
+        self.db_folder = (
+            os.path.join(db_path, constants.LOCAL_DOWNLOADS_DATA) if db_path else ""
+        )
+        self.cache_file = cache_file or os.path.join(
+            constants.TEMP_FOLDER, constants.ARENA_ID_CACHE_FILE_NAME
+        )
+        self._lock = threading.Lock()
+        self._folder_mtime = None
+        self._db_file = None
+        self._db_key = None
+        self._connection = None
+        self._table = None
+        self._names = {}
+        self._warmed = set()
+        self.queries = 0
+
+    def _locate_database(self) -> Optional[str]:
+        """The newest card database, re-listed only when the Raw folder changes."""
+        try:
+            mtime = os.stat(self.db_folder).st_mtime
+        except (OSError, ValueError):
+            return None
+        if mtime == self._folder_mtime:
+            return self._db_file
+        db_files = [
+            os.path.join(self.db_folder, f)
+            for f in os.listdir(self.db_folder)
+            if f.startswith(constants.LOCAL_DATA_FILE_PREFIX_DATABASE)
+        ]
+        self._folder_mtime = mtime
+        self._db_file = max(db_files, key=os.path.getmtime) if db_files else None
+        return self._db_file
+
+    def _open(self) -> bool:
+        """Points the resolver at the current database, reopening it if it changed."""
+        db_file = self._locate_database()
+        if db_file is None:
+            return False
+        key = f"{os.path.basename(db_file)}:{os.path.getsize(db_file)}"
+        if key == self._db_key and self._connection is not None:
+            return True
+        self._close_connection()
+        connection = sqlite3.connect(
+            Path(db_file).resolve().as_uri() + "?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+        found = connection.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+            (constants.LOCAL_DATABASE_TABLE_LOCALIZATION,),
+        ).fetchone()
+        self._table = (
+            constants.LOCAL_DATABASE_TABLE_LOCALIZATION if found else "Localizations"
+        )
+        self._connection = connection
+        if key != self._db_key:
+            self._db_key = key
+            self._names = self._load_cache().get(key, {})
+            self._warmed = set()
+        return True
+
+    def _close_connection(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _load_cache(self) -> dict:
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == constants.ARENA_ID_CACHE_VERSION:
+                    return data.get("databases", {})
+        except Exception as e:
+            logger.error(f"Failed to read Arena id cache: {e}")
+        return {}
+
+    def _save_cache(self):
+        """Writes the current database's resolutions; older databases are dropped."""
+        try:
+            dir_name = os.path.dirname(self.cache_file)
+            if dir_name and not os.path.exists(dir_name):
+                os.makedirs(dir_name)
+            data = {
+                "version": constants.ARENA_ID_CACHE_VERSION,
+                "databases": {self._db_key: self._names},
+            }
+            fd, tmp_path = tempfile.mkstemp(dir=dir_name or None, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_path, self.cache_file)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except Exception as e:
+            logger.error(f"Failed to write Arena id cache: {e}")
+
+    def _query(self, query: str, values: list) -> Dict[str, str]:
+        found = {}
+        for batch in _batches(values):
+            sql = query.format(table=self._table, params=",".join("?" * len(batch)))
+            self.queries += 1
+            for grp_id, name in self._connection.execute(sql, batch):
+                if name:
+                    found[str(grp_id)] = name
+        return found
+
+    def resolve(self, grp_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Maps each grpId to its card name. Ids the database does not know map to
+        themselves, as do all ids when no database is found.
+        """
+        grp_ids = [str(grp_id) for grp_id in grp_ids]
+        with self._lock:
+            try:
+                if not self._open():
+                    return {grp_id: grp_id for grp_id in grp_ids}
+                missing = list(
+                    dict.fromkeys(g for g in grp_ids if g not in self._names)
+                )
+                if missing:
+                    found = self._query(_NAME_QUERY, [_numeric(g) for g in missing])
+                    for grp_id in missing:
+                        self._names[grp_id] = found.get(grp_id, grp_id)
+                    self._save_cache()
+            except Exception as e:
+                logger.error(f"SQLite ID Resolution failed: {e}")
+                return {grp_id: self._names.get(grp_id, grp_id) for grp_id in grp_ids}
+            return {grp_id: self._names[grp_id] for grp_id in grp_ids}
+
+    def warm_up(self, names: Iterable[str]) -> int:
+        """
+        Resolves every grpId whose card name is in names in bulk, so other
+        printings of a dataset's cards are already known when they show up in a
+        pack. Returns the number of newly cached ids.
+        """
+        with self._lock:
+            try:
+                if not self._open():
+                    return 0
+                names = [n for n in dict.fromkeys(names) if n not in self._warmed]
+                if not names:
+                    return 0
+                found = self._query(_TITLE_QUERY, names)
+                self._warmed.update(names)
+                added = {k: v for k, v in found.items() if self._names.get(k) != v}
+                if added:
+                    self._names.update(added)
+                    self._save_cache()
+                return len(added)
+            except Exception as e:
+                logger.error(f"Arena id warmup failed: {e}")
+                return 0
+
+    def close(self):
+        with self._lock:
+            self._close_connection()
+
+
+_RESOLVERS = {}
+_RESOLVER_LOCK = threading.Lock()
+
+
+def get_arena_id_resolver(db_path: str) -> ArenaIdResolver:
+    """Returns the shared resolver for an Arena install, so its connection is reused"""
+    with _RESOLVER_LOCK:
+        resolver = _RESOLVERS.get(db_path)
+        if resolver is None:
+            resolver = ArenaIdResolver(db_path)
+            _RESOLVERS[db_path] = resolver
+    return resolver
@@ -13,8 +13,9 @@ import re
 import io
 import csv
 import json
-import random
 from src import constants
+from src.card_record import card_stat
+from src.deck_simulation import align_deck_slots, new_seed, run_simulation
 from src.logger import create_logger
 
 logger = create_logger()
@@ -413,183 +414,18 @@ def get_sideboard(pool, deck_stacked):
     return sideboard
 
 
-def simulate_deck(deck_list, iterations=10000):
-    flat_deck = []
-    for c in deck_list:
-        is_land = "Land" in c.get("types", [])
-        colors_produced = set()
-        if is_land:
-            colors_produced.update(c.get("colors", []))
-            text = str(c.get("text", "")).lower()
-            if "any color" in text or "fixing_ramp" in c.get("tags", []):
-                colors_produced.update(["W", "U", "B", "R", "G"])
-
-        pips = []
-        if not is_land:
-            cost = c.get("mana_cost", "")
-            matches = re.findall(r"\{(.*?)\}", cost)
-            for pip in matches:
-                opts = [opt for opt in pip.split("/") if opt in "WUBRG"]
-                if opts:
-                    pips.append(opts)
-
-        for _ in range(int(c.get("count", 1))):
-            flat_deck.append(
-                {
-                    "is_land": is_land,
-                    "is_removal": "removal" in c.get("tags", []),
-                    "colors_produced": colors_produced,
-                    "cmc": get_functional_cmc(c),
-                    "pips": pips,
-                }
-            )
-
-    if len(flat_deck) < 40:
-        return None
-
-    stats = {
-        "mulligans": 0,
-        "screw_t3": 0,
-        "screw_t4": 0,
-        "flood_t5": 0,
-        "cast_t2": 0,
-        "cast_t3": 0,
-        "cast_t4": 0,
-        "curve_out": 0,
-        "removal_t4": 0,
-        "color_screw_t3": 0,
-        "avg_hand_size": 0,
-    }
-
-    for _ in range(iterations):
-        random.shuffle(flat_deck)
-
-        # Pro-Level London Mulligan Heuristic
-        mull_count = 0
-        hand = flat_deck[0:7]
-        lands = sum(1 for c in hand if c["is_land"])
-
-        if lands < 2 or lands > 5:
-            mull_count = 1
-            hand = flat_deck[7:14]
-            lands = sum(1 for c in hand if c["is_land"])
-            if lands < 2 or lands > 4:
-                mull_count = 2
-                hand = flat_deck[14:21]
-
-        if mull_count > 0:
-            stats["mulligans"] += 1
-
-        kept_size = 7 - mull_count
-        stats["avg_hand_size"] += kept_size
-        start_idx = mull_count * 7
-
-        current_7 = flat_deck[start_idx : start_idx + 7]
-        if kept_size < 7:
-            # London Mulligan Heuristic: Drop the highest CMC cards.
-            current_7.sort(key=lambda x: x["cmc"])
-
-        kept_hand = current_7[:kept_size]
-        deck_rest = flat_deck[start_idx + 7 :]
-
-        game_state = kept_hand + deck_rest
-
-        t2_state = game_state[: kept_size + 1]
-        t3_state = game_state[: kept_size + 2]
-        t4_state = game_state[: kept_size + 3]
-        t5_state = game_state[: kept_size + 4]
-
-        lands_t3 = [c for c in t3_state if c["is_land"]]
-        if len(lands_t3) < 3:
-            stats["screw_t3"] += 1
-
-        lands_t4 = [c for c in t4_state if c["is_land"]]
-        if len(lands_t4) < 4:
-            stats["screw_t4"] += 1
-
-        lands_t5 = sum(1 for c in t5_state if c["is_land"])
-        if lands_t5 >= 6:
-            stats["flood_t5"] += 1
-
-        if any(c["is_removal"] for c in t4_state):
-            stats["removal_t4"] += 1
-
-        def can_cast(state, target_cmc):
-            available_lands = [c for c in state if c["is_land"]]
-            if len(available_lands) < target_cmc:
-                return False
-
-            spells = [c for c in state if not c["is_land"] and c["cmc"] == target_cmc]
-            if not spells:
-                return False
-
-            color_sources = {"W": 0, "U": 0, "B": 0, "R": 0, "G": 0}
-            for l in available_lands:
-                for c in l["colors_produced"]:
-                    color_sources[c] += 1
-
-            for s in spells:
-                castable = True
-                temp_sources = color_sources.copy()
-                for pip_opts in s["pips"]:
-                    paid = False
-                    for opt in pip_opts:
-                        if temp_sources.get(opt, 0) > 0:
-                            temp_sources[opt] -= 1
-                            paid = True
-                            break
-                    if not paid:
-                        castable = False
-                        break
-                if castable:
-                    return True
-            return False
-
-        c2 = can_cast(t2_state, 2)
-        c3 = can_cast(t3_state, 3)
-        c4 = can_cast(t4_state, 4)
-
-        if c2:
-            stats["cast_t2"] += 1
-        if c3:
-            stats["cast_t3"] += 1
-        if c4:
-            stats["cast_t4"] += 1
-        if c2 and c3 and c4:
-            stats["curve_out"] += 1
-
-        if len(lands_t3) >= 3:
-            color_sources = {"W": 0, "U": 0, "B": 0, "R": 0, "G": 0}
-            for l in lands_t3:
-                for c in l["colors_produced"]:
-                    color_sources[c] += 1
-
-            t3_spells = [c for c in t3_state if not c["is_land"] and c["cmc"] <= 3]
-            any_color_screw = False
-            for s in t3_spells:
-                temp_sources = color_sources.copy()
-                can_pay_colors = True
-                for pip_opts in s["pips"]:
-                    paid = False
-                    for opt in pip_opts:
-                        if temp_sources.get(opt, 0) > 0:
-                            temp_sources[opt] -= 1
-                            paid = True
-                            break
-                    if not paid:
-                        can_pay_colors = False
-                        break
-                if not can_pay_colors:
-                    any_color_screw = True
-                    break
-            if any_color_screw:
-                stats["color_screw_t3"] += 1
-
-    stats["avg_hand_size"] = stats["avg_hand_size"] / iterations
-    for k in list(stats.keys()):
-        if k != "avg_hand_size":
-            stats[k] = (stats[k] / iterations) * 100.0
-    return stats
+def simulate_deck(deck_list, iterations=10000, seed=None, tolerance=None):
+    """
+    Mana and curve stats for a 40+ card deck list: mulligan, screw, flood and
+    removal rates and the keep_7/6/5 rates, computed exactly, and Monte Carlo
+    on-curve casts and color screw, as percentages, plus the average kept hand
+    size, the games played and the simulated stats' 95% half-widths under
+    "intervals". Returns None for decks under 40 cards.
+    Passing a seed makes the stats reproducible. With a tolerance, iterations is
+    a budget and the run stops once every simulated rate is within tolerance
+    points.
+    """
+    return run_simulation(deck_list, iterations, seed, tolerance=tolerance)
 
 
 GLOBAL_DECK_CACHE = {}
@@ -770,8 +606,14 @@ def optimize_deck(base_deck, base_sb, archetype_key, colors):
     best_score = -9999
     best_perm = permutations[0]
 
+    # Common random numbers: every permutation is played on the same shuffles,
+    # with its cards in the base deck's slots, so the score differences come from
+    # the swaps rather than from different draws
+    seed = new_seed()
     for desc, p_deck, p_sb in permutations:
-        stats = simulate_deck(p_deck, iterations=300)
+        stats = simulate_deck(
+            align_deck_slots(base_deck, p_deck), iterations=1000, seed=seed
+        )
         if not stats:
             continue
         score = (
@@ -847,7 +689,9 @@ def suggest_deck(
 
             opt_deck, opt_sb = deck, sb
             opt_note = ""
-            opt_stats = simulate_deck(opt_deck, iterations=10000)
+            opt_stats = simulate_deck(
+                opt_deck, iterations=10000, tolerance=constants.SIMULATION_TOLERANCE
+            )
 
             score, breakdown = calculate_holistic_score(
                 opt_deck, colors, pool_size, metrics
@@ -1757,18 +1601,14 @@ def get_card_rating(card, colors, metrics=None):
         if mean_val > 0:
             global_mean = mean_val
 
-    stats = card.get("deck_colors", {})
-
     # 1. Always get the Global baseline first
-    global_stats = stats.get("All Decks", {})
-    global_wr = float(global_stats.get("gihwr", 0.0))
+    global_wr = card_stat(card, "All Decks", "gihwr")
 
     # 2. Try to get the specific archetype data
     arch_key = (
         "".join(sorted(colors)) if len(colors) <= 2 else "".join(sorted(colors[:2]))
     )
-    arch_stats = stats.get(arch_key, {})
-    arch_wr = float(arch_stats.get("gihwr", 0.0))
+    arch_wr = card_stat(card, arch_key, "gihwr")
 
     # 3. Blending Logic
     if arch_wr > 30.0 and global_wr > 30.0:
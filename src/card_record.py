@@ -0,0 +1,58 @@
+"""
+src/card_record.py
+
+Compact, read-only card view over a compiled dataset. A CardRecord holds only
+its table and row; attributes and archetype stats are read from the table's
+column lists and packed stats array on demand. It implements the mapping
+protocol, so callers that read card dicts accept it unchanged, and card_stat
+gives hot loops one lookup that works on both representations.
+"""
+
+from collections.abc import Mapping
+
+from src.constants import DATA_FIELD_DECK_COLORS
+
+
+def card_stat(card, archetype: str, field: str, default: float = 0.0) -> float:
+    """
+    card["deck_colors"][archetype][field] as a float, or default if any level is
+    missing. Reads a CardRecord's packed stats directly.
+    """
+    if type(card) is CardRecord:
+        return card._table.stat(card._row, archetype, field, default)
+    value = card.get(DATA_FIELD_DECK_COLORS, {}).get(archetype, {}).get(field)
+    return default if value is None else float(value)
+
+
+class CardRecord(Mapping):
+    __slots__ = ("_table", "_row", "_deck_colors")
+
+    def __init__(self, table, row: int):
+        self._table = table
+        self._row = row
+        self._deck_colors = None
+
+    def stat(self, archetype: str, field: str, default=0.0):
+        return self._table.stat(self._row, archetype, field, default)
+
+    def __getitem__(self, key):
+        if not self._table.has_key(self._row, key):
+            raise KeyError(key)
+        if key == DATA_FIELD_DECK_COLORS:
+            # Built once for callers that walk the nested dicts
+            if self._deck_colors is None:
+                self._deck_colors = self._table.deck_colors(self._row)
+            return self._deck_colors
+        return self._table.value(self._row, key)
+
+    def __contains__(self, key):
+        return self._table.has_key(self._row, key)
+
+    def __iter__(self):
+        return iter(self._table.card_keys(self._row))
+
+    def __len__(self):
+        return len(self._table.card_keys(self._row))
+
+    def __repr__(self):
+        return f"CardRecord({dict(self)!r})"
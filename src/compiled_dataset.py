@@ -0,0 +1,401 @@
+"""
+src/compiled_dataset.py
+
+Compiled binary form of a 17Lands dataset. The card attributes are stored as
+column tables in a JSON header and every card's per-archetype stats as one
+[card x archetype x field] array, so opening a dataset is one read and a header
+parse instead of decoding and normalizing the full JSON file. Card dicts are
+built only when a card is looked up.
+
+The file is read into memory rather than mapped: Windows cannot replace or
+delete a file with a live mapping, and cached datasets stay open long enough to
+block recompiling or deleting a refreshed dataset.
+
+Arena ids that share one card record (every printing of a card in a schema 4
+dataset) share one row.
+
+Layout: magic | uint32 header length | header JSON | padding to 16 bytes |
+stats array (C order) | uint8 [card x archetype] presence mask.
+"""
+
+import os
+import json
+import math
+import struct
+import tempfile
+from collections.abc import MutableMapping
+from typing import Optional
+
+import numpy as np
+
+import src.constants as constants
+from src.utils import normalize_color_string, sanitize_card_name
+from src.logger import create_logger
+
+logger = create_logger()
+
+_MAGIC = b"MTGADS\x00\x01"
+_PREFIX = struct.Struct("<8sI")
+_ALIGNMENT = 16
+# Counts above this are not exact in float32
+_FLOAT32_INT_LIMIT = 2**24
+_MAX_DECIMALS = 6
+
+
+def compiled_dataset_path(file_location: str) -> str:
+    return os.path.join(
+        constants.TEMP_FOLDER,
+        constants.DATASET_COMPILED_FOLDER,
+        os.path.basename(file_location) + constants.DATASET_COMPILED_SUFFIX,
+    )
+
+
+def _round_to(value: float, scale: int) -> float:
+    # Several times faster than round(value, decimals) on the lookup path
+    return math.floor(value * scale + 0.5) / scale
+
+
+def _float32_decimals(values: np.ndarray) -> Optional[int]:
+    """
+    Smallest number of decimals that recovers every value from its float32 copy,
+    or None if float32 is too coarse for the field.
+    """
+    originals = values.tolist()
+    narrowed = values.astype(np.float32).astype(np.float64).tolist()
+    for decimals in range(_MAX_DECIMALS + 1):
+        scale = 10**decimals
+        if all(_round_to(n, scale) == o for n, o in zip(narrowed, originals)):
+            return decimals
+    return None
+
+
+def _build_stats(cards: list):
+    """
+    Packs every card's deck_colors into a NaN-filled stats array. Returns the
+    archetype and field names, the array, the presence mask and the int fields.
+    """
+    archetypes, fields = {}, {}
+    for card in cards:
+        for archetype, stats in (
+            card.get(constants.DATA_FIELD_DECK_COLORS) or {}
+        ).items():
+            archetypes.setdefault(normalize_color_string(archetype), len(archetypes))
+            for field in stats:
+                fields.setdefault(field, len(fields))
+
+    values = np.full((len(cards), len(archetypes), len(fields)), np.nan)
+    present = np.zeros((len(cards), len(archetypes)), dtype=np.uint8)
+    int_fields = set(fields)
+    for row, card in enumerate(cards):
+        for archetype, stats in (
+            card.get(constants.DATA_FIELD_DECK_COLORS) or {}
+        ).items():
+            column = archetypes[normalize_color_string(archetype)]
+            # Matches the JSON load, where a later alias replaces an earlier one
+            values[row, column, :] = np.nan
+            present[row, column] = 1
+            for field, value in stats.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ValueError(f"Non-numeric {field} value: {value!r}")
+                if not isinstance(value, int) or abs(value) > _FLOAT32_INT_LIMIT:
+                    int_fields.discard(field)
+                values[row, column, fields[field]] = value
+    return list(archetypes), list(fields), values, present, int_fields
+
+
+def compile_dataset(file_location: str, json_data: dict) -> bool:
+    """
+    Writes the compiled form of a validated dataset. The source file's size and
+    mtime are stored so a changed dataset is recompiled.
+    """
+    try:
+        stat = os.stat(file_location)
+        ratings = json_data.get("card_ratings") or {}
+        ids, id_rows, cards, record_rows = [], [], [], {}
+        for arena_id, card in ratings.items():
+            row = record_rows.setdefault(id(card), len(cards))
+            if row == len(cards):
+                cards.append(card)
+            ids.append(arena_id)
+            id_rows.append(row)
+
+        keys = {}
+        for card in cards:
+            for key in card:
+                keys.setdefault(key, None)
+        columns, absent = {}, {}
+        for key in keys:
+            if key == constants.DATA_FIELD_DECK_COLORS:
+                column = [None] * len(cards)
+            elif key == constants.DATA_FIELD_NAME:
+                column = [sanitize_card_name(c.get(key)) for c in cards]
+            else:
+                column = [c.get(key) for c in cards]
+            columns[key] = column
+            missing = [row for row, card in enumerate(cards) if key not in card]
+            if missing:
+                absent[key] = missing
+
+        archetypes, fields, values, present, int_fields = _build_stats(cards)
+
+        decoders, dtype = [], "float32"
+        for index, field in enumerate(fields):
+            if field in int_fields:
+                decoders.append("int")
+                continue
+            known = values[..., index]
+            decimals = _float32_decimals(known[~np.isnan(known)])
+            if decimals is None:
+                dtype = "float64"
+                break
+            decoders.append(decimals)
+        if dtype == "float64":
+            decoders = ["int" if f in int_fields else None for f in fields]
+        stats = np.ascontiguousarray(values, dtype=dtype)
+
+        sections = {k: v for k, v in json_data.items() if k != "card_ratings"}
+        if "color_ratings" in sections:
+            sections["color_ratings"] = {
+                normalize_color_string(k): v
+                for k, v in sections["color_ratings"].items()
+            }
+
+        header = {
+            "version": constants.DATASET_COMPILED_VERSION,
+            "source": [stat.st_size, stat.st_mtime],
+            "sections": sections,
+            "ids": ids,
+            "id_rows": id_rows,
+            "keys": list(keys),
+            "columns": columns,
+            "absent": absent,
+            "archetypes": archetypes,
+            "fields": fields,
+            "decoders": decoders,
+            "dtype": dtype,
+            "mask_offset": stats.nbytes,
+        }
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        data_start = _PREFIX.size + len(header_bytes)
+        padding = -data_start % _ALIGNMENT
+
+        location = compiled_dataset_path(file_location)
+        dir_name = os.path.dirname(location)
+        if not os.path.exists(dir_name):
+            os.makedirs(dir_name)
+        fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_PREFIX.pack(_MAGIC, len(header_bytes)))
+                f.write(header_bytes)
+                f.write(b"\x00" * padding)
+                f.write(stats.tobytes())
+                f.write(present.tobytes())
+            os.replace(tmp_path, location)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return True
+    except Exception as e:
+        logger.error(f"Failed to compile dataset {file_location}: {e}")
+        return False
+
+
+def load_compiled_dataset(file_location: str) -> Optional["CompiledDataset"]:
+    """Reads the compiled form of a dataset, or returns None if it is missing or stale."""
+    location = compiled_dataset_path(file_location)
+    try:
+        stat = os.stat(file_location)
+    except OSError:
+        return None
+    if not os.path.exists(location):
+        return None
+    try:
+        with open(location, "rb") as f:
+            buffer = f.read()
+        magic, header_length = _PREFIX.unpack_from(buffer, 0)
+        if magic != _MAGIC:
+            return None
+        header = json.loads(buffer[_PREFIX.size : _PREFIX.size + header_length])
+        if header.get("version") != constants.DATASET_COMPILED_VERSION or header[
+            "source"
+        ] != [stat.st_size, stat.st_mtime]:
+            return None
+        data_start = _PREFIX.size + header_length
+        data_start += -data_start % _ALIGNMENT
+        return CompiledDataset(buffer, header, data_start)
+    except Exception as e:
+        logger.error(f"Failed to load compiled dataset {location}: {e}")
+        return None
+
+
+class CompiledDataset:
+    """Read-only view of a compiled dataset."""
+
+    def __init__(self, buffer, header: dict, data_start: int):
+        self.sections = header["sections"]
+        self.ids = header["ids"]
+        self.rows = dict(zip(self.ids, header["id_rows"]))
+        self.names = header["columns"].get(constants.DATA_FIELD_NAME, [])
+        self.archetypes = header["archetypes"]
+        self.fields = header["fields"]
+        self._keys = header["keys"]
+        self._columns = header["columns"]
+        self._absent = {k: set(rows) for k, rows in header["absent"].items()}
+        self._decoders = header["decoders"]
+
+        shape = (len(self.names), len(self.archetypes), len(self.fields))
+        self.stats = np.frombuffer(
+            buffer, dtype=header["dtype"], count=int(np.prod(shape)), offset=data_start
+        ).reshape(shape)
+        self.present = np.frombuffer(
+            buffer,
+            dtype=np.uint8,
+            count=shape[0] * shape[1],
+            offset=data_start + header["mask_offset"],
+        ).reshape(shape[:2])
+
+        # Flat views for single-value reads, which index faster than numpy scalars
+        self.archetype_ids = {a: i for i, a in enumerate(self.archetypes)}
+        self.field_ids = {f: i for i, f in enumerate(self.fields)}
+        self._stats_flat = memoryview(self.stats.reshape(-1))
+        self._present_flat = memoryview(self.present.reshape(-1))
+        self._width = len(self.archetypes)
+        self._depth = len(self.fields)
+        self._scales = [None if d in ("int", None) else 10**d for d in self._decoders]
+
+    def stat(self, row: int, archetype: str, field: str, default=0.0):
+        """One deck_colors value of a card, or default if the card lacks it."""
+        column = self.archetype_ids.get(archetype)
+        index = self.field_ids.get(field)
+        if column is None or index is None:
+            return default
+        cell = row * self._width + column
+        if not self._present_flat[cell]:
+            return default
+        value = self._stats_flat[cell * self._depth + index]
+        if value != value:
+            return default
+        scale = self._scales[index]
+        return value if scale is None else _round_to(value, scale)
+
+    def stats_matrix(self, rows: list, archetypes: list, fields: list) -> np.ndarray:
+        """
+        Decoded deck_colors values of rows as a float64 [row x archetype x field]
+        array, NaN where a card lacks the archetype or field.
+        """
+        matrix = np.full((len(rows), len(archetypes), len(fields)), np.nan)
+        columns = [
+            (i, self.archetype_ids[a])
+            for i, a in enumerate(archetypes)
+            if a in self.archetype_ids
+        ]
+        indexes = [
+            (i, self.field_ids[f]) for i, f in enumerate(fields) if f in self.field_ids
+        ]
+        if not rows or not columns or not indexes:
+            return matrix
+        targets, sources = zip(*columns)
+        field_targets, field_sources = zip(*indexes)
+        block = self.stats[np.ix_(rows, sources, field_sources)].astype(np.float64)
+        block[self.present[np.ix_(rows, sources)] == 0] = np.nan
+        for k, index in enumerate(field_sources):
+            decoder = self._decoders[index]
+            if decoder == "int":
+                block[..., k] = np.round(block[..., k])
+            elif decoder is not None:
+                # Same operations as _round_to, so values match card() exactly
+                scale = 10**decoder
+                block[..., k] = np.floor(block[..., k] * scale + 0.5) / scale
+        matrix[np.ix_(range(len(rows)), targets, field_targets)] = block
+        return matrix
+
+    def has_key(self, row: int, key: str) -> bool:
+        return key in self._columns and row not in self._absent.get(key, ())
+
+    def card_keys(self, row: int) -> list:
+        return [key for key in self._keys if row not in self._absent.get(key, ())]
+
+    def value(self, row: int, key: str):
+        """A card attribute other than deck_colors."""
+        return self._columns[key][row]
+
+    def _decode(self, index: int, value: float):
+        decoder = self._decoders[index]
+        if decoder == "int":
+            return int(round(value))
+        if decoder is None:
+            return value
+        return _round_to(value, 10**decoder)
+
+    def deck_colors(self, row: int) -> dict:
+        values = self.stats[row].tolist()
+        present = self.present[row].tolist()
+        deck_colors = {}
+        for column, archetype in enumerate(self.archetypes):
+            if not present[column]:
+                continue
+            deck_colors[archetype] = {
+                field: self._decode(index, value)
+                for index, (field, value) in enumerate(zip(self.fields, values[column]))
+                if value == value  # NaN marks a field the archetype did not have
+            }
+        return deck_colors
+
+    def card(self, row: int) -> dict:
+        card = {}
+        for key in self._keys:
+            if row in self._absent.get(key, ()):
+                continue
+            if key == constants.DATA_FIELD_DECK_COLORS:
+                card[key] = self.deck_colors(row)
+            else:
+                card[key] = self._columns[key][row]
+        return card
+
+
+class CompiledCardRatings(MutableMapping):
+    """
+    card_ratings mapping over a CompiledDataset. Each card dict is built on first
+    access and cached per row, so repeated lookups, and lookups of other printings
+    of the card, return the same object, as they do for a JSON-loaded dataset.
+    Cards assigned to new ids (resolved unknown ids) are kept alongside.
+    """
+
+    def __init__(self, table: CompiledDataset):
+        self._table = table
+        self._cards = {}
+        self._assigned = {}
+
+    def __getitem__(self, arena_id):
+        card = self._assigned.get(arena_id)
+        if card is not None:
+            return card
+        row = self._table.rows.get(arena_id)
+        if row is None:
+            raise KeyError(arena_id)
+        card = self._cards.get(row)
+        if card is None:
+            card = self._cards.setdefault(row, self._table.card(row))
+        return card
+
+    def __setitem__(self, arena_id, card):
+        self._assigned[arena_id] = card
+
+    def __delitem__(self, arena_id):
+        del self._assigned[arena_id]
+
+    def __contains__(self, arena_id):
+        return arena_id in self._table.rows or arena_id in self._assigned
+
+    def __iter__(self):
+        yield from self._table.ids
+        for arena_id in list(self._assigned):
+            if arena_id not in self._table.rows:
+                yield arena_id
+
+    def __len__(self):
+        return len(self._table.rows) + sum(
+            1 for arena_id in self._assigned if arena_id not in self._table.rows
+        )
@@ -95,6 +95,7 @@ class Settings(BaseModel):
     update_notifications_enabled: bool = True
     missing_notifications_enabled: bool = True
     auto_sync_datasets: bool = True
+    dataset_cache_mb: int = constants.DATASET_CACHE_BUDGET_MB
 
     # System Paths (Restored)
     arena_log_location: str = ""
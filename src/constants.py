@@ -232,6 +232,64 @@ DRAFT_PICK_STRING_QUICK = "[UnityCrossThreadLogger]==> BotDraft_DraftPick "
 
 DRAFT_START_STRINGS = [DRAFT_START_STRING_PREMIER, DRAFT_START_STRING_QUICK_DRAFT]
 
+LOG_SCAN_MODE_READLINE = "readline"
+LOG_SCAN_MODE_MMAP = "mmap"
+LOG_SCAN_MODE_DEFAULT = LOG_SCAN_MODE_MMAP
+
+LOG_INDEX_FILE_NAME = "log_event_index.json"
+LOG_INDEX_VERSION = 1
+LOG_INDEX_HEAD_BYTES = 64 * 1024
+LOG_INDEX_ANCHOR_BYTES = 4 * 1024
+LOG_INDEX_SAVE_BYTES = 4 * 1024 * 1024
+LOG_INDEX_SAVE_SECONDS = 30
+LOG_INDEX_MAX_ENTRIES = 16
+
+DRAFT_JOURNAL_COMPACT_RECORDS = 64
+DRAFT_JOURNAL_FSYNC_INTERVAL = 1.0
+
+DRAFT_STORE_FILE_NAME = "draft_store.db"
+DRAFT_STORE_SCHEMA_VERSION = 1
+DRAFT_STORE_MAX_WORKERS = 4
+
+# Worker processes kept warm for deck simulations
+SIMULATION_MAX_WORKERS = 4
+# 95% confidence half-width, in percentage points, at which a deck simulation
+# with a tolerance stops early
+SIMULATION_TOLERANCE = 1.5
+
+# Newest dataset schema this client reads. Schema 4 stores one card_ratings
+# record per card and an id_index from arena id to record key; schema 5 also
+# omits default deck_colors stats, listed in stat_defaults
+DATASET_SCHEMA_VERSION = 5
+
+DATASET_CATALOG_FILE_NAME = "dataset_catalog.json"
+DATASET_CATALOG_VERSION = 1
+
+DATASET_COMPILED_FOLDER = "Datasets"
+DATASET_COMPILED_SUFFIX = ".bin"
+DATASET_COMPILED_VERSION = 3
+
+# Persisted SetMetrics, kept next to the compiled datasets. Bump the version when
+# the metrics calculation changes so stored results are recomputed
+SET_METRICS_CACHE_SUFFIX = ".metrics.json"
+SET_METRICS_VERSION = 1
+
+# Memory budget for recently used datasets kept loaded, in MiB
+DATASET_CACHE_BUDGET_MB = 64
+
+# Persisted grpId -> card name resolutions from the Arena card database
+ARENA_ID_CACHE_FILE_NAME = "arena_id_cache.json"
+ARENA_ID_CACHE_VERSION = 1
+
+FILE_WATCH_POLL_INTERVAL = 0.5
+FILE_WATCH_TIMEOUT = 5.0
+UI_UPDATE_EVENT = "<<OrchestratorUpdate>>"
+UI_STATUS_DOT_IDLE_MS = 1000
+# The UI checks the orchestrator thread this often, and polls the log itself at
+# the fallback interval while the thread is not running
+UI_WATCHDOG_MS = 2000
+UI_FALLBACK_POLL_MS = 100
+
 DATA_SOURCES_NONE = {"None": ""}
 
 DECK_FILTER_FORMAT_NAMES = "Names"
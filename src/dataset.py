@@ -10,7 +10,14 @@ from src.utils import (
     sanitize_card_name,
 )
 from src.file_extractor import initialize_card_data
-from typing import List, Dict, Tuple
+from src.compiled_dataset import (
+    CompiledCardRatings,
+    compile_dataset,
+    load_compiled_dataset,
+)
+from typing import List, Dict, Mapping, Tuple
+from src.card_record import CardRecord
+from src.arena_id_resolver import get_arena_id_resolver
 from src.constants import (
     DATA_FIELD_NAME,
     DATA_FIELD_MANA_COST,
@@ -28,83 +35,49 @@ class Dataset:
         self._dataset = None
         self._retrieve_unknown = retrieve_unknown
         self.db_path = db_path
-        self._name_index = {}
         self._id_index = {}
-        self.unknown_id_cache = {}
+        self._table = None
+        self._arena_resolver = None
 
     def clear(self) -> None:
         """Clears the dataset and all memory caches."""
         self._dataset = None
-        self._name_index.clear()
+        self._table = None
         self._id_index.clear()
-        self.unknown_id_cache.clear()
-
-    def _resolve_unknown_id(self, grp_id: str) -> str:
-        """Queries the local MTG Arena database to instantly translate unknown IDs."""
-        if grp_id in self.unknown_id_cache:
-            return self.unknown_id_cache[grp_id]
-
-        import sqlite3
-        import os
-        from src import constants
-
-        try:
-            db_folder = (
-                os.path.join(self.db_path, constants.LOCAL_DOWNLOADS_DATA)
-                if self.db_path
-                else ""
-            )
-
-            if db_folder and os.path.exists(db_folder):
-                db_files = [
-                    f
-                    for f in os.listdir(db_folder)
-                    if f.startswith(constants.LOCAL_DATA_FILE_PREFIX_DATABASE)
-                ]
 
-                if db_files:
-                    db_files.sort(
-                        key=lambda x: os.path.getmtime(os.path.join(db_folder, x)),
-                        reverse=True,
-                    )
-                    db_file = os.path.join(db_folder, db_files[0])
-
-                    conn = sqlite3.connect(db_file)
-                    cursor = conn.cursor()
+    def _resolver(self):
+        if self._arena_resolver is None:
+            self._arena_resolver = get_arena_id_resolver(self.db_path)
+        return self._arena_resolver
 
-                    try:
-                        numeric_id = int(grp_id)
-                    except ValueError:
-                        numeric_id = grp_id
-
-                    cursor.execute(
-                        "SELECT name FROM sqlite_master WHERE type='table' AND name='Localizations_enUS'"
-                    )
-                    if cursor.fetchone():
-                        query = "SELECT loc.Loc FROM Cards c JOIN Localizations_enUS loc ON c.titleid = loc.LocId WHERE c.grpid = ?"
-                    else:
-                        query = "SELECT loc.Loc FROM Cards c JOIN Localizations loc ON c.titleid = loc.LocId WHERE c.grpid = ?"
+    def _resolve_unknown_ids(self, grp_ids: List[str]) -> Dict[str, str]:
+        """Translates unknown ids with the local MTG Arena database in one batch."""
+        return self._resolver().resolve(grp_ids)
 
-                    cursor.execute(query, (numeric_id,))
-                    row = cursor.fetchone()
-                    conn.close()
-
-                    if row and row[0]:
-                        name = row[0]
-                        self.unknown_id_cache[grp_id] = name
-                        return name
-        except Exception as e:
-            from src.logger import create_logger
-
-            create_logger().error(f"SQLite ID Resolution failed: {e}")
-
-        self.unknown_id_cache[grp_id] = grp_id
-        return grp_id
+    def _warm_up_unknown_ids(self) -> None:
+        """Resolves the other printings of this dataset's cards in bulk."""
+        if self._retrieve_unknown and self.db_path and self._id_index:
+            self._resolver().warm_up(self._id_index.keys())
 
     def open_file(self, file_location: str) -> Result:
         if not file_location:
             return Result.ERROR_MISSING_FILE
 
+        # FAST PATH: Read the compiled dataset; card dicts are built on lookup
+        table = load_compiled_dataset(file_location)
+        if table is not None:
+            self._id_index.clear()
+            self._id_index.update(
+                (table.names[row], arena_id)
+                for arena_id, row in table.rows.items()
+                if table.names[row]
+            )
+            self._dataset = dict(table.sections)
+            self._dataset["card_ratings"] = CompiledCardRatings(table)
+            self._table = table
+            self._warm_up_unknown_ids()
+            return Result.VALID
+
         result, json_data = check_file_integrity(file_location)
         if result != Result.VALID:
             return result
@@ -115,7 +88,6 @@ class Dataset:
                 for k, v in json_data["color_ratings"].items()
             }
 
-        self._name_index.clear()
         self._id_index.clear()
 
         if "card_ratings" in json_data:
@@ -128,10 +100,13 @@ class Dataset:
                 card_name = sanitize_card_name(card.get(DATA_FIELD_NAME))
                 if card_name:
                     card[DATA_FIELD_NAME] = card_name
-                    self._name_index[card_name] = card
                     self._id_index[card_name] = k
 
         self._dataset = json_data
+        self._table = None
+        # Compiled once, so the next open of this dataset takes the fast path
+        compile_dataset(file_location, json_data)
+        self._warm_up_unknown_ids()
         return result
 
     def get_data_by_id(self, id_list: List[str]) -> List[Dict]:
@@ -139,16 +114,21 @@ class Dataset:
             return []
         card_data = []
         ratings = self._dataset["card_ratings"] if self._dataset else {}
+        unknown_names = {}
+        if self._retrieve_unknown:
+            unknown = [str(i) for i in id_list if str(i) not in ratings]
+            if unknown:
+                unknown_names = self._resolve_unknown_ids(unknown)
 
         for arena_id in id_list:
             string_id = str(arena_id)
             if string_id in ratings:
                 card_data.append(ratings[string_id])
             elif self._retrieve_unknown:
-                display_name = self._resolve_unknown_id(string_id)
+                display_name = unknown_names[string_id]
 
-                if display_name and display_name in self._name_index:
-                    matched_card = self._name_index[display_name]
+                if display_name and display_name in self._id_index:
+                    matched_card = ratings[self._id_index[display_name]]
                     ratings[string_id] = matched_card
                     card_data.append(matched_card)
                 else:
@@ -172,10 +152,28 @@ class Dataset:
                     card_data.append(empty_dict)
         return card_data
 
+    def get_records_by_id(self, id_list: List[str]) -> List[Mapping]:
+        """
+        Read-only cards for hot loops: CardRecords over the packed stats when the
+        compiled dataset is loaded, otherwise the same dicts as get_data_by_id.
+        """
+        table = self._table
+        if table is None or not isinstance(id_list, list):
+            return self.get_data_by_id(id_list)
+        records = []
+        for arena_id in id_list:
+            row = table.rows.get(str(arena_id))
+            if row is not None:
+                records.append(CardRecord(table, row))
+            else:
+                records.extend(self.get_data_by_id([arena_id]))
+        return records
+
     def get_data_by_name(self, name_list: List[str]) -> List[Dict]:
         if not isinstance(name_list, list) or not self._dataset:
             return []
-        return [self._name_index[n] for n in name_list if n in self._name_index]
+        ratings = self._dataset["card_ratings"]
+        return [ratings[self._id_index[n]] for n in name_list if n in self._id_index]
 
     def get_names_by_id(self, id_list: List[str]) -> List[str]:
         """Restored for test and scanner compatibility."""
@@ -201,8 +199,7 @@ class Dataset:
 
     def get_all_names(self) -> List[str]:
         if self._dataset:
-            ratings = self._dataset.get("card_ratings", {})
-            return list(set([v[DATA_FIELD_NAME] for v in ratings.values()]))
+            return list(self._id_index)
         return []
 
     def get_card_archetypes_by_field(self, card_name: str, field: str) -> List[Tuple]:
@@ -0,0 +1,111 @@
+"""
+src/dataset_cache.py
+
+In-process LRU of loaded datasets. Each entry pairs a Dataset with the SetMetrics
+built from it, so switching between event types or user groups swaps in a
+recently used dataset instead of re-reading it from disk. Entries are dropped
+least recently used first once their estimated size exceeds the memory budget,
+and are only returned while the source file's size and mtime are unchanged.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import src.constants as constants
+from src.compiled_dataset import compiled_dataset_path
+from src.logger import create_logger
+
+logger = create_logger()
+
+# Rough in-memory size of a dataset relative to its file. The JSON path holds the
+# decoded dicts; the compiled path holds its file's bytes and the decoded header.
+# The scanner caches the compiled copy whenever compiling succeeded, so the JSON
+# estimate only applies when it did not
+_JSON_SIZE_FACTOR = 5
+_COMPILED_SIZE_FACTOR = 2
+
+
+def _file_signature(file_location: str) -> Optional[Tuple[int, float]]:
+    try:
+        stat = os.stat(file_location)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime
+
+
+def estimate_dataset_bytes(dataset, file_location: str) -> int:
+    """Approximate memory held by a dataset opened from file_location."""
+    try:
+        if dataset._table is not None:
+            return os.path.getsize(compiled_dataset_path(file_location)) * (
+                _COMPILED_SIZE_FACTOR
+            )
+        return os.path.getsize(file_location) * _JSON_SIZE_FACTOR
+    except OSError:
+        return 0
+
+
+class DatasetCache:
+    """Thread-safe LRU of (Dataset, SetMetrics) pairs keyed by dataset path."""
+
+    def __init__(self, budget_mb: int = constants.DATASET_CACHE_BUDGET_MB):
+        self.budget_bytes = max(0, budget_mb) * 1024 * 1024
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, file_location: str) -> Optional[tuple]:
+        """Returns the cached (dataset, metrics) pair, or None if missing or stale."""
+        signature = _file_signature(file_location)
+        with self._lock:
+            entry = self._entries.get(file_location)
+            if entry is None or entry["signature"] != signature:
+                if entry is not None:
+                    del self._entries[file_location]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(file_location)
+            self.hits += 1
+            return entry["dataset"], entry["metrics"]
+
+    def put(self, file_location: str, dataset, metrics) -> None:
+        """
+        Adds a loaded dataset and evicts the least recently used entries over the
+        budget. The newest entry is always kept, even if it alone exceeds it.
+        """
+        signature = _file_signature(file_location)
+        if signature is None or self.budget_bytes == 0:
+            return
+        size = estimate_dataset_bytes(dataset, file_location)
+        with self._lock:
+            self._entries[file_location] = {
+                "signature": signature,
+                "dataset": dataset,
+                "metrics": metrics,
+                "size": size,
+            }
+            self._entries.move_to_end(file_location)
+            while len(self._entries) > 1 and self.size_bytes() > self.budget_bytes:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.info(f"Evicted dataset from cache: {evicted}")
+
+    def size_bytes(self) -> int:
+        return sum(entry["size"] for entry in self._entries.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, file_location: str) -> bool:
+        """True only while the cached entry is current, matching get."""
+        signature = _file_signature(file_location)
+        with self._lock:
+            entry = self._entries.get(file_location)
+            return entry is not None and entry["signature"] == signature
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
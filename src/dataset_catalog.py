@@ -0,0 +1,121 @@
+"""
+src/dataset_catalog.py
+
+Sidecar catalog of the datasets in the Sets folder. Each entry holds a dataset's
+meta section, card count, content hash, size and mtime, written when the dataset
+is saved, so listing datasets reads one small file instead of parsing every
+multi-MB dataset. Entries are only trusted while the file's size and mtime match.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from typing import Iterable, Optional
+
+import src.constants as constants
+from src.logger import create_logger
+
+logger = create_logger()
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DatasetCatalog:
+    """Reads and writes the catalog file kept alongside the datasets in a folder."""
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self.catalog_file = os.path.join(folder, constants.DATASET_CATALOG_FILE_NAME)
+        self._entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            if os.path.exists(self.catalog_file):
+                with open(self.catalog_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == constants.DATASET_CATALOG_VERSION:
+                    self._entries = data.get("datasets", {})
+        except Exception as e:
+            logger.error(f"Failed to read dataset catalog: {e}")
+
+    def lookup(self, filename: str) -> Optional[dict]:
+        """Returns the entry for filename if the file is unchanged since it was recorded."""
+        with self._lock:
+            entry = self._entries.get(filename)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(os.path.join(self.folder, filename))
+        except OSError:
+            return None
+        if entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime:
+            return None
+        return entry
+
+    def record(self, filename: str, json_data: Optional[dict]):
+        """
+        Records a dataset that was just validated. json_data is None for a file
+        that failed validation, so it is not re-parsed until it changes.
+        """
+        location = os.path.join(self.folder, filename)
+        try:
+            stat = os.stat(location)
+            entry = {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+                "valid": json_data is not None,
+                "meta": {},
+                "card_count": 0,
+                "hash": hash_file(location),
+            }
+        except OSError:
+            return
+        if json_data is not None:
+            entry["meta"] = json_data.get("meta", {})
+            entry["card_count"] = len(json_data.get("card_ratings") or {})
+        with self._lock:
+            self._entries[filename] = entry
+            self._dirty = True
+
+    def prune(self, filenames: Iterable[str]):
+        """Drops entries for datasets that are no longer in the folder."""
+        keep = set(filenames)
+        with self._lock:
+            stale = [name for name in self._entries if name not in keep]
+            for name in stale:
+                del self._entries[name]
+            if stale:
+                self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self._entries)
+            self._dirty = False
+        try:
+            if not os.path.isdir(self.folder):
+                os.makedirs(self.folder)
+            fd, tmp_path = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": constants.DATASET_CATALOG_VERSION,
+                        "datasets": entries,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.catalog_file)
+        except Exception as e:
+            logger.error(f"Failed to write dataset catalog: {e}")
@@ -5,6 +5,8 @@ import requests
 import logging
 from src import constants
 from src.configuration import write_configuration
+from src.utils import Result, catalog_dataset, check_file_integrity
+from src.compiled_dataset import compile_dataset
 
 logger = logging.getLogger(__name__)
 
@@ -53,14 +55,23 @@ class DatasetUpdater:
             if "active_sets" in remote_manifest:
                 local_manifest["active_sets"] = remote_manifest["active_sets"]
 
-            remote_datasets = remote_manifest.get("datasets", {})
+            # "datasets" keeps schema 3 files for older clients; prefer the compact
+            # copies this client can read
+            remote_datasets = dict(remote_manifest.get("datasets", {}))
+            for key, file_info in remote_manifest.get("compact_datasets", {}).items():
+                if file_info.get("schema", 3) <= constants.DATASET_SCHEMA_VERSION:
+                    remote_datasets[key] = file_info
             updates_made = False
 
             for key, file_info in remote_datasets.items():
+                if file_info.get("schema", 3) > constants.DATASET_SCHEMA_VERSION:
+                    logger.info(f"Skipping {key}: dataset schema is newer than this app")
+                    continue
+
                 remote_hash = file_info.get("hash")
                 remote_filename = file_info.get("filename")
 
-                local_filename = remote_filename.replace(".gz", "")
+                local_filename = os.path.basename(remote_filename).replace(".gz", "")
                 local_filepath = os.path.join(constants.SETS_FOLDER, local_filename)
 
                 local_hash = local_manifest.get("datasets", {}).get(key, {}).get("hash")
@@ -81,6 +92,10 @@ class DatasetUpdater:
                     with open(tmp_path, "wb") as f:
                         f.write(json_data)
                     os.replace(tmp_path, local_filepath)
+                    result, dataset_json = check_file_integrity(local_filepath)
+                    if result == Result.VALID:
+                        catalog_dataset(local_filepath, dataset_json)
+                        compile_dataset(local_filepath, dataset_json)
 
                     if "datasets" not in local_manifest:
                         local_manifest["datasets"] = {}
@@ -0,0 +1,267 @@
+"""
+src/deck_analytics.py
+
+Exact mana analytics for an encoded deck. The mulligan, land screw, flood and
+removal stats of simulate_deck only depend on how many lands and removal cards
+are kept and drawn, so they follow from hypergeometric and multivariate
+hypergeometric distributions over four card categories (land or spell, removal
+or not) and are computed exactly instead of sampled.
+
+The slices of a shuffled deck are exchangeable, so the kept hand is drawn first,
+then the four draws, then the hands that were mulliganed away; the earlier hands
+only matter through their land counts. Bottoming after a mulligan removes the
+highest-cmc cards, with ties broken at random, which a DP over the hand's cmc
+groups tracks exactly.
+"""
+
+from functools import lru_cache
+from itertools import product
+from math import comb
+from typing import Dict
+
+import numpy as np
+
+from src.deck_simulation import DRAWS, HAND_SIZE, EncodedDeck
+
+# Card categories: 2 * is_land + is_removal
+_SPELL, _REMOVAL, _LAND, _REMOVAL_LAND = range(4)
+
+ANALYTIC_KEYS = [
+    "mulligans",
+    "screw_t3",
+    "screw_t4",
+    "flood_t5",
+    "removal_t4",
+    "avg_hand_size",
+]
+
+
+def _lands(counts) -> int:
+    return counts[_LAND] + counts[_REMOVAL_LAND]
+
+
+def _removal(counts) -> int:
+    return counts[_REMOVAL] + counts[_REMOVAL_LAND]
+
+
+def _keeps(mulligans: int, lands: int) -> bool:
+    """The London mulligan rule: 2-5 lands keeps 7 cards, 2-4 keeps 6, then 5."""
+    if mulligans == 0:
+        return 2 <= lands <= 5
+    if mulligans == 1:
+        return 2 <= lands <= 4
+    return True
+
+
+@lru_cache(maxsize=None)
+def _hypergeometric(successes: int, population: int, drawn: int, hits: int) -> float:
+    if (
+        hits < 0
+        or hits > drawn
+        or hits > successes
+        or drawn - hits > population - successes
+    ):
+        return 0.0
+    return (
+        comb(successes, hits)
+        * comb(population - successes, drawn - hits)
+        / comb(population, drawn)
+    )
+
+
+@lru_cache(maxsize=None)
+def _earlier_hands_fail(mulligans: int, lands: int, cards: int) -> float:
+    """
+    Probability that the hands mulliganed before the kept one, drawn from cards
+    with lands among them, are each rejected.
+    """
+    if mulligans == 0:
+        return 1.0
+    if mulligans == 1:
+        return sum(
+            _hypergeometric(lands, cards, HAND_SIZE, first)
+            for first in range(HAND_SIZE + 1)
+            if not _keeps(0, first)
+        )
+    total = 0.0
+    for both in range(2 * HAND_SIZE + 1):
+        weight = _hypergeometric(lands, cards, 2 * HAND_SIZE, both)
+        if not weight:
+            continue
+        for first in range(HAND_SIZE + 1):
+            if not _keeps(0, first) and not _keeps(1, both - first):
+                total += weight * _hypergeometric(both, 2 * HAND_SIZE, HAND_SIZE, first)
+    return total
+
+
+@lru_cache(maxsize=None)
+def _choices(group: tuple) -> list:
+    """(cards, ways) for every way to take up to a hand of cards from a cmc group."""
+    choices = []
+    for chosen in product(*(range(min(count, HAND_SIZE) + 1) for count in group)):
+        if sum(chosen) <= HAND_SIZE:
+            ways = 1
+            for count, taken in zip(group, chosen):
+                ways *= comb(count, taken)
+            choices.append((chosen, ways))
+    return choices
+
+
+@lru_cache(maxsize=None)
+def _splits(chosen: tuple, bottoming: int) -> list:
+    """(bottomed, probability) when bottoming random cards out of chosen."""
+    splits = []
+    for split in product(*(range(taken + 1) for taken in chosen)):
+        if sum(split) == bottoming:
+            ways = 1
+            for taken, bottomed in zip(chosen, split):
+                ways *= comb(taken, bottomed)
+            splits.append((split, ways / comb(sum(chosen), bottoming)))
+    return splits
+
+
+def _hands(groups: tuple, total: int, mulligans: int) -> Dict[tuple, float]:
+    """
+    {(hand categories, kept categories): probability} for a random hand that the
+    mulligan rule keeps after the given number of mulligans, with the
+    highest-cmc cards bottomed. groups holds the category counts of each cmc,
+    highest first.
+    """
+    if not mulligans:
+        # Nothing is bottomed, so the cmc groups do not matter
+        groups = (tuple(sum(column) for column in zip(*groups)),)
+
+    states = {((0,) * 4, (0,) * 4): 1.0}
+    for group in groups:
+        choices = _choices(group)
+        next_states = {}
+        for (hand, bottomed), ways in states.items():
+            room = HAND_SIZE - sum(hand)
+            to_bottom = mulligans - sum(bottomed)
+            for chosen, chosen_ways in choices:
+                picked = sum(chosen)
+                if picked > room:
+                    continue
+                new_hand = tuple(h + c for h, c in zip(hand, chosen))
+                weight = ways * chosen_ways
+                if not to_bottom or not picked:
+                    key = (new_hand, bottomed)
+                    next_states[key] = next_states.get(key, 0.0) + weight
+                    continue
+                # The bottomed cards are a random subset of this cmc's cards
+                for split, share in _splits(chosen, min(to_bottom, picked)):
+                    key = (new_hand, tuple(b + s for b, s in zip(bottomed, split)))
+                    next_states[key] = next_states.get(key, 0.0) + weight * share
+        states = next_states
+
+    hands = comb(total, HAND_SIZE)
+    kept = {}
+    for (hand, bottomed), ways in states.items():
+        if sum(hand) != HAND_SIZE or not _keeps(mulligans, _lands(hand)):
+            continue
+        key = (hand, tuple(h - b for h, b in zip(hand, bottomed)))
+        kept[key] = kept.get(key, 0.0) + ways / hands
+    return kept
+
+
+def _draws(rest: tuple) -> tuple:
+    """
+    For the four draws from rest: the P(x4 = j) and P(no removal in the first three
+    and x4 = j) tables, where x4 is the lands in all four draws. _below gives
+    P(x_i < t | x4 = j) for the first i draws.
+    """
+    cards, lands = sum(rest), _lands(rest)
+    by_lands = [_hypergeometric(lands, cards, DRAWS, j) for j in range(DRAWS + 1)]
+
+    no_removal = [0.0] * (DRAWS + 1)
+    for first in range(4):
+        ways = (
+            comb(rest[_LAND], first)
+            * comb(rest[_SPELL], DRAWS - 1 - first)
+            / comb(cards, DRAWS - 1)
+        )
+        if not ways:
+            continue
+        fourth_land = (lands - first) / (cards - DRAWS + 1)
+        no_removal[first] += ways * (1 - fourth_land)
+        no_removal[first + 1] += ways * fourth_land
+    return by_lands, no_removal
+
+
+def _below(prefix: int, limit: int, lands: int) -> float:
+    """P(fewer than limit lands in the first prefix of 4 draws holding lands)."""
+    return sum(
+        _hypergeometric(lands, DRAWS, prefix, hits)
+        for hits in range(min(limit, prefix + 1))
+    )
+
+
+def exact_mana_stats(deck: EncodedDeck) -> Dict[str, float]:
+    """
+    Exact values of simulate_deck's mulligan, screw, flood, removal and hand size
+    stats, plus the rate of keeping 7, 6 and 5 cards, as percentages.
+    """
+    categories = 2 * deck.is_land.astype(np.int64) + deck.is_removal.astype(np.int64)
+    groups = tuple(
+        tuple(
+            int(np.count_nonzero((deck.cmc == cmc) & (categories == c)))
+            for c in range(4)
+        )
+        for cmc in sorted(set(deck.cmc.tolist()), reverse=True)
+    )
+    return dict(_exact_stats(groups))
+
+
+@lru_cache(maxsize=256)
+def _exact_stats(groups: tuple) -> Dict[str, float]:
+    """
+    exact_mana_stats for a deck with the given category counts per cmc. Decks
+    the builder compares often share these counts, so they are cached.
+    """
+    counts = tuple(sum(column) for column in zip(*groups))
+    total = sum(counts)
+    stats = dict.fromkeys(ANALYTIC_KEYS, 0.0)
+    draw_tables = {}
+    for mulligans in range(3):
+        keep_rate = 0.0
+        for (hand, kept), weight in _hands(groups, total, mulligans).items():
+            rest = tuple(n - h for n, h in zip(counts, hand))
+            if hand not in draw_tables:
+                draw_tables[hand] = _draws(rest)
+            by_lands, no_removal = draw_tables[hand]
+            kept_lands = _lands(kept)
+            unseen_lands = _lands(rest)
+            unseen_cards = sum(rest) - DRAWS
+
+            for drawn in range(DRAWS + 1):
+                if not by_lands[drawn]:
+                    continue
+                earlier = _earlier_hands_fail(
+                    mulligans, unseen_lands - drawn, unseen_cards
+                )
+                games = weight * earlier
+                if not games:
+                    continue
+                keep_rate += games * by_lands[drawn]
+                stats["screw_t3"] += (
+                    games * by_lands[drawn] * _below(2, 3 - kept_lands, drawn)
+                )
+                stats["screw_t4"] += (
+                    games * by_lands[drawn] * _below(3, 4 - kept_lands, drawn)
+                )
+                if kept_lands + drawn >= 6:
+                    stats["flood_t5"] += games * by_lands[drawn]
+                if _removal(kept):
+                    stats["removal_t4"] += games * by_lands[drawn]
+                elif _removal(rest):
+                    removal = by_lands[drawn] - no_removal[drawn]
+                    stats["removal_t4"] += games * removal
+
+        stats[f"keep_{HAND_SIZE - mulligans}"] = keep_rate * 100.0
+        stats["avg_hand_size"] += keep_rate * (HAND_SIZE - mulligans)
+        if mulligans:
+            stats["mulligans"] += keep_rate * 100.0
+
+    for key in ("screw_t3", "screw_t4", "flood_t5", "removal_t4"):
+        stats[key] *= 100.0
+    return stats
@@ -0,0 +1,500 @@
+"""
+src/deck_simulation.py
+
+Vectorized Monte Carlo engine behind card_logic.simulate_deck. A deck is encoded
+once as per-card arrays (land and removal flags, the colors each land produces,
+functional cmc and a mana pip pattern) and games are played in batches: each
+game's shuffle is a row of argsort over a random matrix, and mulligans, land
+counts, mana sources and castability are array operations over the whole batch.
+
+A run is cut into fixed blocks of games and block i draws its shuffles from a
+generator seeded with (run seed, i), so a seeded run gives the same counts
+whether its blocks are played in-process or spread over the warm process pool.
+Block counts are integers, so merging them is exact.
+
+Decks compared with common random numbers are aligned slot by slot with
+align_deck_slots and simulated with one seed, so each game deals every deck the
+same shuffle and the differences between them come from their cards rather
+than from their draws.
+
+Every run also reports 95% confidence half-widths. Given a tolerance, a run
+plays rounds of blocks and stops as soon as every rate's half-width is within it.
+"""
+
+import os
+import re
+import math
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import src.constants as constants
+from src.logger import create_logger
+
+logger = create_logger()
+
+COLOR_COLUMNS = {color: column for column, color in enumerate("WUBRG")}
+# Sources column that is always empty, for pip options that are not a color
+_NO_COLOR = len(COLOR_COLUMNS)
+_SOURCE_COLUMNS = _NO_COLOR + 1
+
+MIN_DECK_SIZE = 40
+HAND_SIZE = 7
+# Cards drawn by turn 5, which is the last turn a stat looks at
+DRAWS = 4
+# Games per block. Each block is one array batch with its own seed
+BLOCK_SIZE = 1000
+# Runs shorter than this many blocks are not worth the round trip to the pool
+_MIN_POOL_BLOCKS = 4
+# Blocks played between tolerance checks; fixed so seeded runs stop at the same point
+ROUND_BLOCKS = 2
+# Two-sided 95% normal quantile
+_Z_95 = 1.959963984540054
+
+STAT_KEYS = [
+    "mulligans",
+    "screw_t3",
+    "screw_t4",
+    "flood_t5",
+    "cast_t2",
+    "cast_t3",
+    "cast_t4",
+    "curve_out",
+    "removal_t4",
+    "color_screw_t3",
+    "avg_hand_size",
+]
+# The stats play_games samples. The others depend only on how many lands and
+# removal cards are kept and drawn, and deck_analytics computes them exactly
+SAMPLED_KEYS = ["cast_t2", "cast_t3", "cast_t4", "curve_out", "color_screw_t3"]
+
+
+@dataclass
+class EncodedDeck:
+    """One row per physical card, so a 40-card deck has 40 rows."""
+
+    is_land: np.ndarray
+    is_removal: np.ndarray
+    # [card x color] 1 where a land produces the color
+    sources: np.ndarray
+    cmc: np.ndarray
+    # Index into patterns; a pattern is a tuple of pips, each a tuple of color columns
+    pattern: np.ndarray
+    patterns: List[tuple]
+
+    def __len__(self):
+        return len(self.cmc)
+
+
+def align_deck_slots(base_deck: list, deck: list) -> list:
+    """
+    Expands deck into one entry per card, with the cards it shares with
+    base_deck in the same slots they hold in base_deck and its other cards in
+    the slots of the base cards it dropped, in order.
+    """
+    copies = {}
+    for card in deck:
+        copies.setdefault(card.get("name"), []).extend(
+            [card] * int(card.get("count", 1))
+        )
+    slots = []
+    for card in base_deck:
+        for _ in range(int(card.get("count", 1))):
+            matching = copies.get(card.get("name"))
+            slots.append(matching.pop() if matching else None)
+    extras = [card for cards in copies.values() for card in cards]
+    for index, card in enumerate(slots):
+        if card is None and extras:
+            slots[index] = extras.pop(0)
+    slots.extend(extras)
+    return [dict(card, count=1) for card in slots if card is not None]
+
+
+def new_seed() -> int:
+    """A fresh seed, for runs that must share their shuffles with each other."""
+    return np.random.SeedSequence().entropy
+
+
+def _pip_pattern(card: dict, first_option_only: bool) -> tuple:
+    pips = []
+    for pip in re.findall(r"\{(.*?)\}", card.get("mana_cost", "")):
+        options = [option for option in pip.split("/") if option in "WUBRG"]
+        if not options:
+            continue
+        if first_option_only:
+            options = options[:1]
+        pips.append(tuple(COLOR_COLUMNS.get(option, _NO_COLOR) for option in options))
+    return tuple(pips)
+
+
+def encode_deck(deck_list: list, first_option_only: bool = False) -> EncodedDeck:
+    """
+    Encodes a deck list of card dicts with counts. Hybrid pips can be paid with
+    any of their colors, tried in order; first_option_only treats every pip as
+    its first color.
+    """
+    from src.card_logic import get_functional_cmc
+
+    is_land, is_removal, sources, cmc, pattern = [], [], [], [], []
+    patterns = {}
+    for card in deck_list:
+        land = "Land" in card.get("types", [])
+        produced = np.zeros(_SOURCE_COLUMNS, dtype=np.int64)
+        card_pattern = ()
+        if land:
+            colors = set(card.get("colors", []))
+            text = str(card.get("text", "")).lower()
+            if "any color" in text or "fixing_ramp" in card.get("tags", []):
+                colors.update(COLOR_COLUMNS)
+            for color in colors:
+                if color in COLOR_COLUMNS:
+                    produced[COLOR_COLUMNS[color]] = 1
+        else:
+            card_pattern = _pip_pattern(card, first_option_only)
+        pattern_index = patterns.setdefault(card_pattern, len(patterns))
+
+        for _ in range(int(card.get("count", 1))):
+            is_land.append(land)
+            is_removal.append("removal" in card.get("tags", []))
+            sources.append(produced)
+            cmc.append(get_functional_cmc(card))
+            pattern.append(pattern_index)
+
+    return EncodedDeck(
+        is_land=np.array(is_land, dtype=bool),
+        is_removal=np.array(is_removal, dtype=bool),
+        sources=np.array(sources, dtype=np.int64).reshape(-1, _SOURCE_COLUMNS),
+        cmc=np.array(cmc, dtype=np.int64),
+        pattern=np.array(pattern, dtype=np.int64),
+        patterns=list(patterns),
+    )
+
+
+def _payable(patterns: List[tuple], sources: np.ndarray) -> np.ndarray:
+    """
+    [pattern x game] whether the pattern's pips can be paid from each game's
+    sources, paying every pip with the first of its colors that has a source left.
+    """
+    payable = np.ones((len(patterns), len(sources)), dtype=bool)
+    for index, pips in enumerate(patterns):
+        remaining = sources.copy()
+        for options in pips:
+            paid = np.zeros(len(sources), dtype=bool)
+            for column in options:
+                use = ~paid & (remaining[:, column] > 0)
+                remaining[:, column] -= use
+                paid |= use
+            payable[index] &= paid
+    return payable
+
+
+def play_games(deck: EncodedDeck, keys: np.ndarray) -> Dict[str, int]:
+    """
+    Plays one game per row of keys, a [game x card] matrix whose row argsort is
+    that game's shuffle. Returns the number of games each of SAMPLED_KEYS
+    occurred in.
+    """
+    games = len(keys)
+    rows = np.arange(games)[:, None]
+    # The sampled stats look at turn 4 at the latest, which has seen three draws
+    drawn = DRAWS - 1
+    order = np.argsort(keys, axis=1)[:, : HAND_SIZE * 3 + drawn]
+
+    # London mulligan: a second hand if the first has 2-5 lands, a third if the
+    # second has 2-4
+    first = deck.is_land[order[:, :HAND_SIZE]].sum(axis=1)
+    second = deck.is_land[order[:, HAND_SIZE : HAND_SIZE * 2]].sum(axis=1)
+    mulligans = np.where(
+        (first < 2) | (first > 5), np.where((second < 2) | (second > 4), 2, 1), 0
+    )
+    kept_size = HAND_SIZE - mulligans
+    start = (HAND_SIZE * mulligans)[:, None]
+
+    hand = order[rows, start + np.arange(HAND_SIZE)]
+    # After a mulligan the highest cmc cards go to the bottom; the stable sort
+    # keeps the shuffled order between equal costs
+    ranked = np.argsort(deck.cmc[hand], axis=1, kind="stable")
+    hand = np.where(mulligans[:, None] > 0, np.take_along_axis(hand, ranked, 1), hand)
+    kept = np.arange(HAND_SIZE) < kept_size[:, None]
+    draws = order[rows, start + HAND_SIZE + np.arange(drawn)]
+
+    cards = np.concatenate([hand, draws], axis=1)
+    card_land = deck.is_land[cards]
+    card_cmc = deck.cmc[cards]
+    card_pattern = deck.pattern[cards]
+    card_sources = deck.sources[cards]
+
+    # Turn t sees the kept hand and t - 1 draws
+    seen = {
+        turn: np.concatenate(
+            [kept, np.broadcast_to(np.arange(drawn) < turn - 1, (games, drawn))],
+            axis=1,
+        )
+        for turn in (2, 3, 4)
+    }
+    lands = {turn: (card_land & seen[turn]).sum(axis=1) for turn in seen}
+
+    # [game x card] whether each card's pips can be paid from that turn's lands
+    payable, cast = {}, {}
+    for turn in (2, 3, 4):
+        sources = (card_sources * seen[turn][..., None]).sum(axis=1)
+        payable[turn] = _payable(deck.patterns, sources)[card_pattern, rows]
+        spells = ~card_land & (card_cmc == turn) & seen[turn]
+        cast[turn] = (lands[turn] >= turn) & (spells & payable[turn]).any(axis=1)
+
+    early_spells = ~card_land & (card_cmc <= 3) & seen[3]
+    color_screw = (lands[3] >= 3) & (early_spells & ~payable[3]).any(axis=1)
+
+    outcomes = {
+        "cast_t2": cast[2],
+        "cast_t3": cast[3],
+        "cast_t4": cast[4],
+        "curve_out": cast[2] & cast[3] & cast[4],
+        "color_screw_t3": color_screw,
+    }
+    return {key: int(np.count_nonzero(value)) for key, value in outcomes.items()}
+
+
+def intervals(counts: Dict[str, int], iterations: int) -> Dict[str, float]:
+    """
+    95% confidence half-widths of the sampled rates, in percentage points: Wilson
+    score intervals, which stay above zero for rates of 0% or 100%.
+    """
+    z2 = _Z_95 * _Z_95
+    half_widths = {}
+    for key in SAMPLED_KEYS:
+        rate = counts[key] / iterations
+        spread = rate * (1 - rate) / iterations + z2 / (4 * iterations * iterations)
+        half_widths[key] = _Z_95 * math.sqrt(spread) / (1 + z2 / iterations) * 100.0
+    return half_widths
+
+
+def within_tolerance(half_widths: Dict[str, float], tolerance: float) -> bool:
+    return all(width <= tolerance for width in half_widths.values())
+
+
+def summarize(
+    counts: Dict[str, int], iterations: int, exact: Dict[str, float]
+) -> Dict[str, float]:
+    """
+    Turns game counts into simulate_deck's percentages, merged with the exact
+    stats, plus the games played and each sampled stat's 95% half-width under
+    intervals.
+    """
+    stats = {key: (counts[key] / iterations) * 100.0 for key in SAMPLED_KEYS}
+    stats.update(exact)
+    stats["iterations"] = iterations
+    stats["intervals"] = intervals(counts, iterations)
+    return stats
+
+
+def split_blocks(iterations: int) -> List[Tuple[int, int]]:
+    """(block index, games) for every block of a run."""
+    return [
+        (index, min(BLOCK_SIZE, iterations - start))
+        for index, start in enumerate(range(0, iterations, BLOCK_SIZE))
+    ]
+
+
+def _merge_counts(totals: Dict[str, int], counts: Dict[str, int]):
+    for key, value in counts.items():
+        totals[key] += value
+
+
+def play_blocks(
+    deck: EncodedDeck, entropy: int, blocks: List[Tuple[int, int]]
+) -> Dict[str, int]:
+    """Plays the given blocks of a run seeded with entropy and sums their counts."""
+    counts = dict.fromkeys(SAMPLED_KEYS, 0)
+    for index, games in blocks:
+        seed = np.random.SeedSequence(entropy, spawn_key=(index,))
+        keys = np.random.default_rng(seed).random((games, len(deck)))
+        _merge_counts(counts, play_games(deck, keys))
+    return counts
+
+
+class SimulationExecutor:
+    """
+    Spreads a run's blocks over a process pool that is started on first use and
+    kept warm until shutdown. Falls back to playing in-process when the pool is
+    unavailable.
+    """
+
+    def __init__(self, max_workers: int = None):
+        if max_workers is None:
+            # Leave a core for the UI and the scanner threads
+            max_workers = min(
+                constants.SIMULATION_MAX_WORKERS, (os.cpu_count() or 1) - 1
+            )
+        self.max_workers = max(1, max_workers)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._executor is None and self.max_workers > 1:
+                # spawn: forking a process that runs Tk and scanner threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _discard_pool(self, executor: ProcessPoolExecutor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def warm_up(self):
+        """Starts the worker processes ahead of the first simulation."""
+        try:
+            executor = self._pool()
+            if executor is not None:
+                for _ in range(self.max_workers):
+                    executor.submit(len, SAMPLED_KEYS)
+        except Exception as e:
+            logger.info(f"Simulation pool unavailable: {e}")
+
+    def count(self, deck: EncodedDeck, iterations: int, entropy: int) -> Dict[str, int]:
+        """Game counts for a run of iterations games seeded with entropy."""
+        return self.count_blocks(deck, split_blocks(iterations), entropy)
+
+    def count_blocks(
+        self, deck: EncodedDeck, blocks: List[Tuple[int, int]], entropy: int
+    ) -> Dict[str, int]:
+        """Game counts for some blocks of a run seeded with entropy."""
+        if len(blocks) < _MIN_POOL_BLOCKS or self.max_workers < 2:
+            return play_blocks(deck, entropy, blocks)
+
+        shard_count = min(self.max_workers, len(blocks))
+        shards = [blocks[shard::shard_count] for shard in range(shard_count)]
+        counts = dict.fromkeys(SAMPLED_KEYS, 0)
+        remaining = list(shards)
+        executor = None
+        try:
+            executor = self._pool()
+            futures = [
+                executor.submit(play_blocks, deck, entropy, shard) for shard in shards
+            ]
+            for shard, future in zip(shards, futures):
+                _merge_counts(counts, future.result())
+                remaining.remove(shard)
+        except Exception as e:
+            logger.info(f"Simulation pool unavailable, simulating in-process: {e}")
+            if executor is not None:
+                self._discard_pool(executor)
+
+        for shard in remaining:
+            _merge_counts(counts, play_blocks(deck, entropy, shard))
+        return counts
+
+    def iter_block_counts(
+        self, deck: EncodedDeck, blocks: List[Tuple[int, int]], entropy: int
+    ):
+        """
+        Yields the game counts of each block of a run seeded with entropy, in block
+        order. Every block is queued on the pool up front, so a caller that stops
+        early only abandons the blocks it has not consumed yet.
+        """
+        if len(blocks) < _MIN_POOL_BLOCKS or self.max_workers < 2:
+            for block in blocks:
+                yield play_blocks(deck, entropy, [block])
+            return
+
+        remaining = list(blocks)
+        executor = None
+        futures = []
+        try:
+            executor = self._pool()
+            futures = [
+                executor.submit(play_blocks, deck, entropy, [block]) for block in blocks
+            ]
+            for future in futures:
+                counts = future.result()
+                remaining.pop(0)
+                yield counts
+        except Exception as e:
+            logger.info(f"Simulation pool unavailable, simulating in-process: {e}")
+            if executor is not None:
+                self._discard_pool(executor)
+        finally:
+            for future in futures:
+                future.cancel()
+
+        for block in remaining:
+            yield play_blocks(deck, entropy, [block])
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_simulation_executor() -> SimulationExecutor:
+    """Returns the app's shared simulation executor"""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = SimulationExecutor()
+    return _EXECUTOR
+
+
+def shutdown_simulation_executor():
+    with _EXECUTOR_LOCK:
+        executor = _EXECUTOR
+    if executor is not None:
+        executor.shutdown()
+
+
+def run_simulation(
+    deck_list: list,
+    iterations: int = 10000,
+    seed: int = None,
+    first_option_only: bool = False,
+    tolerance: float = None,
+) -> Optional[Dict[str, float]]:
+    """
+    Simulates a deck list, or returns None below 40 cards. The same seed gives
+    the same stats; without one every run is different. The mulligan, screw,
+    flood and removal stats are computed exactly by deck_analytics, so only the
+    cast, curve and color screw stats are sampled.
+
+    Without a tolerance all iterations are played. With one, iterations is the
+    budget: games are played in rounds until every sampled rate's 95% half-width
+    is within tolerance percentage points.
+    """
+    from src.deck_analytics import exact_mana_stats
+
+    deck = encode_deck(deck_list, first_option_only)
+    if len(deck) < MIN_DECK_SIZE:
+        return None
+    exact = exact_mana_stats(deck)
+    entropy = np.random.SeedSequence(seed).entropy
+    executor = get_simulation_executor()
+    blocks = split_blocks(iterations)
+    if tolerance is None:
+        counts = executor.count_blocks(deck, blocks, entropy)
+        return summarize(counts, iterations, exact)
+
+    counts = dict.fromkeys(SAMPLED_KEYS, 0)
+    played = 0
+    block_counts = executor.iter_block_counts(deck, blocks, entropy)
+    for number, ((_, games), block) in enumerate(zip(blocks, block_counts), 1):
+        _merge_counts(counts, block)
+        played += games
+        if number % ROUND_BLOCKS == 0 and within_tolerance(
+            intervals(counts, played), tolerance
+        ):
+            break
+    block_counts.close()
+    return summarize(counts, played, exact)
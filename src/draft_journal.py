@@ -0,0 +1,214 @@
+"""
+src/draft_journal.py
+
+Crash-recovery persistence for the ArenaScanner draft state. A full snapshot is
+written only on compaction; every other save appends one compact record holding
+just the fields that changed (appended picks, replaced pack slots, scalars).
+Loading replays the journal tail on top of the snapshot. A save that names the
+list fields it touched only diffs those, so a pick costs the same at the end of
+a draft as at the start.
+"""
+
+import os
+import json
+import time
+import copy
+import tempfile
+
+import src.constants as constants
+from src.logger import create_logger
+
+logger = create_logger()
+
+# Fields that only ever grow during a draft; saved as appended items
+APPEND_FIELDS = ("taken_cards", "draft_history")
+# Per-seat lists of card lists; saved as replaced slots
+SLOT_FIELDS = ("picked_cards", "initial_pack", "pack_cards")
+LIST_FIELDS = APPEND_FIELDS + SLOT_FIELDS
+
+
+class DraftJournal:
+    """Snapshot + append-only journal for a single draft state file."""
+
+    def __init__(self, state_file: str):
+        self.state_file = state_file
+        self.journal_file = os.path.splitext(state_file)[0] + ".journal"
+        self._shadow = None  # What is on disk, field by field
+        self._seq = 0
+        self._records = 0
+        self._handle = None
+        self._last_fsync = 0.0
+
+    def load(self):
+        """Returns the persisted state (snapshot + journal tail), or None."""
+        self.close()
+        self._shadow = None
+        try:
+            if not os.path.exists(self.state_file):
+                return None
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load draft state: {e}")
+            return None
+
+        self._seq = state.pop("journal_seq", 0)
+        self._records = 0
+        try:
+            if os.path.exists(self.journal_file):
+                with open(self.journal_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            # Torn final record from a crash mid-append
+                            break
+                        if record.get("seq", 0) <= self._seq:
+                            continue
+                        _apply_record(state, record)
+                        self._seq = record["seq"]
+                        self._records += 1
+        except Exception as e:
+            logger.error(f"Failed to replay draft journal: {e}")
+
+        self._shadow = copy.deepcopy(state)
+        return state
+
+    def save(self, state: dict, changed=None):
+        """
+        Persists state, appending only the fields that changed since the last save.
+        changed names the list fields the caller touched; the others are not
+        compared, and a named append field is trusted to have only grown.
+        """
+        try:
+            if (
+                self._shadow is None
+                or self._records >= constants.DRAFT_JOURNAL_COMPACT_RECORDS
+            ):
+                self.compact(state)
+                return
+
+            record = _diff_state(self._shadow, state, changed)
+            if not record:
+                return
+            self._seq += 1
+            record["seq"] = self._seq
+            self._append(record)
+            self._records += 1
+        except Exception as e:
+            logger.error(f"Failed to save draft state: {e}")
+
+    def compact(self, state: dict):
+        """Writes a full snapshot and truncates the journal."""
+        self.close()
+        snapshot = dict(state, journal_seq=self._seq)
+        dir_name = os.path.dirname(self.state_file) or "."
+        if not os.path.exists(dir_name):
+            os.makedirs(dir_name)
+
+        fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.state_file)
+
+        # Records up to journal_seq are in the snapshot, so a crash before the
+        # truncate only leaves lines that load() skips
+        with open(self.journal_file, "w", encoding="utf-8"):
+            pass
+        self._records = 0
+        self._shadow = copy.deepcopy(state)
+
+    def reset(self):
+        """Deletes the snapshot and journal (full scanner reset)."""
+        self.close()
+        for path in (self.state_file, self.journal_file):
+            if os.path.exists(path):
+                try:
+                    os.remove(path)
+                except Exception:
+                    pass
+        self._shadow = None
+        self._seq = 0
+        self._records = 0
+
+    def close(self):
+        if self._handle:
+            try:
+                self._handle.flush()
+                os.fsync(self._handle.fileno())
+                self._handle.close()
+            except Exception:
+                pass
+            self._handle = None
+
+    def _append(self, record: dict):
+        if self._handle is None:
+            self._handle = open(self.journal_file, "a", encoding="utf-8")
+        self._handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+        # flush() hands the record to the OS, which survives an application crash;
+        # fsync (power loss) is batched
+        self._handle.flush()
+        now = time.monotonic()
+        if now - self._last_fsync >= constants.DRAFT_JOURNAL_FSYNC_INTERVAL:
+            os.fsync(self._handle.fileno())
+            self._last_fsync = now
+
+        for field, value in record.get("set", {}).items():
+            self._shadow[field] = copy.deepcopy(value)
+        for field, items in record.get("append", {}).items():
+            self._shadow[field].extend(copy.deepcopy(items))
+        for field, slots in record.get("slots", {}).items():
+            for index, value in slots.items():
+                self._shadow[field][int(index)] = list(value)
+
+
+def _diff_state(shadow: dict, state: dict, changed=None) -> dict:
+    """Builds the smallest record that turns shadow into state."""
+    record = {}
+    for field, value in state.items():
+        if changed is not None and field in LIST_FIELDS and field not in changed:
+            continue
+        previous = shadow.get(field)
+        if (
+            changed is not None
+            and field in APPEND_FIELDS
+            and isinstance(previous, list)
+            and len(value) >= len(previous)
+        ):
+            # Only the new tail is read, not the whole list
+            if len(value) > len(previous):
+                record.setdefault("append", {})[field] = value[len(previous) :]
+            continue
+        if value == previous:
+            continue
+
+        if (
+            field in APPEND_FIELDS
+            and isinstance(previous, list)
+            and len(value) > len(previous)
+            and value[: len(previous)] == previous
+        ):
+            record.setdefault("append", {})[field] = value[len(previous) :]
+        elif (
+            field in SLOT_FIELDS
+            and isinstance(previous, list)
+            and len(value) == len(previous)
+        ):
+            record.setdefault("slots", {})[field] = {
+                str(i): slot for i, slot in enumerate(value) if slot != previous[i]
+            }
+        else:
+            record.setdefault("set", {})[field] = value
+    return record
+
+
+def _apply_record(state: dict, record: dict):
+    for field, value in record.get("set", {}).items():
+        state[field] = value
+    for field, items in record.get("append", {}).items():
+        state.setdefault(field, []).extend(items)
+    for field, slots in record.get("slots", {}).items():
+        for index, value in slots.items():
+            state[field][int(index)] = value
@@ -0,0 +1,118 @@
+"""
+src/draft_snapshot.py
+
+Immutable view of the scanner's draft state. The ArenaScanner publishes a new
+DraftSnapshot (a single reference swap) after every parse pass, so the UI, the
+advisor and the overlay read a consistent draft without taking scanner.lock.
+Card ids are resolved against the dataset only when a reader asks for them,
+outside the lock.
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from src import constants
+
+PICK_TWO_DRAFT_TYPES = (
+    constants.LIMITED_TYPE_DRAFT_PICK_TWO,
+    constants.LIMITED_TYPE_DRAFT_PICK_TWO_TRAD,
+    constants.LIMITED_TYPE_DRAFT_PICK_TWO_QUICK,
+)
+
+
+@dataclass(frozen=True)
+class DraftSnapshot:
+    version: int = 0
+    draft_type: int = constants.LIMITED_TYPE_UNKNOWN
+    event_set: str = ""
+    event_label: str = ""
+    event_string: str = ""
+    draft_id: str = ""
+    start_time: str = ""
+    current_pack: int = 0
+    current_pick: int = 0
+    taken_ids: Tuple[str, ...] = ()
+    pack_slots: Tuple[Tuple[str, ...], ...] = ()
+    initial_slots: Tuple[Tuple[str, ...], ...] = ()
+    picked_slots: Tuple[Tuple[str, ...], ...] = ()
+    # History entries are shared with the scanner; they are never mutated after
+    # they are recorded
+    history: Tuple[dict, ...] = ()
+
+    @classmethod
+    def from_scanner(cls, scanner, version: int = 0) -> "DraftSnapshot":
+        """Copies the scanner's draft fields; the caller must hold scanner.lock."""
+        return cls(
+            version=version,
+            draft_type=scanner.draft_type,
+            event_set=scanner.draft_sets[0] if scanner.draft_sets else "",
+            event_label=scanner.draft_label,
+            event_string=scanner.event_string,
+            draft_id=scanner.current_draft_id,
+            start_time=scanner.draft_start_time,
+            current_pack=scanner.current_pack,
+            current_pick=scanner.current_pick,
+            taken_ids=tuple(scanner.taken_cards),
+            pack_slots=tuple(tuple(slot) for slot in scanner.pack_cards),
+            initial_slots=tuple(tuple(slot) for slot in scanner.initial_pack),
+            picked_slots=tuple(tuple(slot) for slot in scanner.picked_cards),
+            history=tuple(scanner.draft_history),
+        )
+
+    @property
+    def pack_index(self) -> int:
+        expected_players = 4 if self.draft_type in PICK_TWO_DRAFT_TYPES else 8
+        return (self.current_pick - 1) % expected_players
+
+    def taken_cards(self, set_data) -> List[dict]:
+        return set_data.get_data_by_id(list(self.taken_ids))
+
+    def picked_cards(self, set_data) -> List[dict]:
+        if self.current_pick == 0:
+            return []
+        if self.pack_index < len(self.picked_slots):
+            return set_data.get_data_by_id(list(self.picked_slots[self.pack_index]))
+        return []
+
+    def missing_cards(self, set_data) -> List[dict]:
+        index = self.pack_index
+        if index < len(self.pack_slots) and index < len(self.initial_slots):
+            remaining = self.pack_slots[index]
+            card_list = [x for x in self.initial_slots[index] if x not in remaining]
+            return set_data.get_data_by_id(card_list)
+        return []
+
+    def pack_cards(self, set_data) -> List[dict]:
+        """Cards in the current pack, each copied with its wheel prediction."""
+        if self.current_pick == 0:
+            return []
+        index = self.pack_index
+        if index >= len(self.pack_slots):
+            return []
+
+        raw_cards = set_data.get_data_by_id(list(self.pack_slots[index]))
+
+        # WHEEL PREDICTION: Cross-reference initial_pack slots to see which cards might come back.
+        rotation_size = 4 if self.draft_type in PICK_TWO_DRAFT_TYPES else 8
+        returnable_picks_by_name = {}
+        for i, slot_ids in enumerate(self.initial_slots):
+            if i == index or not slot_ids:
+                continue
+            # A pack from slot i wheels back at pick (i+1) + rotation_size
+            return_pick = (i + 1) + rotation_size
+            if return_pick > self.current_pick:
+                picked_from_slot = set(
+                    self.picked_slots[i] if i < len(self.picked_slots) else ()
+                )
+                remaining_ids = [cid for cid in slot_ids if cid not in picked_from_slot]
+                for name in set_data.get_names_by_id(remaining_ids):
+                    returnable_picks_by_name.setdefault(name, []).append(return_pick)
+
+        # Copies of the card dicts so the UI can mutate them (e.g. for display names)
+        pack_cards = []
+        for card in raw_cards:
+            card_copy = dict(card)
+            name = card.get(constants.DATA_FIELD_NAME, "")
+            card_copy["returnable_at"] = sorted(returnable_picks_by_name.get(name, []))
+            pack_cards.append(card_copy)
+        return pack_cards
@@ -0,0 +1,345 @@
+"""
+src/draft_store.py
+
+Local SQLite catalog of past drafts. DraftLogIndexer parses every DraftLog_*.log
+in a process pool and stores each draft's event, set, packs, picks and final pool,
+so history selection and cross-draft queries are lookups instead of log re-parses.
+Rows are keyed by log path and invalidated when the file's size or mtime changes.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import tempfile
+import threading
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional
+
+import src.constants as constants
+from src.log_scanner import ArenaScanner
+from src.utils import parse_log_time
+from src.logger import create_logger
+
+logger = create_logger()
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS drafts (
+        path TEXT PRIMARY KEY,
+        file_size INTEGER NOT NULL,
+        file_mtime REAL NOT NULL,
+        draft_id TEXT,
+        event_string TEXT,
+        set_code TEXT,
+        event_type TEXT,
+        draft_type INTEGER,
+        start_time TEXT,
+        draft_date REAL,
+        picks INTEGER,
+        state TEXT,
+        indexed_at REAL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_drafts_set ON drafts (set_code)",
+    "CREATE INDEX IF NOT EXISTS idx_drafts_date ON drafts (draft_date)",
+    "CREATE INDEX IF NOT EXISTS idx_drafts_event ON drafts (event_type)",
+)
+_COLUMNS = (
+    "path",
+    "file_size",
+    "file_mtime",
+    "draft_id",
+    "event_string",
+    "set_code",
+    "event_type",
+    "draft_type",
+    "start_time",
+    "draft_date",
+    "picks",
+    "state",
+    "indexed_at",
+)
+
+
+def draft_record(log_path: str, state: Optional[dict]) -> dict:
+    """Builds a drafts row for log_path; state is None for logs without a draft."""
+    stat = os.stat(log_path)
+    record = {
+        "path": os.path.abspath(log_path),
+        "file_size": stat.st_size,
+        "file_mtime": stat.st_mtime,
+        "indexed_at": time.time(),
+    }
+    if state:
+        start_time = state.get("draft_start_time") or ""
+        record.update(
+            {
+                "draft_id": state.get("current_draft_id", ""),
+                "event_string": state.get("event_string", ""),
+                "set_code": (state.get("draft_sets") or [""])[0],
+                "event_type": state.get("draft_label", ""),
+                "draft_type": state.get("draft_type", 0),
+                "start_time": start_time,
+                "draft_date": parse_log_time(start_time) or stat.st_mtime,
+                "picks": len(state.get("taken_cards") or []),
+                "state": state,
+            }
+        )
+    return record
+
+
+def parse_draft_log(log_path: str, set_list, sets_location: str) -> dict:
+    """
+    Runs a full scanner pass over one draft log. The scanner keeps its journal and
+    log index in a private folder from the start, so a worker never reads or
+    rewrites the live draft state.
+    """
+    with tempfile.TemporaryDirectory(prefix="draft_index_") as work_dir:
+        scanner = ArenaScanner(
+            log_path,
+            set_list,
+            sets_location=sets_location,
+            retrieve_unknown=False,
+            state_folder=work_dir,
+        )
+        scanner.log_enable(False)
+
+        scanner.draft_start_search()
+        scanner.draft_data_search()
+        scanner.journal.close()
+
+        state = scanner.export_state()
+    if not state["event_string"] and not state["taken_cards"]:
+        state = None
+    return draft_record(log_path, state)
+
+
+class DraftStore:
+    """SQLite table of parsed drafts, one row per draft log."""
+
+    def __init__(self, db_file: str):
+        self.db_file = db_file
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.db_file, timeout=10)
+        connection.row_factory = sqlite3.Row
+        try:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    self._create_schema(connection)
+                    self._schema_ready = True
+            yield connection
+            connection.commit()
+        finally:
+            connection.close()
+
+    def _create_schema(self, connection):
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != constants.DRAFT_STORE_SCHEMA_VERSION:
+            connection.execute("DROP TABLE IF EXISTS drafts")
+        connection.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        connection.execute(
+            f"PRAGMA user_version = {constants.DRAFT_STORE_SCHEMA_VERSION}"
+        )
+
+    def _exists(self) -> bool:
+        return self._schema_ready or os.path.exists(self.db_file)
+
+    def upsert(self, records: List[dict]):
+        """Inserts or replaces the rows for the given draft records."""
+        rows = []
+        for record in records:
+            row = dict.fromkeys(_COLUMNS)
+            row.update(record)
+            if row["state"] is not None:
+                row["state"] = json.dumps(row["state"], separators=(",", ":"))
+            rows.append(tuple(row[c] for c in _COLUMNS))
+        if not rows:
+            return
+        try:
+            dir_name = os.path.dirname(self.db_file)
+            if dir_name and not os.path.exists(dir_name):
+                os.makedirs(dir_name)
+            with self._connect() as connection:
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO drafts ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    rows,
+                )
+        except Exception as e:
+            logger.error(f"Failed to write draft store: {e}")
+
+    def get(self, log_path: str) -> Optional[dict]:
+        """Returns the stored draft for log_path if the file is unchanged since indexing."""
+        if not self._exists():
+            return None
+        try:
+            stat = os.stat(log_path)
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT * FROM drafts WHERE path = ? AND file_size = ? "
+                    "AND file_mtime = ? AND state IS NOT NULL",
+                    (os.path.abspath(log_path), stat.st_size, stat.st_mtime),
+                ).fetchone()
+        except Exception as e:
+            logger.error(f"Failed to read draft store: {e}")
+            return None
+        return _decode_row(row) if row else None
+
+    def query(
+        self,
+        set_code: str = None,
+        event_type: str = None,
+        since: float = None,
+        until: float = None,
+    ) -> List[dict]:
+        """Returns the stored drafts matching every given filter, newest first."""
+        if not self._exists():
+            return []
+        clauses, params = ["state IS NOT NULL"], []
+        for clause, value in (
+            ("set_code = ?", set_code),
+            ("event_type = ?", event_type),
+            ("draft_date >= ?", since),
+            ("draft_date < ?", until),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        try:
+            with self._connect() as connection:
+                rows = connection.execute(
+                    f"SELECT * FROM drafts WHERE {' AND '.join(clauses)} "
+                    "ORDER BY draft_date DESC",
+                    params,
+                ).fetchall()
+        except Exception as e:
+            logger.error(f"Failed to query draft store: {e}")
+            return []
+        return [_decode_row(row) for row in rows]
+
+    def signatures(self) -> Dict[str, tuple]:
+        """Returns {path: (file_size, file_mtime)} for every indexed log."""
+        if not self._exists():
+            return {}
+        try:
+            with self._connect() as connection:
+                return {
+                    row["path"]: (row["file_size"], row["file_mtime"])
+                    for row in connection.execute(
+                        "SELECT path, file_size, file_mtime FROM drafts"
+                    )
+                }
+        except Exception as e:
+            logger.error(f"Failed to read draft store: {e}")
+            return {}
+
+    def remove(self, paths: List[str]):
+        if not paths:
+            return
+        try:
+            with self._connect() as connection:
+                connection.executemany(
+                    "DELETE FROM drafts WHERE path = ?", [(p,) for p in paths]
+                )
+        except Exception as e:
+            logger.error(f"Failed to prune draft store: {e}")
+
+
+def _decode_row(row) -> dict:
+    record = dict(row)
+    if record["state"] is not None:
+        record["state"] = json.loads(record["state"])
+    return record
+
+
+class DraftLogIndexer:
+    """Brings a DraftStore up to date with the draft logs in a folder."""
+
+    def __init__(
+        self,
+        store: DraftStore,
+        set_list,
+        sets_location: str = constants.SETS_FOLDER,
+        max_workers: int = constants.DRAFT_STORE_MAX_WORKERS,
+    ):
+        self.store = store
+        self.set_list = set_list
+        self.sets_location = sets_location
+        self.max_workers = max_workers
+
+    def pending(self, folder: str) -> List[str]:
+        """Draft logs that are new or changed since they were indexed."""
+        if not os.path.isdir(folder):
+            return []
+        indexed = self.store.signatures()
+        logs = {}
+        for name in os.listdir(folder):
+            if name.startswith(constants.DRAFT_LOG_PREFIX) and name.endswith(".log"):
+                path = os.path.abspath(os.path.join(folder, name))
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                logs[path] = (stat.st_size, stat.st_mtime)
+
+        self.store.remove(
+            [
+                p
+                for p in indexed
+                if os.path.dirname(p) == os.path.abspath(folder) and p not in logs
+            ]
+        )
+        return [p for p, signature in logs.items() if indexed.get(p) != signature]
+
+    def index_folder(self, folder: str = constants.DRAFT_LOG_FOLDER) -> int:
+        """Parses every new or changed draft log; returns how many were indexed."""
+        paths = self.pending(folder)
+        if not paths:
+            return 0
+
+        logger.info(f"Indexing {len(paths)} draft logs")
+        remaining = set(paths)
+        if len(paths) > 1 and self.max_workers > 1:
+            try:
+                # spawn: forking a process that runs Tk and scanner threads is unsafe
+                with ProcessPoolExecutor(
+                    max_workers=min(self.max_workers, len(paths)),
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as executor:
+                    futures = {
+                        executor.submit(
+                            parse_draft_log, path, self.set_list, self.sets_location
+                        ): path
+                        for path in paths
+                    }
+                    for future in as_completed(futures):
+                        path = futures[future]
+                        try:
+                            record = future.result()
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            logger.error(f"Failed to index {path}: {e}")
+                            record = None
+                        remaining.discard(path)
+                        if record:
+                            self.store.upsert([record])
+            except Exception as e:
+                logger.info(f"Process pool unavailable, indexing in-process: {e}")
+
+        for path in sorted(remaining):
+            try:
+                self.store.upsert(
+                    [parse_draft_log(path, self.set_list, self.sets_location)]
+                )
+            except Exception as e:
+                logger.error(f"Failed to index {path}: {e}")
+        return len(paths)
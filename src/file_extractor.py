@@ -1325,8 +1325,12 @@ class FileExtractor(UIProgress):
                     os.remove(location)
                 output_file = ""
             else:
-                from src.utils import invalidate_local_set_cache
+                from src.utils import catalog_dataset, invalidate_local_set_cache
 
+                from src.compiled_dataset import compile_dataset
+
+                catalog_dataset(location, write_data[1])
+                compile_dataset(location, write_data[1])
                 invalidate_local_set_cache()
 
         except Exception as error:
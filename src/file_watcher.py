@@ -0,0 +1,194 @@
+"""
+src/file_watcher.py
+
+File-change notifiers used by the DraftOrchestrator to sleep until Player.log
+grows. Linux uses inotify through a small ctypes shim; every other platform (or a
+Linux box where inotify is unavailable) falls back to polling the file size.
+"""
+
+import os
+import sys
+import select
+import struct
+import ctypes
+import ctypes.util
+import threading
+
+import src.constants as constants
+from src.logger import create_logger
+
+logger = create_logger()
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns, stat.st_ino
+    except OSError:
+        return None
+
+
+class PollingFileWatcher:
+    """Fallback watcher: checks the size/mtime of each watched file on an interval."""
+
+    def __init__(self, interval: float = constants.FILE_WATCH_POLL_INTERVAL):
+        self.interval = interval
+        self._signatures = {}
+        self._wake_event = threading.Event()
+
+    def watch(self, paths):
+        """Sets the files to watch; unchanged paths keep their last signature."""
+        paths = {p for p in paths if p}
+        self._signatures = {
+            p: self._signatures.get(p, _file_signature(p)) for p in paths
+        }
+
+    def wait(self, timeout: float = None) -> bool:
+        """Blocks for up to one interval; returns True if a watched file changed."""
+        self._wake_event.wait(self.interval if timeout is None else timeout)
+        self._wake_event.clear()
+
+        changed = False
+        for path, signature in self._signatures.items():
+            current = _file_signature(path)
+            if current != signature:
+                self._signatures[path] = current
+                changed = True
+        return changed
+
+    def wake(self):
+        """Interrupts a pending wait() from another thread."""
+        self._wake_event.set()
+
+    def close(self):
+        self._wake_event.set()
+
+
+class InotifyFileWatcher:
+    """
+    inotify watcher: watches the parent directory of each file so a log that MTGA
+    deletes and recreates on restart keeps waking the orchestrator.
+    """
+
+    def __init__(self, timeout: float = constants.FILE_WATCH_TIMEOUT):
+        self.timeout = timeout
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        self._watches = {}  # directory -> wd
+        self._names = {}  # wd -> set of watched file names
+
+    def watch(self, paths):
+        """Sets the files to watch, adding and removing directory watches as needed."""
+        wanted = {}
+        for path in paths:
+            if not path:
+                continue
+            directory, name = os.path.split(os.path.abspath(path))
+            wanted.setdefault(directory, set()).add(name)
+
+        for directory in list(self._watches):
+            if directory not in wanted:
+                wd = self._watches.pop(directory)
+                self._libc.inotify_rm_watch(self._fd, wd)
+                self._names.pop(wd, None)
+
+        for directory, names in wanted.items():
+            wd = self._watches.get(directory)
+            if wd is None:
+                wd = self._libc.inotify_add_watch(
+                    self._fd, os.fsencode(directory), IN_WATCH_MASK
+                )
+                if wd < 0:
+                    errno = ctypes.get_errno()
+                    logger.error(
+                        f"inotify_add_watch failed for {directory}: {os.strerror(errno)}"
+                    )
+                    continue
+                self._watches[directory] = wd
+            self._names[wd] = names
+
+    def wait(self, timeout: float = None) -> bool:
+        """Blocks until a watched file changes, wake() is called or the timeout expires."""
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            readable, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+        except (OSError, ValueError):
+            return False
+
+        if self._wake_r in readable:
+            try:
+                while os.read(self._wake_r, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+        if self._fd not in readable:
+            return False
+        return self._drain()
+
+    def _drain(self) -> bool:
+        changed = False
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not buffer:
+                break
+
+            position = 0
+            while position + _EVENT_HEADER.size <= len(buffer):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(buffer, position)
+                position += _EVENT_HEADER.size
+                name = buffer[position : position + length].rstrip(b"\0")
+                position += length
+
+                if mask & IN_Q_OVERFLOW:
+                    changed = True
+                elif os.fsdecode(name) in self._names.get(wd, ()):
+                    changed = True
+        return changed
+
+    def wake(self):
+        """Interrupts a pending wait() from another thread."""
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
+    def close(self):
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._watches = {}
+        self._names = {}
+
+
+def create_file_watcher():
+    """Returns the inotify watcher on Linux, or the polling watcher as a fallback."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyFileWatcher()
+        except (OSError, AttributeError) as e:
+            logger.info(f"inotify unavailable, falling back to polling: {e}")
+    return PollingFileWatcher()
@@ -12,7 +12,7 @@ import os
 import urllib.request
 import certifi
 from typing import Dict, List, Tuple
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from src import constants
 from src.logger import create_logger
 from src.constants import APPLICATION_VERSION, BASE_DIR
@@ -63,6 +63,126 @@ class SpecialEvent(BaseModel):
     number_of_players: int = 8
 
 
+class EventClassifier:
+    """
+    Maps an MTGA event name (e.g. "PremierDraft_OTJ_20240416") to its limited type,
+    label, set and player count. The set list is compiled once into an index from
+    set-code parts to candidate sets, and every result is memoized per event name.
+    """
+
+    def __init__(self, special_events: List[SpecialEvent], data: Dict[str, SetInfo]):
+        self._special_events = [
+            (tuple(event.keywords), event)
+            for event in special_events
+            if event.type in constants.LIMITED_TYPES_DICT
+        ]
+
+        # Longest set code wins; ties keep the set list order
+        self._set_codes = []
+        self._part_index = {}
+        self._always = []  # Codes with no parts match any event, as all([]) does
+        ordered = sorted(data.values(), key=lambda v: len(v.set_code), reverse=True)
+        for info in ordered:
+            if not info.set_code:
+                continue
+            parts = tuple(
+                part.upper()
+                for part in info.set_code.replace("-", " ")
+                .replace("CUBE", " CUBE ")
+                .split()
+            )
+            position = len(self._set_codes)
+            self._set_codes.append((info.set_code, parts))
+            if not parts:
+                self._always.append(position)
+            for part in set(parts):
+                self._part_index.setdefault(part, []).append(position)
+        self._part_lengths = sorted({len(part) for part in self._part_index})
+        self._cache = {}
+
+    def classify(self, event_name: str) -> Tuple[bool, str, str, List[str], int]:
+        """Returns (match, event type, label, [set code], number of players)."""
+        result = self._cache.get(event_name)
+        if result is None:
+            result = self._classify_special(event_name)
+            if not result[0]:
+                result = self._classify_standard(event_name)
+            self._cache[event_name] = result
+        match, event_type, label, event_set, players = result
+        return match, event_type, label, list(event_set), players
+
+    def _classify_special(self, event_name: str):
+        for keywords, event in self._special_events:
+            if all(x in event_name for x in keywords):
+                number_of_players = (
+                    4
+                    if constants.PICK_TWO_EVENT_STRING in event_name
+                    else event.number_of_players
+                )
+                return (
+                    True,
+                    event.type,
+                    event.label[:12],
+                    [event.set_code],
+                    (number_of_players),
+                )
+        return False, "", "", "", 8
+
+    def _classify_standard(self, event_name: str):
+        event_sections = event_name.split("_")
+        events = [
+            i for i in constants.LIMITED_TYPES_DICT for x in event_sections if i in x
+        ]
+        if not events and any(
+            i in x for i in constants.DRAFT_DETECTION_CATCH_ALL for x in event_sections
+        ):
+            events.append(constants.LIMITED_TYPE_STRING_DRAFT_PREMIER)
+        if not events:
+            return False, "", "", [], 8
+
+        event_set = self._match_set(event_sections)
+        if not event_set:
+            for section in event_sections:
+                if any(ev in section for ev in events) or section.isdigit():
+                    continue
+                if 3 <= len(section) <= 4 and section.isalnum():
+                    event_set = [section.upper()]
+                    break
+        event_set = ["UNKN"] if not event_set else event_set
+
+        if events[0] == constants.LIMITED_TYPE_STRING_SEALED:
+            event_type = (
+                constants.LIMITED_TYPE_STRING_TRAD_SEALED
+                if "Trad" in event_sections
+                else constants.LIMITED_TYPE_STRING_SEALED
+            )
+        else:
+            event_type = events[0]
+
+        number_of_players = 4 if constants.PICK_TWO_EVENT_STRING in event_name else 8
+        return True, event_type, event_type, event_set, number_of_players
+
+    def _match_set(self, event_sections: List[str]) -> List[str]:
+        """First set (in priority order) whose code parts all occur in some section."""
+        substrings = set()
+        for section in event_sections:
+            section = section.upper()
+            for length in self._part_lengths:
+                if length > len(section):
+                    break
+                for start in range(len(section) - length + 1):
+                    substrings.add(section[start : start + length])
+
+        candidates = set(self._always)
+        for substring in substrings:
+            candidates.update(self._part_index.get(substring, ()))
+        for position in sorted(candidates):
+            set_code, parts = self._set_codes[position]
+            if all(part in substrings for part in parts):
+                return [set_code]
+        return []
+
+
 class SetDictionary(BaseModel):
     version: int = 0
     latest_set: str = ""
@@ -93,6 +213,13 @@ class SetDictionary(BaseModel):
             keywords=["Qualifier", "Draft"],
         ),
     ]
+    _event_classifier: EventClassifier = PrivateAttr(default=None)
+
+    def event_classifier(self) -> EventClassifier:
+        """Returns the event classifier for this set list, compiling it on first use."""
+        if self._event_classifier is None:
+            self._event_classifier = EventClassifier(self.special_events, self.data)
+        return self._event_classifier
 
 
 def shift_date(start_date, shifted_days, string_format, next_dow=None):
@@ -123,6 +250,7 @@ class LimitedSets:
             logger.info("Using cached set list.")
             self.limited_sets, _ = self.read_sets_file()
             self.__substitute_strings()
+            self.limited_sets.event_classifier()
             return self.limited_sets
 
         logger.info("Cache expired or missing. Fetching new set list from network.")
@@ -131,6 +259,7 @@ class LimitedSets:
         self.__assemble_limited_sets()
         self.__substitute_strings()
         self.write_sets_file(self.limited_sets)
+        self.limited_sets.event_classifier()
         return self.limited_sets
 
     def _is_cache_valid(self) -> bool:
@@ -0,0 +1,159 @@
+"""
+src/log_index.py
+
+Persistent index of the byte offsets the ArenaScanner has already processed.
+Entries are keyed by log path and fingerprinted with the file's inode, a hash of
+its head and a hash of the bytes just before the last scanned offset, so a cold
+start can seek straight to the last draft start instead of rescanning the log.
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+
+import src.constants as constants
+from src.logger import create_logger
+
+logger = create_logger()
+
+
+def _hash_ranges(log_path: str, ranges) -> list:
+    """Returns the sha1 of each (start, length) range, or "" for empty/short ranges."""
+    hashes = []
+    with open(log_path, "rb") as log:
+        for start, length in ranges:
+            if length <= 0:
+                hashes.append("")
+                continue
+            log.seek(start)
+            data = log.read(length)
+            hashes.append(hashlib.sha1(data).hexdigest() if len(data) == length else "")
+    return hashes
+
+
+class LogIndex:
+    """Reads and writes the offset index file shared by every scanned log."""
+
+    def __init__(self, index_file: str):
+        self.index_file = index_file
+        self._entries = None
+        self._head_cache = {}
+
+    def _read(self) -> dict:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                if os.path.exists(self.index_file):
+                    with open(self.index_file, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    if data.get("version") == constants.LOG_INDEX_VERSION:
+                        self._entries = data.get("logs", {})
+            except Exception as e:
+                logger.error(f"Failed to read log index: {e}")
+        return self._entries
+
+    def _write(self):
+        try:
+            dir_name = os.path.dirname(self.index_file)
+            if dir_name and not os.path.exists(dir_name):
+                os.makedirs(dir_name)
+
+            fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": constants.LOG_INDEX_VERSION, "logs": self._entries}, f
+                )
+            os.replace(tmp_path, self.index_file)
+        except Exception as e:
+            logger.error(f"Failed to write log index: {e}")
+
+    def _fingerprint(self, log_path: str, inode: int, size: int, scanned: int):
+        """Head and anchor hashes; the head hash is cached once the head is complete."""
+        head_length = min(size, constants.LOG_INDEX_HEAD_BYTES)
+        anchor = min(scanned, constants.LOG_INDEX_ANCHOR_BYTES)
+        cached = self._head_cache.get(log_path)
+        if cached and cached[0] == inode and cached[1] == head_length:
+            (anchor_hash,) = _hash_ranges(log_path, [(scanned - anchor, anchor)])
+            return head_length, cached[2], anchor_hash
+        head_hash, anchor_hash = _hash_ranges(
+            log_path, [(0, head_length), (scanned - anchor, anchor)]
+        )
+        self._head_cache[log_path] = (inode, head_length, head_hash)
+        return head_length, head_hash, anchor_hash
+
+    def load(self, log_path: str):
+        """Returns the stored entry for log_path if it still describes the file on disk."""
+        key = os.path.abspath(log_path)
+        entry = self._read().get(key)
+        if not entry:
+            return None
+
+        try:
+            stat = os.stat(log_path)
+            scanned = entry["scanned_offset"]
+            anchor = min(scanned, constants.LOG_INDEX_ANCHOR_BYTES)
+            valid = (
+                stat.st_ino == entry["inode"]
+                and stat.st_size >= entry["size"]
+                and _hash_ranges(
+                    log_path, [(0, entry["head_length"]), (scanned - anchor, anchor)]
+                )
+                == [entry["head_hash"], entry["anchor_hash"]]
+            )
+        except Exception as e:
+            logger.error(f"Failed to validate log index for {log_path}: {e}")
+            valid = False
+
+        if not valid:
+            logger.info(f"Discarding stale log index for {log_path}")
+            self.discard(log_path)
+            return None
+        return entry
+
+    def save(
+        self,
+        log_path: str,
+        scanned_offset: int,
+        cursors: dict,
+        events: dict,
+        draft: dict,
+    ):
+        """Stores the scanner's cursors and event offsets for log_path."""
+        key = os.path.abspath(log_path)
+        try:
+            stat = os.stat(log_path)
+            head_length, head_hash, anchor_hash = self._fingerprint(
+                log_path, stat.st_ino, stat.st_size, scanned_offset
+            )
+            entry = {
+                "inode": stat.st_ino,
+                "size": scanned_offset,
+                "head_length": head_length,
+                "head_hash": head_hash,
+                "anchor_hash": anchor_hash,
+                "scanned_offset": scanned_offset,
+                "cursors": cursors,
+                "events": {k: sorted(v) for k, v in events.items()},
+                "draft": draft,
+                "updated": time.time(),
+            }
+        except Exception as e:
+            logger.error(f"Failed to index {log_path}: {e}")
+            return
+
+        entries = self._read()
+        entries[key] = entry
+        if len(entries) > constants.LOG_INDEX_MAX_ENTRIES:
+            oldest = sorted(entries, key=lambda k: entries[k].get("updated", 0))
+            for stale in oldest[: len(entries) - constants.LOG_INDEX_MAX_ENTRIES]:
+                del entries[stale]
+        self._write()
+
+    def discard(self, log_path: str):
+        """Drops the entry for log_path, e.g. after the log was truncated."""
+        key = os.path.abspath(log_path)
+        self._head_cache.pop(log_path, None)
+        if self._read().pop(key, None) is not None:
+            self._write()
@@ -7,24 +7,35 @@ and managing the state of the current draft (packs, picks, event info).
 
 import os
 import json
+import mmap
 import re
 import logging
-import threading
 import time
+from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
+from typing import Callable, List, Tuple
+
+import numpy as np
 
 import src.constants as constants
 from src.logger import create_logger
-from src.set_metrics import SetMetrics
+from src.set_metrics import SetMetrics, load_set_metrics
 from src.dataset import Dataset
+from src.dataset_cache import DatasetCache
+from src.log_index import LogIndex
+from src.draft_journal import DraftJournal
+from src.draft_snapshot import DraftSnapshot
 from src.tier_list import TierList
 from src.utils import (
     process_json,
     json_find,
+    json_find_keys,
     retrieve_local_set_list,
     detect_string,
     normalize_color_string,
+    TimedLock,
+    Result,
 )
 
 if not os.path.exists(constants.DRAFT_LOG_FOLDER):
@@ -34,12 +45,104 @@ LOG_TYPE_DRAFT = "draftLog"
 
 logger = create_logger()
 
+MMAP_CHUNK_SIZE = 32 * 1024 * 1024
+LOG_TIMESTAMP_PREFIX = b"[UnityCrossThreadLogger]"
+LOG_CURSOR_ATTRS = ("search_offset", "pick_offset", "pack_offset", "pool_offset")
+
+# Payload keys each parser reads, decoded in a single targeted pass
+EVENT_START_KEYS = ("id", "EventName", "EntryCurrencyType")
+DECK_RECOVERY_KEYS = ("InternalEventName", "CardPool")
+PACK_NOTIFY_KEYS = ("PackCards", "SelfPack", "SelfPick", "DraftId", "draftId")
+PICK_HUMAN_KEYS = (
+    "GrpIds",
+    "cardIds",
+    "GrpId",
+    "cardId",
+    "PickGrpId",
+    "Pack",
+    "packNumber",
+    "Pick",
+    "pickNumber",
+    "DraftId",
+    "draftId",
+)
+PICK_V1_KEYS = ("Pack", "Pick", "GrpId", "DraftId", "draftId")
+PACK_BOT_KEYS = ("DraftStatus", "DraftPack", "PackNumber", "PickNumber", "PickedCards")
+PICK_BOT_KEYS = ("CardIds", "cardIds", "CardId", "cardId", "PackNumber", "PickNumber")
+_UPPERCASE_TABLE = bytes.maketrans(
+    b"abcdefghijklmnopqrstuvwxyz", b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+)
+
 
 class Source(Enum):
     REFRESH = 1
     UPDATE = 2
 
 
+@dataclass(frozen=True)
+class LogRoute:
+    """A parser registered with the multiplexed log tailer."""
+
+    offset_attr: str
+    search_strings: Tuple[str, ...]
+    handler: Callable[[str], bool]
+    single_step: bool = True
+
+
+def _prefilter_token(pattern: str) -> bytes:
+    """
+    Distinctive, normalized tail of a search string. Any line that detect_string
+    matches (exactly or via its upper-cased, '_'/' '-stripped slow path) contains it.
+    """
+    normalized = pattern.upper().replace("_", "").replace(" ", "")
+    token = normalized.rsplit("]", 1)[-1].lstrip("=>")
+    return (token or normalized).encode("utf-8")
+
+
+def _prefilter_lines(chunk: bytes, tokens) -> List[Tuple[int, int]]:
+    """
+    Returns the (start, end) byte spans of the lines in chunk that may contain one of
+    the parser patterns. The whole chunk is normalized the same way as detect_string's
+    slow path (ASCII upper-case, '_' and ' ' removed) in a single C-level pass, so
+    the fuzzy matching costs the same as an exact search.
+    """
+    normalized = chunk.translate(_UPPERCASE_TABLE, b"_ ")
+    hits = []
+    for token in tokens:
+        position = normalized.find(token)
+        while position != -1:
+            hits.append(position)
+            line_end = normalized.find(b"\n", position)
+            if line_end == -1:
+                break
+            position = normalized.find(token, line_end)
+    if not hits:
+        return []
+
+    # '_' and ' ' removal never touches newlines, so line numbers line up
+    rows = np.unique(
+        np.searchsorted(
+            np.flatnonzero(np.frombuffer(normalized, dtype=np.uint8) == 0x0A), hits
+        )
+    )
+    newlines = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == 0x0A)
+    spans = []
+    for row in rows.tolist():
+        start = int(newlines[row - 1]) + 1 if row else 0
+        spans.append((start, int(newlines[row]) + 1))
+    return spans
+
+
+def _union_search_strings(routes) -> List[str]:
+    """Flattened, de-duplicated search strings of every route (the tailer prefilter)."""
+    union = []
+    for route in routes:
+        for pattern in route.search_strings:
+            if pattern not in union:
+                union.append(pattern)
+    return union
+
+
 class ArenaScanner:
     """Class that handles the processing of the information within Arena Player.log file"""
 
@@ -51,20 +154,38 @@ class ArenaScanner:
         step_through: bool = False,
         retrieve_unknown: bool = False,
         db_path: str = None,
+        scan_mode: str = constants.LOG_SCAN_MODE_DEFAULT,
+        dataset_cache_mb: int = constants.DATASET_CACHE_BUDGET_MB,
+        state_folder: str = None,
     ):
         self.arena_file = filename
         self.set_list = set_list
         self.draft_log = logging.getLogger(LOG_TYPE_DRAFT)
         self.draft_log.setLevel(logging.INFO)
         self.sets_location = sets_location
-        self.state_file = os.path.join(constants.TEMP_FOLDER, "active_draft_state.json")
+        # The draft journal and log index live in TEMP_FOLDER unless a scanner that
+        # must not touch the live draft state (indexer workers, replays) says otherwise
+        state_folder = state_folder or constants.TEMP_FOLDER
+        self.journal = DraftJournal(
+            os.path.join(state_folder, "active_draft_state.json")
+        )
+        self.log_index = LogIndex(
+            os.path.join(state_folder, constants.LOG_INDEX_FILE_NAME)
+        )
 
-        # CENTRAL DATA LOCK: Co-ordinates UI and Background Threading
-        self.lock = threading.RLock()
+        # CENTRAL DATA LOCK: Guards the parser (writer). Readers use the published
+        # DraftSnapshot instead; the lock records wait times to measure contention.
+        self.lock = TimedLock()
+        self._snapshot = DraftSnapshot()
+        # Bumped on every state save so passes whose handlers returned False
+        # still publish what they changed
+        self._state_version = 0
 
         self.logging_enabled = False
         self.step_through = step_through
+        self.scan_mode = scan_mode
         self.set_data = Dataset(retrieve_unknown, db_path)
+        self.dataset_cache = DatasetCache(dataset_cache_mb)
         self.tier_list = TierList()
         self.draft_type = constants.LIMITED_TYPE_UNKNOWN
 
@@ -76,6 +197,12 @@ class ArenaScanner:
         self.draft_start_offset = 0
         self.file_size = 0
 
+        # Offsets of every event line parsed so far, persisted by the log index
+        self._event_offsets = {attr: set() for attr in LOG_CURSOR_ATTRS}
+        self._index_saved_offset = 0
+        self._index_saved_time = float("-inf")
+        self._index_dirty = False
+
         # State Trackers
         self.draft_sets = []
         self.current_pick = 0
@@ -100,18 +227,22 @@ class ArenaScanner:
         self.current_draft_id = ""
         self.draft_start_time = ""
         self._last_seen_timestamp = "Unknown"
+        self._build_routes()
         self._load_state()
+        self._restore_log_index()
 
     def set_arena_file(self, filename):
         """Updates the log path and resets pointers for a clean scan."""
         with self.lock:
             if self.arena_file != filename:
                 logger.info(f"Scanner path updated to: {filename}")
+                self.flush_log_index()
                 self.arena_file = filename
                 self.search_offset = 0
                 self.draft_start_offset = 0
                 self.file_size = 0
                 self.clear_draft(True)
+                self._restore_log_index()
 
                 # Do not write to past draft logs
                 if os.path.basename(filename).startswith("DraftLog_"):
@@ -157,45 +288,27 @@ class ArenaScanner:
         except Exception as error:
             logger.error(error)
 
+    @property
+    def state_file(self):
+        return self.journal.state_file
+
+    @state_file.setter
+    def state_file(self, path):
+        self.journal.close()
+        self.journal = DraftJournal(path)
+
     def _load_state(self, target_draft_id=None):
-        """Recovers the active draft state if the app was closed mid-draft."""
+        """Recovers the active draft state (snapshot + journal) if the app was closed mid-draft."""
         try:
-            if os.path.exists(self.state_file):
-                with open(self.state_file, "r", encoding="utf-8") as f:
-                    state = json.load(f)
-
+            state = self.journal.load()
+            if state is not None:
                 # If an ID is provided, strictly match it.
                 if target_draft_id is not None and str(
                     state.get("current_draft_id", "")
                 ) != str(target_draft_id):
                     return False
 
-                self.draft_type = state.get(
-                    "draft_type", constants.LIMITED_TYPE_UNKNOWN
-                )
-                self.draft_sets = state.get("draft_sets", [])
-                self.draft_label = state.get("draft_label", "")
-                self.event_string = state.get("event_string", "")
-                self.current_draft_id = state.get("current_draft_id", "")
-                self.current_transaction_id = state.get("current_transaction_id", "")
-                self.number_of_players = state.get("number_of_players", 8)
-                self.taken_cards = state.get("taken_cards", [])
-                self.picked_cards = state.get(
-                    "picked_cards", [[] for _ in range(self.number_of_players)]
-                )
-                self.initial_pack = state.get(
-                    "initial_pack", [[] for _ in range(self.number_of_players)]
-                )
-                self.pack_cards = state.get(
-                    "pack_cards", [[] for _ in range(self.number_of_players)]
-                )
-                self.current_pack = state.get("current_pack", 0)
-                self.current_pick = state.get("current_pick", 0)
-                self.previous_scanned_pack = state.get("previous_scanned_pack", 0)
-                self.previous_picked_pack = state.get("previous_picked_pack", 0)
-                self.current_picked_pick = state.get("current_picked_pick", 0)
-                self.draft_history = state.get("draft_history", [])
-                self.draft_start_time = state.get("draft_start_time", "")
+                self._apply_state(state)
 
                 if self.draft_type != constants.LIMITED_TYPE_UNKNOWN:
                     logger.info(
@@ -207,31 +320,101 @@ class ArenaScanner:
             logger.error(f"Failed to load draft state: {e}")
         return False
 
-    def _save_state(self):
-        """Persists the memory state to disk to survive application crashes."""
+    def export_state(self) -> dict:
+        """Returns the draft fields that make up the persisted draft state."""
+        return {
+            "draft_type": self.draft_type,
+            "draft_sets": self.draft_sets,
+            "draft_label": self.draft_label,
+            "event_string": self.event_string,
+            "current_draft_id": self.current_draft_id,
+            "current_transaction_id": getattr(self, "current_transaction_id", ""),
+            "number_of_players": self.number_of_players,
+            "taken_cards": self.taken_cards,
+            "picked_cards": self.picked_cards,
+            "initial_pack": self.initial_pack,
+            "pack_cards": self.pack_cards,
+            "current_pack": self.current_pack,
+            "current_pick": self.current_pick,
+            "previous_scanned_pack": self.previous_scanned_pack,
+            "previous_picked_pack": self.previous_picked_pack,
+            "current_picked_pick": self.current_picked_pick,
+            "draft_history": self.draft_history,
+            "draft_start_time": self.draft_start_time,
+        }
+
+    def _apply_state(self, state: dict):
+        self.draft_type = state.get("draft_type", constants.LIMITED_TYPE_UNKNOWN)
+        self.draft_sets = state.get("draft_sets", [])
+        self.draft_label = state.get("draft_label", "")
+        self.event_string = state.get("event_string", "")
+        self.current_draft_id = state.get("current_draft_id", "")
+        self.current_transaction_id = state.get("current_transaction_id", "")
+        self.number_of_players = state.get("number_of_players", 8)
+        self.taken_cards = state.get("taken_cards", [])
+        self.picked_cards = state.get(
+            "picked_cards", [[] for _ in range(self.number_of_players)]
+        )
+        self.initial_pack = state.get(
+            "initial_pack", [[] for _ in range(self.number_of_players)]
+        )
+        self.pack_cards = state.get(
+            "pack_cards", [[] for _ in range(self.number_of_players)]
+        )
+        self.current_pack = state.get("current_pack", 0)
+        self.current_pick = state.get("current_pick", 0)
+        self.previous_scanned_pack = state.get("previous_scanned_pack", 0)
+        self.previous_picked_pack = state.get("previous_picked_pack", 0)
+        self.current_picked_pick = state.get("current_picked_pick", 0)
+        self.draft_history = state.get("draft_history", [])
+        self.draft_start_time = state.get("draft_start_time", "")
+        self._publish_snapshot()
+
+    def restore_indexed_draft(self, state: dict):
+        """
+        Loads a draft parsed earlier by the DraftStore indexer and moves every
+        cursor to the end of the log, so the file is not parsed again.
+        """
+        with self.lock:
+            self._apply_state(state)
+            try:
+                end = os.path.getsize(self.arena_file)
+            except OSError:
+                end = 0
+            self.file_size = end
+            for attr in LOG_CURSOR_ATTRS:
+                setattr(self, attr, end)
+            self._save_state()
+
+    def _publish_snapshot(self):
+        """Swaps in an immutable copy of the draft state for lock-free readers."""
+        with self.lock:
+            self._snapshot = DraftSnapshot.from_scanner(
+                self, self._snapshot.version + 1
+            )
+
+    def retrieve_snapshot(self) -> DraftSnapshot:
+        """Latest published draft state; safe to read from any thread without the lock."""
+        return self._snapshot
+
+    def _resolve_snapshot(self, snapshot) -> DraftSnapshot:
+        """Returns snapshot, or a fresh copy of the live state taken under the lock."""
+        if snapshot is not None:
+            return snapshot
+        with self.lock:
+            return DraftSnapshot.from_scanner(self, self._snapshot.version)
+
+    def lock_stats(self) -> dict:
+        return self.lock.stats()
+
+    def _save_state(self, *changed):
+        """Persists the memory state to disk to survive application crashes.
+        Only the fields that changed are appended to the draft journal; the
+        per-pick handlers name the list fields they touched so the rest of the
+        draft is not compared."""
+        self._state_version += 1
         try:
-            state = {
-                "draft_type": self.draft_type,
-                "draft_sets": self.draft_sets,
-                "draft_label": self.draft_label,
-                "event_string": self.event_string,
-                "current_draft_id": self.current_draft_id,
-                "current_transaction_id": getattr(self, "current_transaction_id", ""),
-                "number_of_players": self.number_of_players,
-                "taken_cards": self.taken_cards,
-                "picked_cards": self.picked_cards,
-                "initial_pack": self.initial_pack,
-                "pack_cards": self.pack_cards,
-                "current_pack": self.current_pack,
-                "current_pick": self.current_pick,
-                "previous_scanned_pack": self.previous_scanned_pack,
-                "previous_picked_pack": self.previous_picked_pack,
-                "current_picked_pick": self.current_picked_pick,
-                "draft_history": self.draft_history,
-                "draft_start_time": self.draft_start_time,
-            }
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(state, f)
+            self.journal.save(self.export_state(), changed or None)
         except Exception as e:
             logger.error(f"Failed to save draft state: {e}")
 
@@ -242,12 +425,13 @@ class ArenaScanner:
                 self.draft_start_offset = 0
                 self.file_size = 0
                 self.current_transaction_id = ""
-                if os.path.exists(self.state_file):
-                    try:
-                        os.remove(self.state_file)
-                    except:
-                        pass
-                self.set_data.clear()
+                self._event_offsets = {attr: set() for attr in LOG_CURSOR_ATTRS}
+                self._index_saved_offset = 0
+                self._index_dirty = False
+                self.journal.reset()
+                # Cached datasets are shared, so start a new one instead of clearing
+                self.set_data = self._new_dataset()
+                self._metrics_cache = None
 
             self.draft_type = constants.LIMITED_TYPE_UNKNOWN
             self.pick_offset = 0
@@ -273,104 +457,103 @@ class ArenaScanner:
             self.draft_start_time = ""
             if not full_clear:
                 self._save_state()
+            self._publish_snapshot()
 
-    def draft_start_search(self):
-        """Search for the string that represents the start of a draft"""
-
+    def _check_log_rotation(self):
+        """Resets the scanner if Player.log shrank (MTGA restarted and truncated it)."""
         with self.lock:
             try:
                 arena_file_size = os.path.getsize(self.arena_file)
-                if self.file_size > arena_file_size:
-                    self.clear_draft(True)
-                    logger.info(
-                        "New Arena Log Detected (%d), (%d)",
-                        self.file_size,
-                        arena_file_size,
-                    )
-                self.file_size = arena_file_size
-                offset = self.search_offset
             except Exception:
                 return False
+            if self.file_size > arena_file_size:
+                self.clear_draft(True)
+                self.log_index.discard(self.arena_file)
+                logger.info(
+                    "New Arena Log Detected (%d), (%d)",
+                    self.file_size,
+                    arena_file_size,
+                )
+            self.file_size = arena_file_size
+        return True
 
-        update = False
-        event_type = ""
-        event_line = ""
-        draft_id = ""
+    def draft_start_search(self):
+        """Search for the string that represents the start of a draft"""
+        if not self._check_log_rotation():
+            return False
 
-        try:
-            with open(self.arena_file, "r", encoding="utf-8", errors="replace") as log:
-                log.seek(offset)
-                while True:
-                    line = log.readline()
-                    if not line:
-                        break
-                    if not line.endswith("\n") and not line.endswith("\r"):
-                        break
+        updated = self._tail_log(lambda: (self._start_route,))
+        return "search_offset" in updated
 
-                    offset = log.tell()
+    def scan_log(self):
+        """
+        Single-pass poll used by the orchestrator: draft-start detection and every
+        pack/pick/pool parser for the active draft type share one read of the new bytes.
+        Returns (new_event, data_update).
+        """
+        if not self._check_log_rotation():
+            return False, False
 
-                    with self.lock:
-                        self.search_offset = offset
+        with self.lock:
+            pk, pi = self.current_pack, self.current_pick
+            pp = self.current_picked_pick
 
-                    if line.startswith("[UnityCrossThreadLogger]"):
-                        content = line[24:].strip()
-                        if content and content[0].isdigit() and (":" in content):
-                            with self.lock:
-                                self._last_seen_timestamp = content
+        updated = self._tail_log(lambda: (self._start_route,) + self._data_routes())
+
+        with self.lock:
+            data_update = bool(
+                (pk != self.current_pack)
+                or (pi != self.current_pick)
+                or (pp != self.current_picked_pick)
+                or (updated - {"search_offset"})
+            )
+        return "search_offset" in updated, data_update
+
+    def _handle_draft_start(self, line):
+        """Route handler for Event_Join/BotDraft_DraftStatus and Deck Recovery lines."""
+        offset = self.search_offset
+        event_type = ""
+        draft_id = ""
+        is_new = False
 
-                    start_offset = detect_string(line, constants.DRAFT_START_STRINGS)
+        start_offset = detect_string(line, constants.DRAFT_START_STRINGS)
+        if start_offset != -1:
+            event_data = json_find_keys(EVENT_START_KEYS, line[start_offset:])
+            is_new, event_type, draft_id = self.__check_event(event_data)
+            if is_new:
+                with self.lock:
+                    self.draft_start_offset = offset
+                    self.draft_start_time = self._last_seen_timestamp
 
-                    if start_offset != -1:
-                        entry_string = line[start_offset:]
-                        event_data = process_json(entry_string)
-                        is_new, et, did = self.__check_event(event_data)
+        elif "InternalEventName" in line and "CardPool" in line:
+            try:
+                json_start = line.find("{")
+                if json_start != -1:
+                    event_data = json_find_keys(DECK_RECOVERY_KEYS, line[json_start:])
+                    internal_name = event_data.get("InternalEventName")
+                    if internal_name:
+                        dummy_payload = {"EventName": internal_name}
+                        is_new, event_type, draft_id = self.__check_event(dummy_payload)
                         if is_new:
-                            update = True
-                            event_type = et
-                            draft_id = did
-                            event_line = line
+                            card_pool = event_data.get("CardPool")
                             with self.lock:
                                 self.draft_start_offset = offset
-                                self.draft_start_time = self._last_seen_timestamp
-
-                    elif "InternalEventName" in line and "CardPool" in line:
-                        try:
-                            json_start = line.find("{")
-                            if json_start != -1:
-                                event_data = process_json(line[json_start:])
-                                internal_name = json_find(
-                                    "InternalEventName", event_data
-                                )
-                                if internal_name:
-                                    dummy_payload = {"EventName": internal_name}
-                                    is_new, et, did = self.__check_event(dummy_payload)
-                                    if is_new:
-                                        update = True
-                                        event_type = et
-                                        draft_id = did
-                                        event_line = line
-                                        card_pool = json_find("CardPool", event_data)
-                                        with self.lock:
-                                            self.draft_start_offset = offset
-                                            if card_pool:
-                                                self.taken_cards = [
-                                                    str(c) for c in card_pool
-                                                ]
-                        except Exception as e:
-                            logger.error(f"Error parsing Deck Recovery line: {e}")
-
-            if update:
-                with self.lock:
-                    if self.draft_sets:
-                        self.__new_log(self.draft_sets[0], event_type, draft_id)
-                    self.draft_log.info(event_line.strip())
-                    self.pick_offset = self.draft_start_offset
-                    self.pack_offset = self.draft_start_offset
-                    self.pool_offset = self.draft_start_offset
-        except Exception as error:
-            logger.error(error)
+                                if card_pool:
+                                    self.taken_cards = [str(c) for c in card_pool]
+            except Exception as e:
+                logger.error(f"Error parsing Deck Recovery line: {e}")
+
+        if is_new:
+            with self.lock:
+                if self.draft_sets:
+                    self.__new_log(self.draft_sets[0], event_type, draft_id)
+                self.draft_log.info(line.strip())
+                # Every data parser resumes from the line after the draft start
+                self.pick_offset = self.draft_start_offset
+                self.pack_offset = self.draft_start_offset
+                self.pool_offset = self.draft_start_offset
 
-        return update
+        return is_new
 
     def __check_event(self, event_data):
         """Parse a draft start string and extract pertinent information"""
@@ -396,12 +579,8 @@ class ArenaScanner:
 
             logger.info("Event found %s", event_name)
             event_match, event_type, event_label, event_set, number_of_players = (
-                self.__check_special_event(event_name)
+                self.set_list.event_classifier().classify(event_name)
             )
-            if not event_match:
-                event_match, event_type, event_label, event_set, number_of_players = (
-                    self.__check_standard_event(event_name)
-                )
 
             if event_match:
                 self.clear_draft(False)
@@ -420,155 +599,314 @@ class ArenaScanner:
 
         return update, event_type, draft_id
 
-    def __check_special_event(self, event_name):
-        for event in self.set_list.special_events:
-            if event.type in constants.LIMITED_TYPES_DICT and all(
-                x in event_name for x in event.keywords
-            ):
-                number_of_players = (
-                    4
-                    if constants.PICK_TWO_EVENT_STRING in event_name
-                    else event.number_of_players
-                )
-                return (
-                    True,
-                    event.type,
-                    event.label[:12],
-                    [event.set_code],
-                    number_of_players,
-                )
-        return False, "", "", "", 8
+    # =========================================================================
+    # CORE MODULAR LOGIC ENGINES
+    # =========================================================================
 
-    def __check_standard_event(self, event_name):
-        event_match = False
-        event_type = ""
-        event_label = ""
-        event_set = []
-        number_of_players = 8
-        event_sections = event_name.split("_")
-
-        events = [
-            i for i in constants.LIMITED_TYPES_DICT for x in event_sections if i in x
-        ]
-        if not events and [
-            i
-            for i in constants.DRAFT_DETECTION_CATCH_ALL
-            for x in event_sections
-            if i in x
-        ]:
-            events.append(constants.LIMITED_TYPE_STRING_DRAFT_PREMIER)
+    def _tail_log(self, route_provider) -> set:
+        """
+        Multiplexed tailer: reads each new byte range of the log exactly once and fans
+        every line out to all registered routes. Completely lock-free during IO.
+
+        route_provider returns the active tuple of LogRoutes. It is re-evaluated whenever
+        the draft type changes mid-pass, so a draft start or a recovered event switches
+        parser sets without rereading the file.
+
+        Each offset attribute keeps its own cursor: a route only sees lines at or past its
+        cursor. When a handler rewinds another parser's cursor (e.g. clear_draft during
+        event recovery) that cursor is left where it was put until the next pass,
+        preserving the per-parser recovery semantics.
+
+        The snapshot is republished after any pass that changed the draft state, even
+        when no handler reported an update (e.g. a pack that is not a new high-water mark).
+
+        Returns the set of offset attributes whose routes reported an update.
+        """
+        updated = set()
+        state_version = self._state_version
+        draft_type = self.draft_type
+        routes = route_provider()
+        if not routes:
+            return updated
+        union = _union_search_strings(routes)
+        parked = set()
 
-        if events:
-            upper_sections = [sec.upper() for sec in event_sections]
-            for i in sorted(
-                self.set_list.data.values(), key=lambda v: len(v.set_code), reverse=True
-            ):
-                if not i.set_code:
+        try:
+            offset = min(getattr(self, r.offset_attr, 0) for r in routes)
+            if self.scan_mode == constants.LOG_SCAN_MODE_MMAP:
+                source = self._iter_log_candidates(offset)
+            else:
+                source = self._iter_log_lines(offset)
+
+            for line_start, line_end, line in source:
+                # Advance every cursor that has reached this line before dispatching,
+                # so handlers observe the same offsets the per-parser readers did.
+                channels = {
+                    r.offset_attr
+                    for r in routes
+                    if r.offset_attr not in parked
+                    and getattr(self, r.offset_attr, 0) <= line_start
+                }
+                for attr in channels:
+                    setattr(self, attr, line_end)
+
+                if not channels or not line or detect_string(line, union) == -1:
                     continue
-                normalized_code = i.set_code.replace("-", " ").replace("CUBE", " CUBE ")
-                code_parts = normalized_code.split()
-                if all(
-                    any(part.upper() in sec for sec in upper_sections)
-                    for part in code_parts
-                ):
-                    event_set = [i.set_code]
-                    break
 
-            if not event_set:
-                for section in event_sections:
-                    if any(ev in section for ev in events) or section.isdigit():
+                dispatched = set()
+                for route in routes:
+                    if route.offset_attr not in channels:
                         continue
-                    if 3 <= len(section) <= 4 and section.isalnum():
-                        event_set = [section.upper()]
-                        break
-
-            event_set = ["UNKN"] if not event_set else event_set
+                    if route.offset_attr in parked:
+                        continue
+                    if detect_string(line, route.search_strings) == -1:
+                        continue
+                    dispatched.add(route.offset_attr)
+                    try:
+                        if route.handler(line):
+                            updated.add(route.offset_attr)
+                            self._event_offsets[route.offset_attr].add(line_start)
+                    except Exception as e:
+                        logger.error(f"Parse Error for {route.search_strings}: {e}")
+                    if self.step_through and route.single_step:
+                        parked.add(route.offset_attr)
+
+                for attr in {r.offset_attr for r in routes}:
+                    if getattr(self, attr, 0) >= line_start:
+                        continue
+                    if attr in dispatched:
+                        # A parser never rewinds its own cursor mid-read
+                        setattr(self, attr, line_end)
+                    else:
+                        parked.add(attr)
+                if all(r.offset_attr in parked for r in routes):
+                    break
 
-            if events[0] == constants.LIMITED_TYPE_STRING_SEALED:
-                event_type = (
-                    constants.LIMITED_TYPE_STRING_TRAD_SEALED
-                    if "Trad" in event_sections
-                    else constants.LIMITED_TYPE_STRING_SEALED
+                if self.draft_type != draft_type:
+                    draft_type = self.draft_type
+                    routes = route_provider()
+                    union = _union_search_strings(routes)
+                    if not routes:
+                        break
+        except Exception as e:
+            logger.error(f"Error scanning log: {e}")
+
+        self._update_log_index(bool(updated))
+        if updated or self._state_version != state_version:
+            self._publish_snapshot()
+        return updated
+
+    def _update_log_index(self, events_found: bool):
+        """
+        Persists cursors and event offsets once enough bytes were read, or once parsed
+        events are pending and the last save is LOG_INDEX_SAVE_SECONDS old. Events alone
+        only mark the index dirty, so a draft does not rewrite the file on every pick.
+        """
+        with self.lock:
+            self._index_dirty = self._index_dirty or events_found
+            scanned = max(getattr(self, attr, 0) for attr in LOG_CURSOR_ATTRS)
+            if (
+                scanned - self._index_saved_offset >= constants.LOG_INDEX_SAVE_BYTES
+                or (
+                    self._index_dirty
+                    and time.monotonic() - self._index_saved_time
+                    >= constants.LOG_INDEX_SAVE_SECONDS
                 )
-            else:
-                event_type = events[0]
+            ):
+                self._save_log_index()
 
-            event_label = event_type
-            event_match = True
-            number_of_players = (
-                4 if constants.PICK_TWO_EVENT_STRING in event_name else 8
-            )
+    def flush_log_index(self):
+        """Writes pending event offsets to the log index (file swap, shutdown)."""
+        with self.lock:
+            if self._index_dirty:
+                self._save_log_index()
 
-        return event_match, event_type, event_label, event_set, number_of_players
+    def _save_log_index(self):
+        scanned = max(getattr(self, attr, 0) for attr in LOG_CURSOR_ATTRS)
+        if scanned == 0:
+            return
+        # A restart only replays from the last draft start, so older offsets are dropped
+        starts = self._event_offsets["search_offset"]
+        if starts:
+            last_start = max(starts)
+            self._event_offsets = {
+                attr: {offset for offset in offsets if offset >= last_start}
+                for attr, offsets in self._event_offsets.items()
+            }
+        cursors = {attr: getattr(self, attr, 0) for attr in LOG_CURSOR_ATTRS}
+        cursors["draft_start_offset"] = self.draft_start_offset
+        draft = {
+            "event_string": self.event_string,
+            "transaction_id": self.current_transaction_id,
+        }
+        self.log_index.save(
+            self.arena_file, scanned, cursors, self._event_offsets, draft
+        )
+        self._index_saved_offset = scanned
+        self._index_saved_time = time.monotonic()
+        self._index_dirty = False
+
+    def _restore_log_index(self):
+        """
+        Seeks the cursors using the persisted log index instead of rescanning from byte 0.
+        If the restored draft state is the indexed draft, every parser resumes where it
+        stopped; otherwise the cursors rewind to the last draft start so only the current
+        draft is replayed.
+        """
+        entry = self.log_index.load(self.arena_file)
+        if not entry:
+            return False
 
-    # =========================================================================
-    # CORE MODULAR LOGIC ENGINES
-    # =========================================================================
+        events = entry.get("events", {})
+        cursors = entry.get("cursors", {})
+        draft = entry.get("draft", {})
+        with self.lock:
+            self._event_offsets = {
+                attr: set(events.get(attr, [])) for attr in LOG_CURSOR_ATTRS
+            }
+            recorded = [offset for values in events.values() for offset in values]
+            resume = (
+                self.draft_type != constants.LIMITED_TYPE_UNKNOWN
+                and draft.get("event_string") == self.event_string
+                and draft.get("transaction_id") == self.current_transaction_id
+            )
+            if resume or not recorded:
+                for attr in LOG_CURSOR_ATTRS:
+                    setattr(self, attr, cursors.get(attr, 0))
+                self.draft_start_offset = cursors.get("draft_start_offset", 0)
+            else:
+                starts = events.get("search_offset", [])
+                rewind = max(starts) if starts else min(recorded)
+                for attr in LOG_CURSOR_ATTRS:
+                    setattr(self, attr, rewind)
+                self.draft_start_offset = rewind
+            self.file_size = entry.get("size", 0)
+            self._index_saved_offset = entry.get("scanned_offset", 0)
+            logger.info(
+                f"Log index restored for {self.arena_file}: "
+                f"{'resuming' if resume else 'replaying'} from {self.search_offset}"
+            )
+        return True
 
-    def _scan_log_for_events(self, offset_attr: str, search_strings: list):
-        """A robust generator that handles all file IO and yielding of JSON payloads. Completely lock-free during IO."""
-        offset = getattr(self, offset_attr, 0)
+    def _iter_log_lines(self, offset: int):
+        """readline source: yields (start, end, text) for every complete line past offset."""
+        with open(self.arena_file, "r", encoding="utf-8", errors="replace") as log:
+            log.seek(offset)
+            while True:
+                line = log.readline()
+                if not line:
+                    break
+                if not line.endswith("\n") and not line.endswith("\r"):
+                    break
 
-        try:
-            with open(self.arena_file, "r", encoding="utf-8", errors="replace") as log:
-                log.seek(offset)
-                while True:
-                    line = log.readline()
-                    if not line:
-                        break
-                    if not line.endswith("\n") and not line.endswith("\r"):
-                        break
+                line_start, offset = offset, log.tell()
 
-                    current_pos = log.tell()
-                    setattr(self, offset_attr, current_pos)
-
-                    if line.startswith("[UnityCrossThreadLogger]"):
-                        content = line[24:].strip()
-                        if content and content[0].isdigit() and (":" in content):
-                            self._last_seen_timestamp = content
-
-                    start_idx = detect_string(line, search_strings)
-                    if start_idx != -1:
-                        self.draft_log.info(line.strip())
-                        # Ensure we grab the start of the valid JSON dictionary
-                        json_start = line.find("{")
-                        if json_start != -1:
-                            yield line[json_start:]
-                        else:
-                            yield line[start_idx:]
-        except Exception as e:
-            logger.error(f"Error scanning {search_strings}: {e}")
+                if line.startswith("[UnityCrossThreadLogger]"):
+                    content = line[24:].strip()
+                    if content and content[0].isdigit() and (":" in content):
+                        self._last_seen_timestamp = content
 
-    def _parse_events(
-        self, offset_attr: str, search_strings: list, extractor_func: callable
-    ) -> bool:
-        """Generic event processor that DRYs up JSON parsing, looping, and error handling."""
-        update = False
+                yield line_start, offset, line
 
-        flat_search = []
-        for s in search_strings:
-            if isinstance(s, list):
-                flat_search.extend(s)
+    def _iter_log_candidates(self, offset: int):
+        """
+        mmap source: searches the raw bytes of every complete line past offset for all
+        parser patterns at once and decodes only the lines that may match. A final
+        (end, end, "") entry lets idle cursors advance over the skipped bytes.
+        """
+        with open(self.arena_file, "rb") as log:
+            size = os.fstat(log.fileno()).st_size
+            if size <= offset:
+                return
+            with mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Only complete lines are consumed; a partially flushed line waits
+                end = mm.rfind(b"\n", offset, size) + 1
+                if end <= offset:
+                    return
+
+                scanned = offset
+                chunk_start = offset
+                while chunk_start < end:
+                    chunk_end = mm.rfind(
+                        b"\n", chunk_start, min(chunk_start + MMAP_CHUNK_SIZE, end)
+                    )
+                    if chunk_end == -1:
+                        # A single line longer than the chunk size
+                        chunk_end = mm.find(b"\n", chunk_start, end)
+                    chunk_end += 1
+                    chunk = mm[chunk_start:chunk_end]
+
+                    for start, stop in _prefilter_lines(chunk, self._prefilter_tokens):
+                        line_start = chunk_start + start
+                        self._seek_timestamp(mm, scanned, line_start)
+                        scanned = chunk_start + stop
+                        line = chunk[start:stop].decode("utf-8", errors="replace")
+                        if line.endswith("\r\n"):
+                            line = line[:-2] + "\n"
+                        yield line_start, scanned, line
+
+                    chunk_start = chunk_end
+
+                self._seek_timestamp(mm, scanned, end)
+                yield end, end, ""
+
+    def _seek_timestamp(self, mm, low: int, high: int):
+        """Records the last '[UnityCrossThreadLogger]<timestamp>' line in mm[low:high]."""
+        position = high
+        while True:
+            position = mm.rfind(LOG_TIMESTAMP_PREFIX, low, position)
+            if position == -1:
+                return
+            if position == 0 or mm[position - 1] == 0x0A:
+                line_end = mm.find(b"\n", position, high)
+                content = (
+                    mm[position + len(LOG_TIMESTAMP_PREFIX) : line_end]
+                    .decode("utf-8", errors="replace")
+                    .strip()
+                )
+                if content and content[0].isdigit() and (":" in content):
+                    self._last_seen_timestamp = content
+                    return
+
+    def _payload_handler(self, extractor: callable, keys: tuple = None) -> callable:
+        """
+        Wraps a JSON extractor into a route handler that logs and decodes the matched line.
+        With keys, the extractor receives a flat {key: value} dict from a single targeted
+        decode; without, it receives the fully decoded payload.
+        """
+
+        def _handle(line):
+            self.draft_log.info(line.strip())
+            # Ensure we grab the start of the valid JSON dictionary
+            payload = line[line.find("{") :]
+            if keys:
+                draft_data = json_find_keys(keys, payload)
             else:
-                flat_search.append(s)
-
-        for payload in self._scan_log_for_events(offset_attr, flat_search):
-            try:
                 draft_data = process_json(payload)
                 if not draft_data:
                     try:
                         draft_data = json.loads(payload)
                     except Exception:
                         pass
+            return bool(draft_data) and bool(extractor(draft_data))
 
-                if draft_data and extractor_func(draft_data):
-                    update = True
+        return _handle
 
-                if self.step_through:
-                    break
-            except Exception as e:
-                logger.error(f"Parse Error for {flat_search}: {e}")
-        return update
+    def _recovery_handler(self, handler: callable, draft_type: int) -> callable:
+        """
+        RECOVERY MODE: If the app restarts mid-draft and misses EventJoin,
+        infer the draft type from the first active log event that parses.
+        """
+
+        def _handle(line):
+            if not handler(line):
+                return False
+            self.draft_type = draft_type
+            if draft_type != constants.LIMITED_TYPE_SEALED:
+                self.number_of_players = 8
+            return True
+
+        return _handle
 
     def _process_pack_data(
         self,
@@ -633,7 +971,7 @@ class ArenaScanner:
 
             # Record History
             self._record_pack(pack, pick, pack_cards)
-            self._save_state()
+            self._save_state("initial_pack", "pack_cards", "draft_history")
 
         return is_new_high_watermark
 
@@ -704,7 +1042,7 @@ class ArenaScanner:
             ):
                 self.current_pack, self.current_pick = pack, pick
 
-            self._save_state()
+            self._save_state("picked_cards", "taken_cards")
         return True
 
     def _check_and_wipe_stale_pool(self, pack, pick, current_cards, draft_id=None):
@@ -754,6 +1092,7 @@ class ArenaScanner:
                     wipe = True
 
         if wipe:
+            self._state_version += 1
             logger.info(
                 f"Stale Pool Wiped. Trigger: Pack {pack} Pick {pick} vs Current P{self.current_pack}P{self.current_pick}"
             )
@@ -778,311 +1117,309 @@ class ArenaScanner:
     # =========================================================================
 
     def draft_data_search(self):
-        update = False
-        changes = self.__perform_search_logic()
-
-        is_unknown = False
-        with self.lock:
-            is_unknown = self.draft_type == constants.LIMITED_TYPE_UNKNOWN
-
-        if is_unknown:
-            self.draft_start_search()
-
-        with self.lock:
-            if changes:
-                update = True
-
-        return update
-
-    def __perform_search_logic(self):
-        """Dispatches log scanning safely lock-free."""
+        """
+        Runs every pack/pick/pool parser for the active draft type in a single pass.
+        While the draft type is unknown the draft-start route rides along in the same pass.
+        """
         with self.lock:
             pk, pi = self.current_pack, self.current_pick
             pp = self.current_picked_pick
+            is_unknown = self.draft_type == constants.LIMITED_TYPE_UNKNOWN
 
-        explicit_update = False
+        if is_unknown and not self._check_log_rotation():
+            return False
 
-        # RECOVERY MODE: If the app restarts mid-draft and misses EventJoin,
-        # infer the draft type from the active log events.
-        if self.draft_type == constants.LIMITED_TYPE_UNKNOWN:
-            if self._search_pack_notify() or self._search_pick_human():
-                self.draft_type = constants.LIMITED_TYPE_DRAFT_PREMIER_V2
-                self.number_of_players = 8
-                explicit_update = True
-            elif self._search_pack_bot() or self._search_pick_bot():
-                self.draft_type = constants.LIMITED_TYPE_DRAFT_QUICK
-                self.number_of_players = 8
-                explicit_update = True
-            elif self._search_card_pool():
-                self.draft_type = constants.LIMITED_TYPE_SEALED
-                explicit_update = True
-
-        if self.draft_type == constants.LIMITED_TYPE_DRAFT_PREMIER_V1:
-            explicit_update |= self._search_pick_v1()
-            explicit_update |= self._search_pack_notify()
-            explicit_update |= self._search_card_pool()
-        elif self.draft_type in [
-            constants.LIMITED_TYPE_DRAFT_PREMIER_V2,
-            constants.LIMITED_TYPE_DRAFT_PICK_TWO,
-            constants.LIMITED_TYPE_DRAFT_TRADITIONAL,
-            constants.LIMITED_TYPE_DRAFT_PICK_TWO_TRAD,
-        ]:
-            explicit_update |= self._search_pick_human()
-            explicit_update |= self._search_pack_notify()
-            explicit_update |= self._search_card_pool()
-        elif self.draft_type in [
-            constants.LIMITED_TYPE_DRAFT_QUICK,
-            constants.LIMITED_TYPE_DRAFT_PICK_TWO_QUICK,
-        ]:
-            explicit_update |= self._search_pick_bot()
-            explicit_update |= self._search_pack_bot()
-            explicit_update |= self._search_card_pool()
-        elif self.draft_type in [
-            constants.LIMITED_TYPE_SEALED,
-            constants.LIMITED_TYPE_SEALED_TRADITIONAL,
-        ]:
-            explicit_update |= self._search_card_pool()
+        def _routes():
+            routes = self._data_routes()
+            if self.draft_type == constants.LIMITED_TYPE_UNKNOWN:
+                routes += (self._start_route,)
+            return routes
+
+        updated = self._tail_log(_routes)
 
         with self.lock:
             return bool(
                 (pk != self.current_pack)
                 or (pi != self.current_pick)
                 or (pp != self.current_picked_pick)
-                or explicit_update
+                or (updated - {"search_offset"})
             )
 
-    # =========================================================================
-    # MODULAR PARSERS
-    # =========================================================================
-
-    def _search_pack_notify(self) -> bool:
-        def _extract(data):
-            cards_raw = json_find("PackCards", data)
-            if not cards_raw:
-                return False
-
-            p_val = json_find("SelfPack", data)
-            pi_val = json_find("SelfPick", data)
-            pack = int(p_val) if p_val is not None else 0
-            pick = int(pi_val) if pi_val is not None else 0
-
-            draft_id = json_find("DraftId", data)
-            if draft_id is None:
-                draft_id = json_find("draftId", data)
+    def _build_routes(self):
+        """Registers every parser with the tailer, grouped by the draft types that use it."""
+        pack_notify = LogRoute(
+            "pack_offset",
+            (constants.DRAFT_PACK_STRING_PREMIER,),
+            self._payload_handler(self._extract_pack_notify, PACK_NOTIFY_KEYS),
+        )
+        pick_human = LogRoute(
+            "pick_offset",
+            (constants.DRAFT_PICK_STRING_PREMIER,),
+            self._payload_handler(self._extract_pick_human, PICK_HUMAN_KEYS),
+        )
+        pick_v1 = LogRoute(
+            "pick_offset",
+            (constants.DRAFT_PICK_STRING_PREMIER_OLD,),
+            self._payload_handler(self._extract_pick_v1, PICK_V1_KEYS),
+        )
+        pack_bot = LogRoute(
+            "pack_offset",
+            (constants.DRAFT_PACK_STRING_QUICK,),
+            self._payload_handler(self._extract_pack_bot, PACK_BOT_KEYS),
+        )
+        pick_bot = LogRoute(
+            "pick_offset",
+            (constants.DRAFT_PICK_STRING_QUICK,),
+            self._payload_handler(self._extract_pick_bot, PICK_BOT_KEYS),
+        )
+        card_pool = LogRoute(
+            "pool_offset",
+            ('"CardPool":[',),
+            self._payload_handler(self._extract_card_pool),
+            single_step=False,
+        )
 
-            pack_cards = (
-                [str(c) for c in cards_raw]
-                if isinstance(cards_raw, list)
-                else str(cards_raw).split(",")
+        def _recover(route, draft_type):
+            return LogRoute(
+                route.offset_attr,
+                route.search_strings,
+                self._recovery_handler(route.handler, draft_type),
+                route.single_step,
             )
 
-            return self._process_pack_data(
-                pack=pack,
-                pick=pick,
-                pack_cards=pack_cards,
-                draft_id=str(draft_id) if draft_id else "",
-            )
+        premier = (pick_human, pack_notify, card_pool)
+        quick = (pick_bot, pack_bot, card_pool)
+        sealed = (card_pool,)
 
-        return self._parse_events(
-            "pack_offset", [constants.DRAFT_PACK_STRING_PREMIER], _extract
+        self._start_route = LogRoute(
+            "search_offset",
+            tuple(constants.DRAFT_START_STRINGS) + ("InternalEventName",),
+            self._handle_draft_start,
+            single_step=False,
         )
+        all_routes = (self._start_route,) + premier + quick + (pick_v1,)
+        self._prefilter_tokens = sorted(
+            {_prefilter_token(p) for r in all_routes for p in r.search_strings}
+        )
+        self._routes_by_type = {
+            constants.LIMITED_TYPE_UNKNOWN: (
+                _recover(pack_notify, constants.LIMITED_TYPE_DRAFT_PREMIER_V2),
+                _recover(pick_human, constants.LIMITED_TYPE_DRAFT_PREMIER_V2),
+                _recover(pack_bot, constants.LIMITED_TYPE_DRAFT_QUICK),
+                _recover(pick_bot, constants.LIMITED_TYPE_DRAFT_QUICK),
+                _recover(card_pool, constants.LIMITED_TYPE_SEALED),
+            ),
+            constants.LIMITED_TYPE_DRAFT_PREMIER_V1: (pick_v1, pack_notify, card_pool),
+            constants.LIMITED_TYPE_DRAFT_PREMIER_V2: premier,
+            constants.LIMITED_TYPE_DRAFT_PICK_TWO: premier,
+            constants.LIMITED_TYPE_DRAFT_TRADITIONAL: premier,
+            constants.LIMITED_TYPE_DRAFT_PICK_TWO_TRAD: premier,
+            constants.LIMITED_TYPE_DRAFT_QUICK: quick,
+            constants.LIMITED_TYPE_DRAFT_PICK_TWO_QUICK: quick,
+            constants.LIMITED_TYPE_SEALED: sealed,
+            constants.LIMITED_TYPE_SEALED_TRADITIONAL: sealed,
+        }
+
+    def _data_routes(self) -> tuple:
+        """Returns the pack/pick/pool routes registered for the current draft type."""
+        return self._routes_by_type.get(self.draft_type, ())
 
-    def _search_pick_human(self) -> bool:
-        def _extract(data):
-            grp_ids = json_find("GrpIds", data)
-            if grp_ids is None:
-                grp_ids = json_find("cardIds", data)
+    # =========================================================================
+    # MODULAR PARSERS
+    # =========================================================================
 
-            if grp_ids is not None and isinstance(grp_ids, list):
-                cards = [str(x) for x in grp_ids if str(x) != "0"]
-            else:
-                grp_id = json_find("GrpId", data)
-                if grp_id is None:
-                    grp_id = json_find("cardId", data)
-                if grp_id is None:
-                    grp_id = json_find("PickGrpId", data)
-                cards = (
-                    [str(grp_id)] if grp_id is not None and str(grp_id) != "0" else []
-                )
+    def _extract_pack_notify(self, data) -> bool:
+        cards_raw = data.get("PackCards")
+        if not cards_raw:
+            return False
 
-            if not cards:
-                return False
+        p_val = data.get("SelfPack")
+        pi_val = data.get("SelfPick")
+        pack = int(p_val) if p_val is not None else 0
+        pick = int(pi_val) if pi_val is not None else 0
 
-            p_val = json_find("Pack", data)
-            if p_val is None:
-                p_val = json_find("packNumber", data)
-            pi_val = json_find("Pick", data)
-            if pi_val is None:
-                pi_val = json_find("pickNumber", data)
-
-            pack = int(p_val) if p_val is not None else 0
-            pick = int(pi_val) if pi_val is not None else 0
-
-            draft_id = json_find("DraftId", data)
-            if draft_id is None:
-                draft_id = json_find("draftId", data)
-
-            return self._process_pick_data(
-                pack=pack,
-                pick=pick,
-                cards=cards,
-                draft_id=str(draft_id) if draft_id else "",
-            )
+        draft_id = data.get("DraftId")
+        if draft_id is None:
+            draft_id = data.get("draftId")
 
-        return self._parse_events(
-            "pick_offset", [constants.DRAFT_PICK_STRING_PREMIER], _extract
+        pack_cards = (
+            [str(c) for c in cards_raw]
+            if isinstance(cards_raw, list)
+            else str(cards_raw).split(",")
         )
 
-    def _search_pick_v1(self) -> bool:
-        def _extract(data):
-            p_val = json_find("Pack", data)
-            pi_val = json_find("Pick", data)
-            pack = int(p_val) if p_val is not None else 0
-            pick = int(pi_val) if pi_val is not None else 0
+        return self._process_pack_data(
+            pack=pack,
+            pick=pick,
+            pack_cards=pack_cards,
+            draft_id=str(draft_id) if draft_id else "",
+        )
 
-            grp_id = json_find("GrpId", data)
+    def _extract_pick_human(self, data) -> bool:
+        grp_ids = data.get("GrpIds")
+        if grp_ids is None:
+            grp_ids = data.get("cardIds")
+
+        if grp_ids is not None and isinstance(grp_ids, list):
+            cards = [str(x) for x in grp_ids if str(x) != "0"]
+        else:
+            grp_id = data.get("GrpId")
+            if grp_id is None:
+                grp_id = data.get("cardId")
+            if grp_id is None:
+                grp_id = data.get("PickGrpId")
             cards = [str(grp_id)] if grp_id is not None and str(grp_id) != "0" else []
-            if not cards:
-                return False
-
-            draft_id = json_find("DraftId", data)
-            if draft_id is None:
-                draft_id = json_find("draftId", data)
 
-            return self._process_pick_data(
-                pack=pack,
-                pick=pick,
-                cards=cards,
-                draft_id=str(draft_id) if draft_id else "",
-            )
+        if not cards:
+            return False
 
-        return self._parse_events(
-            "pick_offset", [constants.DRAFT_PICK_STRING_PREMIER_OLD], _extract
+        p_val = data.get("Pack")
+        if p_val is None:
+            p_val = data.get("packNumber")
+        pi_val = data.get("Pick")
+        if pi_val is None:
+            pi_val = data.get("pickNumber")
+
+        pack = int(p_val) if p_val is not None else 0
+        pick = int(pi_val) if pi_val is not None else 0
+
+        draft_id = data.get("DraftId")
+        if draft_id is None:
+            draft_id = data.get("draftId")
+
+        return self._process_pick_data(
+            pack=pack,
+            pick=pick,
+            cards=cards,
+            draft_id=str(draft_id) if draft_id else "",
         )
 
-    def _search_pack_bot(self) -> bool:
-        def _extract(data):
-            if json_find("DraftStatus", data) != "PickNext":
-                return False
-            cards = json_find("DraftPack", data)
-            if not cards:
-                return False
+    def _extract_pick_v1(self, data) -> bool:
+        p_val = data.get("Pack")
+        pi_val = data.get("Pick")
+        pack = int(p_val) if p_val is not None else 0
+        pick = int(pi_val) if pi_val is not None else 0
 
-            p_val = json_find("PackNumber", data)
-            pi_val = json_find("PickNumber", data)
-            # Bot drafts are 0-indexed! So we add 1.
-            pack = int(p_val) + 1 if p_val is not None else 1
-            pick = int(pi_val) + 1 if pi_val is not None else 1
+        grp_id = data.get("GrpId")
+        cards = [str(grp_id)] if grp_id is not None and str(grp_id) != "0" else []
+        if not cards:
+            return False
 
-            pack_cards = (
-                [str(c) for c in cards]
-                if isinstance(cards, list)
-                else str(cards).split(",")
-            )
-            changed = self._process_pack_data(pack, pick, pack_cards)
-
-            # Quick draft explicit taken cards sync
-            picked = json_find("PickedCards", data)
-            if picked:
-                picked_list = (
-                    [str(c) for c in picked]
-                    if isinstance(picked, list)
-                    else str(picked).split(",")
-                )
-                if len(picked_list) > len(self.taken_cards):
-                    self.taken_cards = picked_list
-                    self.picked_cards[0] = self.taken_cards
-                    changed = True
-            return changed
+        draft_id = data.get("DraftId")
+        if draft_id is None:
+            draft_id = data.get("draftId")
 
-        return self._parse_events(
-            "pack_offset", [constants.DRAFT_PACK_STRING_QUICK], _extract
+        return self._process_pick_data(
+            pack=pack,
+            pick=pick,
+            cards=cards,
+            draft_id=str(draft_id) if draft_id else "",
         )
 
-    def _search_pick_bot(self) -> bool:
-        def _extract(data):
-            cids = json_find("CardIds", data)
-            if cids is None:
-                cids = json_find("cardIds", data)
-
-            if cids is not None and isinstance(cids, list):
-                cards = [str(x) for x in cids if str(x) != "0"]
-            else:
-                cid = json_find("CardId", data)
-                if cid is None:
-                    cid = json_find("cardId", data)
-                cards = [str(cid)] if cid is not None and str(cid) != "0" else []
-
-            if not cards:
-                return False
+    def _extract_pack_bot(self, data) -> bool:
+        if data.get("DraftStatus") != "PickNext":
+            return False
+        cards = data.get("DraftPack")
+        if not cards:
+            return False
 
-            p_val = json_find("PackNumber", data)
-            pi_val = json_find("PickNumber", data)
-            pack = int(p_val) + 1 if p_val is not None else 1
-            pick = int(pi_val) + 1 if pi_val is not None else 1
+        p_val = data.get("PackNumber")
+        pi_val = data.get("PickNumber")
+        # Bot drafts are 0-indexed! So we add 1.
+        pack = int(p_val) + 1 if p_val is not None else 1
+        pick = int(pi_val) + 1 if pi_val is not None else 1
 
-            return self._process_pick_data(
-                pack=pack,
-                pick=pick,
-                cards=cards,
+        pack_cards = (
+            [str(c) for c in cards]
+            if isinstance(cards, list)
+            else str(cards).split(",")
+        )
+        changed = self._process_pack_data(pack, pick, pack_cards)
+
+        # Quick draft explicit taken cards sync
+        picked = data.get("PickedCards")
+        if picked:
+            picked_list = (
+                [str(c) for c in picked]
+                if isinstance(picked, list)
+                else str(picked).split(",")
             )
+            if len(picked_list) > len(self.taken_cards):
+                with self.lock:
+                    self.taken_cards = picked_list
+                    self.picked_cards[0] = self.taken_cards
+                    self._save_state()
+                changed = True
+        return changed
+
+    def _extract_pick_bot(self, data) -> bool:
+        cids = data.get("CardIds")
+        if cids is None:
+            cids = data.get("cardIds")
+
+        if cids is not None and isinstance(cids, list):
+            cards = [str(x) for x in cids if str(x) != "0"]
+        else:
+            cid = data.get("CardId")
+            if cid is None:
+                cid = data.get("cardId")
+            cards = [str(cid)] if cid is not None and str(cid) != "0" else []
+
+        if not cards:
+            return False
+
+        p_val = data.get("PackNumber")
+        pi_val = data.get("PickNumber")
+        pack = int(p_val) + 1 if p_val is not None else 1
+        pick = int(pi_val) + 1 if pi_val is not None else 1
 
-        return self._parse_events(
-            "pick_offset", [constants.DRAFT_PICK_STRING_QUICK], _extract
+        return self._process_pick_data(
+            pack=pack,
+            pick=pick,
+            cards=cards,
         )
 
-    def _search_card_pool(self):
-        update = False
-        for payload in self._scan_log_for_events("pool_offset", ['"CardPool":[']):
-            try:
-                data = process_json(payload)
-                if not data:
-                    continue
-                pool = []
+    def _extract_card_pool(self, data) -> bool:
+        pool = []
 
-                with self.lock:
-                    current_event_string = self.event_string
-
-                # Check root first
-                if "CardPool" in data and "InternalEventName" in data:
-                    detected_event_name = data.get("InternalEventName")
-                    if (
-                        not current_event_string
-                        or detected_event_name == current_event_string
-                    ):
-                        pool.extend(data.get("CardPool", []))
-                else:
-                    course = data.get("Course", data.get("Courses", {}))
-                    if isinstance(course, list):
-                        for c in course:
-                            name = c.get("InternalEventName")
-                            if not current_event_string or name == current_event_string:
-                                detected_event_name = name
-                                pool.extend(c.get("CardPool", []))
-                                break
-                    elif isinstance(course, dict):
-                        name = course.get("InternalEventName")
-                        if not current_event_string or name == current_event_string:
-                            detected_event_name = name
-                            pool.extend(course.get("CardPool", []))
-
-                # RECOVERY: If we found a pool but didn't have an event registered, register it now
-                if pool and not current_event_string and detected_event_name:
-                    dummy_payload = {"EventName": detected_event_name}
-                    self.__check_event(dummy_payload)
-
-                if pool:
-                    pool_strs = [str(x) for x in pool]
-                    with self.lock:
-                        if not self.taken_cards or sorted(self.taken_cards) != sorted(
-                            pool_strs
-                        ):
-                            self.taken_cards = pool_strs
-                            self._save_state()
-                            update = True
-            except Exception as e:
-                logger.error(f"Card Pool Search Error: {e}")
-        return update
+        with self.lock:
+            current_event_string = self.event_string
+
+        # Check root first
+        if "CardPool" in data and "InternalEventName" in data:
+            detected_event_name = data.get("InternalEventName")
+            if not current_event_string or detected_event_name == current_event_string:
+                pool.extend(data.get("CardPool", []))
+        else:
+            course = data.get("Course", data.get("Courses", {}))
+            if isinstance(course, list):
+                for c in course:
+                    name = c.get("InternalEventName")
+                    if not current_event_string or name == current_event_string:
+                        detected_event_name = name
+                        pool.extend(c.get("CardPool", []))
+                        break
+            elif isinstance(course, dict):
+                name = course.get("InternalEventName")
+                if not current_event_string or name == current_event_string:
+                    detected_event_name = name
+                    pool.extend(course.get("CardPool", []))
+
+        # RECOVERY: If we found a pool but didn't have an event registered, register it now
+        if pool and not current_event_string and detected_event_name:
+            dummy_payload = {"EventName": detected_event_name}
+            self.__check_event(dummy_payload)
+
+        if pool:
+            pool_strs = [str(x) for x in pool]
+            with self.lock:
+                if not self.taken_cards or sorted(self.taken_cards) != sorted(
+                    pool_strs
+                ):
+                    self.taken_cards = pool_strs
+                    self._save_state()
+                    return True
+        return False
 
     # =========================================================================
     # DATA RETRIEVAL
@@ -1124,20 +1461,58 @@ class ArenaScanner:
             logger.error(error)
         return data_sources if data_sources else constants.DATA_SOURCES_NONE
 
-    def retrieve_set_data(self, file):
+    def _new_dataset(self) -> Dataset:
+        return Dataset(self.set_data._retrieve_unknown, self.set_data.db_path)
+
+    def load_set_data(self, file):
+        """
+        Opens a dataset into a staging Dataset without touching the active one or
+        taking the scanner lock. Returns (result, dataset, metrics) for
+        install_set_data.
+        """
+        cached = self.dataset_cache.get(file)
+        if cached is not None:
+            return (Result.VALID, *cached)
+        set_data = self._new_dataset()
+        result = set_data.open_file(file)
+        if result == Result.VALID and set_data._table is None:
+            # A first open decodes the JSON and compiles it; cache the compiled copy,
+            # which is a fraction of the decoded dicts' size
+            compiled = self._new_dataset()
+            if compiled.open_file(file) == Result.VALID and compiled._table is not None:
+                set_data = compiled
+        if result == Result.VALID:
+            metrics = load_set_metrics(set_data, file)
+            self.dataset_cache.put(file, set_data, metrics)
+        else:
+            metrics = SetMetrics(set_data)
+        return result, set_data, metrics
+
+    def install_set_data(self, set_data, metrics):
+        """Swaps a loaded dataset and its metrics in as the active pair."""
         with self.lock:
-            self.set_data.clear()
-            result = self.set_data.open_file(file)
-            self._metrics_cache = SetMetrics(self.set_data)
-            return result
+            self.set_data = set_data
+            self._metrics_cache = metrics
+
+    def retrieve_set_data(self, file):
+        result, set_data, metrics = self.load_set_data(file)
+        self.install_set_data(set_data, metrics)
+        return result
 
     def retrieve_set_metrics(self):
+        # Lock-free once built; retrieve_set_data swaps in a new instance
+        metrics = getattr(self, "_metrics_cache", None)
+        if metrics is not None:
+            return metrics
         with self.lock:
             if not hasattr(self, "_metrics_cache") or self._metrics_cache is None:
                 self._metrics_cache = SetMetrics(self.set_data)
             return self._metrics_cache
 
-    def retrieve_tier_data(self):
+    def retrieve_tier_data(self, snapshot: DraftSnapshot = None):
+        if snapshot is not None:
+            data, _ = self.tier_list.retrieve_data(snapshot.event_set)
+            return data
         with self.lock:
             event_set, _ = self.retrieve_current_limited_event()
             data, _ = self.tier_list.retrieve_data(event_set)
@@ -1170,108 +1545,19 @@ class ArenaScanner:
                 logger.error(error)
             return {v: k for k, v in deck_colors.items()}
 
-    def retrieve_current_picked_cards(self):
-        with self.lock:
-            if self.current_pick == 0:
-                return []
-
-            expected_players = (
-                4
-                if self.draft_type
-                in [
-                    constants.LIMITED_TYPE_DRAFT_PICK_TWO,
-                    constants.LIMITED_TYPE_DRAFT_PICK_TWO_TRAD,
-                    constants.LIMITED_TYPE_DRAFT_PICK_TWO_QUICK,
-                ]
-                else 8
-            )
-
-            pack_index = (self.current_pick - 1) % expected_players
-            if pack_index < len(self.picked_cards):
-                return self.set_data.get_data_by_id(self.picked_cards[pack_index])
-            return []
-
-    def retrieve_current_missing_cards(self):
-        with self.lock:
-            try:
-                expected_players = (
-                    4
-                    if self.draft_type
-                    in [
-                        constants.LIMITED_TYPE_DRAFT_PICK_TWO,
-                        constants.LIMITED_TYPE_DRAFT_PICK_TWO_TRAD,
-                        constants.LIMITED_TYPE_DRAFT_PICK_TWO_QUICK,
-                    ]
-                    else 8
-                )
-
-                pack_index = (self.current_pick - 1) % expected_players
-                if pack_index < len(self.pack_cards) and pack_index < len(
-                    self.initial_pack
-                ):
-                    card_list = [
-                        x
-                        for x in self.initial_pack[pack_index]
-                        if x not in self.pack_cards[pack_index]
-                    ]
-                    return self.set_data.get_data_by_id(card_list)
-            except Exception as error:
-                logger.error(error)
-            return []
-
-    def retrieve_current_pack_cards(self):
-        with self.lock:
-            if self.current_pick == 0:
-                return []
-
-            expected_players = (
-                4
-                if self.draft_type
-                in [
-                    constants.LIMITED_TYPE_DRAFT_PICK_TWO,
-                    constants.LIMITED_TYPE_DRAFT_PICK_TWO_TRAD,
-                    constants.LIMITED_TYPE_DRAFT_PICK_TWO_QUICK,
-                ]
-                else 8
-            )
-
-            pack_index = (self.current_pick - 1) % expected_players
-            if pack_index < len(self.pack_cards):
-                # We return copies of the card dicts so the UI can mutate them (e.g. for display names)
-                raw_cards = self.set_data.get_data_by_id(self.pack_cards[pack_index])
-                pack_cards = []
+    def retrieve_current_picked_cards(self, snapshot: DraftSnapshot = None):
+        # Card lookups may open the Arena database, so they run outside the lock
+        return self._resolve_snapshot(snapshot).picked_cards(self.set_data)
 
-                # WHEEL PREDICTION: Cross-reference initial_pack slots to see which cards might come back.
-                rotation_size = expected_players
-
-                returnable_picks_by_name = {}
-                for i, slot_ids in enumerate(self.initial_pack):
-                    if i == pack_index or not slot_ids:
-                        continue
-                    # A pack from slot i wheels back at pick (i+1) + rotation_size
-                    return_pick = (i + 1) + rotation_size
-                    if return_pick > self.current_pick:
-                        picked_from_slot = set(
-                            self.picked_cards[i] if i < len(self.picked_cards) else []
-                        )
-                        remaining_ids = [
-                            cid for cid in slot_ids if cid not in picked_from_slot
-                        ]
-                        for name in self.set_data.get_names_by_id(remaining_ids):
-                            returnable_picks_by_name.setdefault(name, []).append(
-                                return_pick
-                            )
-
-                for card in raw_cards:
-                    card_copy = dict(card)
-                    name = card.get(constants.DATA_FIELD_NAME, "")
-                    card_copy["returnable_at"] = sorted(
-                        returnable_picks_by_name.get(name, [])
-                    )
-                    pack_cards.append(card_copy)
+    def retrieve_current_missing_cards(self, snapshot: DraftSnapshot = None):
+        try:
+            return self._resolve_snapshot(snapshot).missing_cards(self.set_data)
+        except Exception as error:
+            logger.error(error)
+        return []
 
-                return pack_cards
-            return []
+    def retrieve_current_pack_cards(self, snapshot: DraftSnapshot = None):
+        return self._resolve_snapshot(snapshot).pack_cards(self.set_data)
 
     @property
     def cards_per_pick(self):
@@ -1284,15 +1570,23 @@ class ArenaScanner:
             return 2
         return 1
 
-    def retrieve_taken_cards(self):
-        with self.lock:
-            return self.set_data.get_data_by_id(self.taken_cards)
-
-    def retrieve_current_pack_and_pick(self):
+    def retrieve_taken_cards(self, snapshot: DraftSnapshot = None):
+        if snapshot is None:
+            with self.lock:
+                taken_cards = list(self.taken_cards)
+        else:
+            taken_cards = list(snapshot.taken_ids)
+        return self.set_data.get_data_by_id(taken_cards)
+
+    def retrieve_current_pack_and_pick(self, snapshot: DraftSnapshot = None):
+        if snapshot is not None:
+            return snapshot.current_pack, snapshot.current_pick
         with self.lock:
             return self.current_pack, self.current_pick
 
-    def retrieve_current_limited_event(self):
+    def retrieve_current_limited_event(self, snapshot: DraftSnapshot = None):
+        if snapshot is not None:
+            return snapshot.event_set, snapshot.event_label
         with self.lock:
             return (self.draft_sets[0] if self.draft_sets else ""), self.draft_label
 
@@ -1309,6 +1603,8 @@ class ArenaScanner:
         ):
             self.draft_history.append({"Pack": pack, "Pick": pick, "Cards": card_ids})
 
-    def retrieve_draft_history(self):
+    def retrieve_draft_history(self, snapshot: DraftSnapshot = None):
+        if snapshot is not None:
+            return list(snapshot.history)
         with self.lock:
             return self.draft_history
@@ -0,0 +1,364 @@
+"""
+src/replay.py
+
+Deterministic log replay harness. Appends the lines of a recorded Player.log or
+DraftLog_*.log to a scratch Player.log on a fixed schedule (recorded time scaled by
+a speed factor, or as fast as possible), drives a headless DraftOrchestrator
+against it and records, for every pack/pick line, when it was written, when
+check_for_updates consumed it, when the REFRESH message was queued and when the
+dashboard view model was built from it.
+"""
+
+import os
+import re
+import time
+import queue
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+import src.constants as constants
+from src.configuration import Configuration
+from src.log_scanner import ArenaScanner
+from src.ui.orchestrator import DraftOrchestrator
+from src.logger import create_logger
+from src.utils import parse_log_time
+
+logger = create_logger()
+
+# Lines that carry a pack or a pick; each one becomes a latency sample
+PICK_EVENT_STRINGS = (
+    constants.DRAFT_PACK_STRING_PREMIER,
+    constants.DRAFT_PICK_STRING_PREMIER,
+    constants.DRAFT_PICK_STRING_PREMIER_OLD,
+    constants.DRAFT_PACK_STRING_QUICK,
+    constants.DRAFT_PICK_STRING_QUICK,
+)
+
+# Keywords copied when only the draft lines of a full Player.log are replayed
+DRAFT_ONLY_KEYWORDS = (
+    "Event_Join",
+    "CardsInPack",
+    "Draft.Notify",
+    "Event_PlayerDraftMakePick",
+    "BotDraft",
+)
+
+# (label, start attribute, end attribute) for each reported interval
+LATENCY_STAGES = (
+    ("detect", "written", "detected"),
+    ("queue", "detected", "queued"),
+    ("render", "queued", "rendered"),
+    ("total", "written", "rendered"),
+)
+LATENCY_PERCENTILES = (50, 95, 99)
+
+# Player.log: "[UnityCrossThreadLogger]4/16/2024 10:00:00 AM"
+# DraftLog:   "<16042024 10:00:00>,[UnityCrossThreadLogger]..."
+_PLAYER_LOG_TIMESTAMP = re.compile(
+    r"^\[UnityCrossThreadLogger\](\d{1,4}[/.-]\d{1,2}[/.-]\d{1,4}[ T]"
+    r"\d{1,2}:\d{2}:\d{2}(?: [AP]M)?)"
+)
+_DRAFT_LOG_TIMESTAMP = re.compile(r"^<(\d{8} \d{2}:\d{2}:\d{2})>,")
+
+
+def parse_timestamp(line: str) -> Optional[float]:
+    """Returns the recorded time of a log line in epoch seconds, if it has one."""
+    match = _DRAFT_LOG_TIMESTAMP.match(line)
+    if match:
+        try:
+            return datetime.strptime(match.group(1), "%d%m%Y %H:%M:%S").timestamp()
+        except ValueError:
+            return None
+
+    match = _PLAYER_LOG_TIMESTAMP.match(line)
+    if match:
+        return parse_log_time(match.group(1))
+    return None
+
+
+def read_replay_lines(
+    source_log: str, draft_only: bool = False
+) -> List[Tuple[Optional[float], str]]:
+    """
+    Returns (recorded time, line) pairs. Player.log stamps a timestamp line ahead
+    of the entries it covers, so the last seen time is carried forward.
+    """
+    lines = []
+    last_time = None
+    with open(source_log, "r", encoding="utf-8", errors="replace") as source:
+        for line in source:
+            timestamp = parse_timestamp(line)
+            if timestamp is not None:
+                last_time = timestamp
+            if draft_only and not any(k in line for k in DRAFT_ONLY_KEYWORDS):
+                continue
+            if not line.endswith("\n"):
+                line += "\n"
+            lines.append((last_time, line))
+    return lines
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    return float(np.percentile(values, pct)) if values else None
+
+
+@dataclass
+class PickSample:
+    """Timeline of one pack/pick line, in time.perf_counter() seconds."""
+
+    label: str
+    end_offset: int
+    written: float
+    detected: Optional[float] = None
+    queued: Optional[float] = None
+    rendered: Optional[float] = None
+
+
+@dataclass
+class ReplayReport:
+    source_log: str
+    speed: float
+    lines: int
+    elapsed: float
+    samples: List[PickSample] = field(default_factory=list)
+    lock_stats: dict = field(default_factory=dict)
+
+    def latencies(self, start: str, end: str) -> List[float]:
+        """Milliseconds between two stages for every sample that reached both."""
+        return [
+            (getattr(s, end) - getattr(s, start)) * 1000
+            for s in self.samples
+            if getattr(s, start) is not None and getattr(s, end) is not None
+        ]
+
+    def summary(self) -> dict:
+        summary = {}
+        for label, start, end in LATENCY_STAGES:
+            values = self.latencies(start, end)
+            summary[label] = {
+                "count": len(values),
+                **{f"p{p}": percentile(values, p) for p in LATENCY_PERCENTILES},
+                "max": max(values) if values else None,
+            }
+        return summary
+
+    def to_dict(self) -> dict:
+        return {
+            "source_log": self.source_log,
+            "speed": self.speed,
+            "lines": self.lines,
+            "elapsed": self.elapsed,
+            "picks": len(self.samples),
+            "rendered": sum(1 for s in self.samples if s.rendered is not None),
+            "latency_ms": self.summary(),
+            "scanner_lock": self.lock_stats,
+        }
+
+    def format(self) -> str:
+        rows = [
+            f"{os.path.basename(self.source_log)}: {self.lines} lines, "
+            f"{len(self.samples)} pack/pick events, {self.elapsed:.2f}s",
+            f"{'stage':>8} {'count':>6} "
+            + " ".join(f"{f'p{p} ms':>9}" for p in LATENCY_PERCENTILES)
+            + f" {'max ms':>9}",
+        ]
+        for label, stats in self.summary().items():
+            values = [stats[f"p{p}"] for p in LATENCY_PERCENTILES] + [stats["max"]]
+            rows.append(
+                f"{label:>8} {stats['count']:>6} "
+                + " ".join(
+                    f"{v:>9.2f}" if v is not None else f"{'-':>9}" for v in values
+                )
+            )
+        if self.lock_stats:
+            rows.append(
+                f"scanner.lock: {self.lock_stats['acquisitions']} acquisitions, "
+                f"{self.lock_stats['contended']} waited "
+                f"({self.lock_stats['wait_ms']:.2f} ms total, "
+                f"{self.lock_stats['max_wait_ms']:.2f} ms max), "
+                f"{self.lock_stats['busy']} busy try-acquires"
+            )
+        return "\n".join(rows)
+
+
+class LogReplayer:
+    """
+    Replays a recorded log through a real ArenaScanner + DraftOrchestrator pair.
+
+    speed: 0 writes as fast as possible, 1 keeps the recorded pacing and N replays
+    N times faster. Recorded gaps are capped at max_gap seconds before scaling.
+    """
+
+    def __init__(
+        self,
+        source_log: str,
+        set_list,
+        speed: float = 0.0,
+        max_gap: float = 5.0,
+        sets_location: str = constants.SETS_FOLDER,
+        draft_only: bool = False,
+        target_log: str = None,
+        scan_mode: str = constants.LOG_SCAN_MODE_DEFAULT,
+        settle_timeout: float = 10.0,
+    ):
+        self.source_log = source_log
+        self.set_list = set_list
+        self.speed = speed
+        self.max_gap = max_gap
+        self.sets_location = sets_location
+        self.draft_only = draft_only
+        self.target_log = target_log
+        self.scan_mode = scan_mode
+        self.settle_timeout = settle_timeout
+
+        self.samples: List[PickSample] = []
+        self._samples_lock = threading.Lock()
+        self.orchestrator = None
+
+    def run(self) -> ReplayReport:
+        lines = read_replay_lines(self.source_log, self.draft_only)
+        work_dir = tempfile.mkdtemp(prefix="replay_")
+        target_log = self.target_log or os.path.join(work_dir, "Player.log")
+        with open(target_log, "w", encoding="utf-8") as target:
+            target.write("MTG Arena Replay Started\n")
+
+        self.samples = []
+        try:
+            # Keep the draft journal, log index and draft store of the replay out of
+            # the user's Temp
+            scanner = ArenaScanner(
+                target_log,
+                self.set_list,
+                sets_location=self.sets_location,
+                retrieve_unknown=False,
+                scan_mode=self.scan_mode,
+                state_folder=work_dir,
+            )
+            scanner.log_enable(False)
+
+            config = Configuration()
+            config.settings.arena_log_location = target_log
+            self.orchestrator = DraftOrchestrator(
+                scanner,
+                config,
+                None,
+                config_file=os.path.join(work_dir, "config.json"),
+                draft_store_file=os.path.join(
+                    work_dir, constants.DRAFT_STORE_FILE_NAME
+                ),
+            )
+            self._instrument(self.orchestrator)
+            self.orchestrator.set_ui_notifier(self._on_ui_notify)
+            self.orchestrator.start()
+
+            scanner.lock.reset_stats()
+            started = time.perf_counter()
+            self._write_lines(lines, target_log)
+            self._settle()
+            elapsed = time.perf_counter() - started
+            lock_stats = scanner.lock_stats()
+        finally:
+            if self.orchestrator:
+                self.orchestrator.stop()
+                self.orchestrator.join(timeout=self.settle_timeout)
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        return ReplayReport(
+            source_log=self.source_log,
+            speed=self.speed,
+            lines=len(lines),
+            elapsed=elapsed,
+            samples=list(self.samples),
+            lock_stats=lock_stats,
+        )
+
+    def _write_lines(self, lines, target_log):
+        previous_time = None
+        with open(target_log, "ab") as target:
+            for recorded_time, line in lines:
+                if self.speed > 0 and recorded_time is not None:
+                    if previous_time is not None:
+                        gap = min(max(recorded_time - previous_time, 0), self.max_gap)
+                        time.sleep(gap / self.speed)
+                    previous_time = recorded_time
+
+                target.write(line.encode("utf-8"))
+                target.flush()
+                if any(s in line for s in PICK_EVENT_STRINGS):
+                    sample = PickSample(
+                        label=line[:60].strip(),
+                        end_offset=target.tell(),
+                        written=time.perf_counter(),
+                    )
+                    with self._samples_lock:
+                        self.samples.append(sample)
+
+    def _settle(self):
+        """Waits until every written pack/pick reached the view model (or times out)."""
+        deadline = time.perf_counter() + self.settle_timeout
+        while time.perf_counter() < deadline:
+            with self._samples_lock:
+                if all(s.rendered is not None for s in self.samples):
+                    return
+            time.sleep(0.01)
+        logger.info("Replay finished with pack/pick events that never rendered")
+
+    def _instrument(self, orchestrator):
+        scanner = orchestrator.scanner
+        check_for_updates = orchestrator.check_for_updates
+        post = orchestrator._post
+
+        def timed_check_for_updates(force=False):
+            changed = check_for_updates(force)
+            now = time.perf_counter()
+            # Every cursor sits at the end of the bytes the scan consumed
+            consumed = max(
+                scanner.search_offset,
+                scanner.pack_offset,
+                scanner.pick_offset,
+                scanner.pool_offset,
+            )
+            with self._samples_lock:
+                for sample in self.samples:
+                    if sample.detected is None and sample.end_offset <= consumed:
+                        sample.detected = now
+            return changed
+
+        def timed_post(message):
+            if message == "REFRESH":
+                now = time.perf_counter()
+                with self._samples_lock:
+                    for sample in self.samples:
+                        if sample.detected is not None and sample.queued is None:
+                            sample.queued = now
+            post(message)
+
+        orchestrator.check_for_updates = timed_check_for_updates
+        orchestrator._post = timed_post
+
+    def _on_ui_notify(self):
+        """Stands in for the Tk thread: drains the queue and builds the view model."""
+        refresh = False
+        while True:
+            try:
+                refresh |= self.orchestrator.update_queue.get_nowait() == "REFRESH"
+            except queue.Empty:
+                break
+        if not refresh:
+            return
+
+        with self._samples_lock:
+            pending = [
+                s for s in self.samples if s.queued is not None and s.rendered is None
+            ]
+        self.orchestrator.build_view_model()
+        now = time.perf_counter()
+        with self._samples_lock:
+            for sample in pending:
+                sample.rendered = now
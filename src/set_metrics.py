@@ -1,20 +1,93 @@
-import statistics as stats
-from typing import Tuple
+import os
+import json
+import math
+import tempfile
+import warnings
+import numpy as np
+from typing import Optional, Tuple
 from pydantic import BaseModel
+import src.constants as constants
 from src.dataset import Dataset
+from src.card_record import CardRecord
+from src.dataset_catalog import hash_file
+from src.logger import create_logger
+from src.utils import normalize_color_string, get_dataset_catalog
 from src.constants import (
+    CARD_COLORS,
     DECK_COLORS,
     DATA_FIELD_NAME,
     DATA_FIELD_DECK_COLORS,
+    DATA_FIELD_GIHWR,
+    FILTER_OPTION_ALL_DECKS,
     WIN_RATE_OPTIONS,
 )
 
+logger = create_logger()
+
+TEXTURE_TAGS = ["removal", "evasion", "fixing_ramp", "card_advantage"]
+
+# numpy has no erf; this ufunc still calls math.erf once per element, so it only
+# saves building a NormalDist per win rate
+_erf = np.frompyfunc(math.erf, 1, 1)
+
 
 class ColorMetrics(BaseModel):
     mean: float = 0.0
     std: float = 0.0
 
 
+def _stats_matrix(cards: list, archetypes: list, fields: list) -> np.ndarray:
+    """
+    Loads the deck_colors stats of cards into one [card x archetype x field] array,
+    NaN where missing. Records over a compiled dataset are copied straight from its
+    stats array; card dicts are read once each.
+    """
+    matrix = np.full((len(cards), len(archetypes), len(fields)), np.nan)
+    tables, dict_positions, dict_rows = {}, [], []
+    nan = float("nan")
+    for position, card in enumerate(cards):
+        if isinstance(card, CardRecord):
+            table, positions, rows = tables.setdefault(
+                id(card._table), (card._table, [], [])
+            )
+            positions.append(position)
+            rows.append(card._row)
+            continue
+        # Plain lists, converted once: per-element numpy writes are far slower
+        deck_stats = card.get(DATA_FIELD_DECK_COLORS) or {}
+        row = []
+        for archetype in archetypes:
+            color_stats = deck_stats.get(archetype)
+            if not color_stats:
+                row.extend([nan] * len(fields))
+                continue
+            # A None value becomes NaN in the float conversion
+            row.extend([color_stats.get(field, nan) for field in fields])
+        dict_positions.append(position)
+        dict_rows.append(row)
+    if dict_rows:
+        matrix[dict_positions] = np.array(dict_rows, dtype=np.float64).reshape(
+            len(dict_rows), len(archetypes), len(fields)
+        )
+    for table, positions, rows in tables.values():
+        matrix[positions] = table.stats_matrix(rows, archetypes, fields)
+    return matrix
+
+
+def _round_values(values: np.ndarray, digits: int) -> np.ndarray:
+    """
+    round(value, digits) for every value. np.round scales by 10**digits first,
+    which can turn a near tie into an exact one (52.65 to one digit), so the values
+    it changed are redone with round(); values it left alone already have at most
+    digits decimals.
+    """
+    rounded = np.round(values, digits)
+    changed = rounded != values
+    if changed.any():
+        rounded[changed] = [round(value, digits) for value in values[changed].tolist()]
+    return rounded
+
+
 class SetMetrics:
     """
     This class is used to calculate the mean, standard deviation for a MTG set dataset.
@@ -24,8 +97,51 @@ class SetMetrics:
         self._color_metrics: dict = {}
         self._digits: int = digits
         self.format_texture: dict = {}
+        self._cards: list = []
+        self._stats = None
+        self._load_cards(dataset)
         self.generate_metrics(dataset)
         self._build_format_texture(dataset)
+        # Only needed while building
+        self._cards, self._stats = [], None
+
+    def to_dict(self) -> dict:
+        """The computed metrics and format texture, as stored by save_set_metrics."""
+        return {
+            "digits": self._digits,
+            "color_metrics": {
+                field: {color: values.model_dump() for color, values in colors.items()}
+                for field, colors in self._color_metrics.items()
+            },
+            "format_texture": self.format_texture,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SetMetrics":
+        """Rebuilds metrics stored with to_dict without recomputing them."""
+        metrics = cls.__new__(cls)
+        metrics._digits = data["digits"]
+        metrics._cards, metrics._stats = [], None
+        metrics._color_metrics = {
+            field: {color: ColorMetrics(**values) for color, values in colors.items()}
+            for field, colors in data["color_metrics"].items()
+        }
+        metrics.format_texture = data["format_texture"]
+        return metrics
+
+    def _load_cards(self, dataset: Dataset) -> None:
+        """Reads every card's win rates into one stats array in a single pass."""
+        if not dataset:
+            return
+        ratings = dataset.get_card_ratings()
+        if not ratings:
+            return
+        self._cards = dataset.get_records_by_id(list(ratings))
+        self._stats = _stats_matrix(
+            self._cards,
+            [normalize_color_string(color) for color in DECK_COLORS],
+            WIN_RATE_OPTIONS,
+        )
 
     def _build_format_texture(self, dataset: Dataset) -> None:
         """
@@ -42,8 +158,6 @@ class SetMetrics:
         # A card is "playable" if it's within 1 standard deviation of the mean
         playable_threshold = baseline_wr - std
 
-        from src.constants import CARD_COLORS
-
         # Initialize texture map
         self.format_texture = {
             c: {
@@ -56,45 +170,44 @@ class SetMetrics:
             for c in CARD_COLORS
         }
 
-        dataset_dict = dataset.get_card_ratings()
-        if not dataset_dict:
+        if not self._cards:
             return
 
-        for card in dataset_dict.values():
+        gihwr = self._stats[
+            :,
+            DECK_COLORS.index(FILTER_OPTION_ALL_DECKS),
+            WIN_RATE_OPTIONS.index(DATA_FIELD_GIHWR),
+        ]
+        playable = np.nan_to_num(gihwr, nan=0.0) >= playable_threshold
+
+        # [card x color] membership and [card x role] flags, built in one pass
+        card_count = len(self._cards)
+        in_color = np.zeros((card_count, len(CARD_COLORS)), dtype=bool)
+        roles = np.zeros((card_count, len(TEXTURE_TAGS) + 1), dtype=bool)
+        for position, card in enumerate(self._cards):
+            if not playable[position]:
+                continue
             rarity = str(card.get("rarity", "common")).lower()
             if rarity not in ["common", "uncommon"]:
                 continue
-
-            gihwr = float(
-                card.get("deck_colors", {}).get("All Decks", {}).get("gihwr", 0.0)
-            )
-            if gihwr < playable_threshold:
-                continue
-
             colors = card.get("colors", [])
             # Skip colorless or 3+ color cards for raw texture counting to keep it focused on base colors
             if not colors or len(colors) > 2:
                 continue
-
+            for color in colors:
+                if color in CARD_COLORS:
+                    in_color[position, CARD_COLORS.index(color)] = True
             tags = card.get("tags", [])
-            cmc = int(card.get("cmc", 0))
-            types = card.get("types", [])
-
-            is_2_drop = "Creature" in types and cmc <= 2
+            for index, tag in enumerate(TEXTURE_TAGS):
+                roles[position, index] = tag in tags
+            roles[position, -1] = (
+                "Creature" in card.get("types", []) and int(card.get("cmc", 0)) <= 2
+            )
 
-            for color in colors:
-                if color not in self.format_texture:
-                    continue
-                if is_2_drop:
-                    self.format_texture[color]["2-drop"] += 1
-                if "removal" in tags:
-                    self.format_texture[color]["removal"] += 1
-                if "evasion" in tags:
-                    self.format_texture[color]["evasion"] += 1
-                if "fixing_ramp" in tags:
-                    self.format_texture[color]["fixing_ramp"] += 1
-                if "card_advantage" in tags:
-                    self.format_texture[color]["card_advantage"] += 1
+        counts = in_color.T.astype(np.int64) @ roles.astype(np.int64)
+        for color_index, color in enumerate(CARD_COLORS):
+            for index, tag in enumerate(TEXTURE_TAGS + ["2-drop"]):
+                self.format_texture[color][tag] = int(counts[color_index, index])
 
     def get_metrics(self, color: str, field: str) -> Tuple[float, float]:
         """
@@ -108,15 +221,25 @@ class SetMetrics:
 
         return round(mean, self._digits), round(std, self._digits)
 
-    def calculate_percentile(self, winrate: float, colors: str, field: str) -> float:
+    def calculate_percentile(self, winrate, colors: str, field: str):
         """
         Calculate the percentile for a given win rate, color, and field using the cumulative distribution function (CDF) of a normal distribution.
+        Accepts a single win rate or an array of them.
         """
         mean, std = self.get_metrics(colors, field)
+        values = np.asarray(winrate, dtype=np.float64)
 
-        percentile = round(stats.NormalDist(mu=mean, sigma=std).cdf(winrate) * 100, 2)
+        if std > 0:
+            # Same expression as NormalDist.cdf, applied to every win rate at once
+            z = (values - mean) / (std * math.sqrt(2.0))
+            cdf = 0.5 * (1.0 + np.asarray(_erf(z), dtype=np.float64))
+        else:
+            # A zero-width distribution is a step at the mean
+            cdf = np.where(values >= mean, 1.0, 0.0)
 
-        return percentile
+        if cdf.ndim == 0:
+            return round(float(cdf) * 100, 2)
+        return np.round(cdf * 100, 2)
 
     def generate_metrics(self, dataset: Dataset) -> None:
         """
@@ -125,62 +248,119 @@ class SetMetrics:
         if not dataset:
             return
 
-        # Iterate over the supported colors and generate the metrics for each color
-        for field in WIN_RATE_OPTIONS:
-            self._color_metrics[field] = {}
-            for color in DECK_COLORS:
-                self._color_metrics[field][color] = self.generate_color_metrics(
-                    color, field, dataset
-                )
-
-    def generate_color_metrics(
-        self, color: str, field: str, dataset: Dataset
-    ) -> ColorMetrics:
-        """
-        Calculate the mean and standard deviation for a specific color and field
-        """
-        metrics = ColorMetrics()
-
-        processed_cards = set()
-        unique_gihwr = []
-
-        # Use a localized variable to avoid masking the dataset argument
-        dataset_dict = dataset.get_card_ratings()
-
-        if not dataset_dict:
-            return metrics
-
-        from src.utils import normalize_color_string
-
-        std_color = normalize_color_string(color)
-
-        # Iterate over the card list and retrieve the GIHWR for unique cards
-        for card_data in dataset_dict.values():
-            card_name = card_data.get(DATA_FIELD_NAME)
-            if not card_name:
-                continue
-
-            # O(1) hash lookup prevents fatal hangs when processing massive Day 1 datasets
-            if card_name not in processed_cards:
-                processed_cards.add(card_name)
-
-                deck_stats = card_data.get(DATA_FIELD_DECK_COLORS, {})
-                if std_color not in deck_stats:
-                    continue
+        self._color_metrics = {
+            field: {color: ColorMetrics() for color in DECK_COLORS}
+            for field in WIN_RATE_OPTIONS
+        }
+        if not self._cards:
+            return
 
-                color_stats = deck_stats[std_color]
-                if field not in color_stats:
+        # Each card name counts once, using its first record
+        unique_rows, seen = [], set()
+        for position, card in enumerate(self._cards):
+            card_name = card.get(DATA_FIELD_NAME)
+            if card_name and card_name not in seen:
+                seen.add(card_name)
+                unique_rows.append(position)
+
+        values = self._stats[unique_rows]
+        # Only include valid data points to avoid calculating empty metrics
+        valid = ~np.isnan(values) & (values != 0.0)
+        rounded = np.full_like(values, np.nan)
+        rounded[valid] = _round_values(values[valid], self._digits)
+        counts = valid.sum(axis=0)
+        with warnings.catch_warnings():
+            # Archetypes without a single valid value are skipped below
+            warnings.simplefilter("ignore", RuntimeWarning)
+            means = np.nanmean(rounded, axis=0)
+            stds = np.nanstd(rounded, axis=0)
+
+        for color_index, color in enumerate(DECK_COLORS):
+            for field_index, field in enumerate(WIN_RATE_OPTIONS):
+                if not counts[color_index, field_index]:
                     continue
+                self._color_metrics[field][color] = ColorMetrics(
+                    mean=float(means[color_index, field_index]),
+                    std=float(stds[color_index, field_index]),
+                )
 
-                val = color_stats[field]
-                # Only include valid data points to avoid calculating empty metrics
-                if val != 0.0:
-                    unique_gihwr.append(round(val, self._digits))
 
-        if not unique_gihwr:
+def set_metrics_path(file_location: str) -> str:
+    return os.path.join(
+        constants.TEMP_FOLDER,
+        constants.DATASET_COMPILED_FOLDER,
+        os.path.basename(file_location) + constants.SET_METRICS_CACHE_SUFFIX,
+    )
+
+
+def _dataset_hash(file_location: str) -> Optional[str]:
+    """The dataset's content hash, from its folder's catalog when it is current."""
+    entry = get_dataset_catalog(os.path.dirname(file_location)).lookup(
+        os.path.basename(file_location)
+    )
+    if entry and entry.get("hash"):
+        return entry["hash"]
+    try:
+        return hash_file(file_location)
+    except OSError:
+        return None
+
+
+def _read_set_metrics(location: str, content_hash: str, digits: int):
+    try:
+        if not os.path.exists(location):
+            return None
+        with open(location, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if (
+            data.get("version") != constants.SET_METRICS_VERSION
+            or data.get("hash") != content_hash
+            or data.get("metrics", {}).get("digits") != digits
+        ):
+            return None
+        return SetMetrics.from_dict(data["metrics"])
+    except Exception as e:
+        logger.error(f"Failed to read set metrics {location}: {e}")
+        return None
+
+
+def save_set_metrics(metrics: SetMetrics, location: str, content_hash: str):
+    try:
+        dir_name = os.path.dirname(location)
+        if not os.path.exists(dir_name):
+            os.makedirs(dir_name)
+        data = {
+            "version": constants.SET_METRICS_VERSION,
+            "hash": content_hash,
+            "metrics": metrics.to_dict(),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, location)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    except Exception as e:
+        logger.error(f"Failed to write set metrics {location}: {e}")
+
+
+def load_set_metrics(dataset: Dataset, file_location: str, digits: int = 2):
+    """
+    Returns the SetMetrics for a dataset opened from file_location, reading them
+    from the metrics file stored next to its compiled form when that was written
+    for the same file content and metrics version, and computing and storing
+    them otherwise.
+    """
+    location = set_metrics_path(file_location)
+    content_hash = _dataset_hash(file_location)
+    if content_hash is not None:
+        metrics = _read_set_metrics(location, content_hash, digits)
+        if metrics is not None:
             return metrics
-
-        metrics.mean = stats.mean(unique_gihwr)
-        metrics.std = stats.pstdev(unique_gihwr)
-
-        return metrics
+    metrics = SetMetrics(dataset, digits)
+    if content_hash is not None:
+        save_set_metrics(metrics, location, content_hash)
+    return metrics
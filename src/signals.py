@@ -1,5 +1,6 @@
 from src import constants
 from src.card_logic import get_card_colors
+from src.card_record import card_stat
 
 
 class SignalCalculator:
@@ -20,11 +21,12 @@ class SignalCalculator:
 
         for card in pack_cards:
             try:
-                deck_stats = card.get(constants.DATA_FIELD_DECK_COLORS, {}).get(
-                    constants.FILTER_OPTION_ALL_DECKS, {}
+                gihwr = card_stat(
+                    card, constants.FILTER_OPTION_ALL_DECKS, constants.DATA_FIELD_GIHWR
+                )
+                ata = card_stat(
+                    card, constants.FILTER_OPTION_ALL_DECKS, constants.DATA_FIELD_ATA
                 )
-                gihwr = deck_stats.get(constants.DATA_FIELD_GIHWR, 0.0)
-                ata = deck_stats.get(constants.DATA_FIELD_ATA, 0.0)
 
                 if gihwr <= self.baseline_wr or ata == 0.0:
                     continue
@@ -52,7 +54,7 @@ class SignalCalculator:
         If High Quality cards returned -> Open Lane.
         If only trash returned -> Closed Lane.
         """
-        original_cards = dataset.get_data_by_id(original_pack_ids)
+        original_cards = dataset.get_records_by_id(original_pack_ids)
 
         # 1. Sum 'Quality' (WR > Baseline) for P1P1 by color
         p1_quality = {c: 0.0 for c in constants.CARD_COLORS}
@@ -76,8 +78,9 @@ class SignalCalculator:
         return signals
 
     def _add_card_quality(self, card, bucket):
-        stats = card.get("deck_colors", {}).get(constants.FILTER_OPTION_ALL_DECKS, {})
-        wr = float(stats.get(constants.DATA_FIELD_GIHWR, 0.0))
+        wr = card_stat(
+            card, constants.FILTER_OPTION_ALL_DECKS, constants.DATA_FIELD_GIHWR
+        )
         if wr > self.baseline_wr:
             val = wr - self.baseline_wr
             self._distribute_score(card, val, bucket)
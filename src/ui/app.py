@@ -16,7 +16,7 @@ import os
 import sys
 
 from src.configuration import write_configuration
-from src.card_logic import filter_options, get_deck_metrics
+from src.card_logic import get_deck_metrics
 from src.utils import retrieve_local_set_list
 from src.ui.styles import Theme
 from src.ui.components import CardToolTip
@@ -25,7 +25,6 @@ from src.ui.orchestrator import DraftOrchestrator
 from src.notifications import Notifications
 from src.ui.windows.overlay import CompactOverlay
 from src.ui.advisor_view import AdvisorPanel
-from src.advisor.engine import DraftAdvisor
 from src.signals import SignalCalculator
 
 # Windows
@@ -96,6 +95,9 @@ class DraftApp:
         self._rebuilding_ui = False
         self._loading = False
         self._update_task_id: Optional[str] = None
+        self._watchdog_task_id: Optional[str] = None
+        self._orchestrator_stopped = False
+        self._status_dot_task_id: Optional[str] = None
         self.previous_timestamp = 0
         self.current_pack_data = []
         self.current_missing_data = []
@@ -220,6 +222,7 @@ class DraftApp:
 
             # 2. START THE ENGINE
             self.orchestrator.start()
+            self.orchestrator.start_draft_indexing()
 
             # 3. SYNC DROPDOWNS
             try:
@@ -753,46 +756,26 @@ class DraftApp:
         if not self._initialized or self._rebuilding_ui:
             return
 
-        # 1. TRY-LOCK: If we can't get the lock, just schedule a retry 100ms later
-        # This prevents the UI from "freezing" while waiting for the scanner thread.
-        lock_acquired = self.orchestrator.scanner.lock.acquire(blocking=False)
-        if not lock_acquired:
-            self.root.after(100, self._refresh_ui_data)
-            return
-
-        try:
-            # DATA SNAPSHOT
-            es, et = self.orchestrator.scanner.retrieve_current_limited_event()
-            pk, pi = self.orchestrator.scanner.retrieve_current_pack_and_pick()
-            metrics = self.orchestrator.scanner.retrieve_set_metrics()
-            tier_data = self.orchestrator.scanner.retrieve_tier_data()
-            taken_cards = self.orchestrator.scanner.retrieve_taken_cards()
-            pack_cards = self.orchestrator.scanner.retrieve_current_pack_cards()
-            missing_cards = self.orchestrator.scanner.retrieve_current_missing_cards()
-            current_picked_cards = (
-                self.orchestrator.scanner.retrieve_current_picked_cards()
-            )
-            history = self.orchestrator.scanner.retrieve_draft_history()
-            draft_id = self.orchestrator.scanner.current_draft_id
-            start_time = self.orchestrator.scanner.draft_start_time
-            event_string = self.orchestrator.scanner.event_string
-        finally:
-            self.orchestrator.scanner.lock.release()
-
-        # 2. ADVISOR & SIGNAL MATH
-        advisor = DraftAdvisor(metrics, taken_cards)
-        recommendations = advisor.evaluate_pack(pack_cards, pi)
-
-        sig_calc = SignalCalculator(metrics)
-        scores = {c: 0.0 for c in constants.CARD_COLORS}
-        for entry in history:
-            if entry["Pack"] == 2:
-                continue
-            h_pack = self.orchestrator.scanner.set_data.get_data_by_id(entry["Cards"])
-            for c, v in sig_calc.calculate_pack_signals(h_pack, entry["Pick"]).items():
-                scores[c] += v
-
-        # 3. DRAW BASIC UI ELEMENTS
+        # 1. DRAFT SNAPSHOT + ADVISOR & SIGNAL MATH: Reads the scanner's latest
+        # published snapshot, so the UI thread never waits on the scanner lock.
+        view = self.orchestrator.build_view_model()
+
+        es, et = view.event_set, view.event_type
+        pk, pi = view.pack, view.pick
+        metrics = view.metrics
+        tier_data = view.tier_data
+        taken_cards = view.taken_cards
+        pack_cards = view.pack_cards
+        missing_cards = view.missing_cards
+        current_picked_cards = view.picked_cards
+        draft_id = view.draft_id
+        start_time = view.start_time
+        event_string = view.event_string
+        recommendations = view.recommendations
+        scores = view.signal_scores
+        colors = view.colors
+
+        # 2. DRAW BASIC UI ELEMENTS
         if pk > 0:
             self.vars["status_text"].set(f"Pack {pk} Pick {pi}")
             if hasattr(self, "lbl_status"):
@@ -802,14 +785,7 @@ class DraftApp:
             if hasattr(self, "lbl_status"):
                 self.lbl_status.configure(bootstyle="secondary")
 
-        # 4. REFRESH DASHBOARD
-        colors = filter_options(
-            taken_cards,
-            self.configuration.settings.deck_filter,
-            metrics,
-            self.configuration,
-        )
-
+        # 3. REFRESH DASHBOARD
         # Update Auto-Detect Label
         if hasattr(self, "lbl_auto_detect"):
             if self.configuration.settings.deck_filter == constants.FILTER_OPTION_AUTO:
@@ -877,7 +853,7 @@ class DraftApp:
                 current_picked_cards,
             )
 
-        # 5. DEFENSIVE TAB REFRESH (Fixed for Pytest)
+        # 4. DEFENSIVE TAB REFRESH (Fixed for Pytest)
         # Check if panels have 'refresh' to support Mock objects in tests
         for p in [
             self.panel_taken,
@@ -895,9 +871,12 @@ class DraftApp:
         self.current_pack_data = pack_cards
         self.current_missing_data = missing_cards
 
-    def _calculate_signals(self, metrics):
+    def _calculate_signals(self, metrics, snapshot=None):
         calc = SignalCalculator(metrics)
-        history = self.orchestrator.scanner.retrieve_draft_history()
+        scanner = self.orchestrator.scanner
+        history = scanner.retrieve_draft_history(
+            snapshot if snapshot is not None else scanner.retrieve_snapshot()
+        )
         scores = {c: 0.0 for c in constants.CARD_COLORS}
         for entry in history:
             if entry["Pack"] == 2:
@@ -910,7 +889,7 @@ class DraftApp:
         return scores
 
     def _update_loop(self):
-        """UI Poll Loop: Checks the orchestrator's queue for updates."""
+        """UI Update: Drains the orchestrator's queue, fired by its virtual event."""
         if not self.root.winfo_exists():
             return
 
@@ -946,14 +925,17 @@ class DraftApp:
                 if is_test:
                     self.root.update()
 
-            # 2. Update status dot color based on file modified time
+            # 2. Light the status dot on log activity; it dims once the log goes idle
             try:
                 ts = os.stat(self.orchestrator.scanner.arena_file).st_mtime
-                self.status_dot.config(
-                    bootstyle=(
-                        "success" if ts != self.previous_timestamp else "secondary"
+                if ts != self.previous_timestamp:
+                    self.status_dot.config(bootstyle="success")
+                    if self._status_dot_task_id:
+                        self.root.after_cancel(self._status_dot_task_id)
+                    self._status_dot_task_id = self.root.after(
+                        constants.UI_STATUS_DOT_IDLE_MS,
+                        lambda: self.status_dot.config(bootstyle="secondary"),
                     )
-                )
                 self.previous_timestamp = ts
             except:
                 pass
@@ -962,10 +944,34 @@ class DraftApp:
             if hasattr(self, "loading_overlay"):
                 self.loading_overlay.hide()
 
-        self._schedule_update()
-
     def _schedule_update(self):
-        self._update_task_id = self.root.after(100, self._update_loop)
+        """Runs the update loop whenever the orchestrator signals new data or log activity."""
+        self.root.bind(constants.UI_UPDATE_EVENT, lambda e: self._update_loop())
+        self.orchestrator.set_ui_notifier(
+            lambda: self.root.event_generate(constants.UI_UPDATE_EVENT, when="tail")
+        )
+        self._update_task_id = self.root.after_idle(self._update_loop)
+        self._watchdog_task_id = self.root.after(
+            constants.UI_WATCHDOG_MS, self._watch_orchestrator
+        )
+
+    def _watch_orchestrator(self):
+        """
+        Falls back to polling from the UI thread if the orchestrator thread is not
+        running, since nothing else would post <<OrchestratorUpdate>> events.
+        """
+        if not self.root.winfo_exists():
+            return
+        if self.orchestrator.is_alive():
+            self._orchestrator_stopped = False
+            delay = constants.UI_WATCHDOG_MS
+        else:
+            if not self._orchestrator_stopped:
+                logger.error("Orchestrator thread stopped; polling from the UI thread")
+                self._orchestrator_stopped = True
+            self._update_loop()
+            delay = constants.UI_FALLBACK_POLL_MS
+        self._watchdog_task_id = self.root.after(delay, self._watch_orchestrator)
 
     def _on_filter_ui_change(self):
         # Guard: Don't trigger if we are mid-boot or mid-update
@@ -1155,7 +1161,7 @@ class DraftApp:
 
                 self.vars["status_text"].set("Loading Dataset...")
                 try:
-                    self.orchestrator.scanner.retrieve_set_data(path)
+                    self.orchestrator.load_selected_dataset(path)
                     self.configuration.card_data.latest_dataset = os.path.basename(path)
                     write_configuration(self.configuration)
 
@@ -1458,7 +1464,7 @@ class DraftApp:
             full_path = os.path.join(SETS_FOLDER, latest_file)
             if os.path.exists(full_path):
                 try:
-                    self.orchestrator.scanner.retrieve_set_data(full_path)
+                    self.orchestrator.load_selected_dataset(full_path)
                     from src.card_logic import clear_deck_cache
 
                     clear_deck_cache()
@@ -1040,7 +1040,8 @@ class DashboardFrame(ttk.Frame):
             and self.orchestrator
             and self.orchestrator.scanner
         ):
-            history = self.orchestrator.scanner.retrieve_draft_history()
+            scanner = self.orchestrator.scanner
+            history = scanner.retrieve_draft_history(scanner.retrieve_snapshot())
             max_pack_size = 0
             for entry in history:
                 # For standard drafts: Pick Number + Cards Remaining in Pack - 1 = Original Pack Size
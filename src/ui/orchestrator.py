@@ -1,18 +1,59 @@
 import os
 import logging
 import threading
-import time
 import queue
-from src.configuration import write_configuration
+from dataclasses import dataclass
+from typing import Any, Dict, List
+from src import constants
+from src.configuration import write_configuration, CONFIG_FILE
+from src.file_watcher import create_file_watcher
+from src.draft_store import DraftStore, DraftLogIndexer, draft_record
+from src.card_logic import filter_options
+from src.advisor.engine import DraftAdvisor
+from src.signals import SignalCalculator
+from src.utils import Result
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class DraftViewModel:
+    """
+    Everything the dashboard renders for one refresh. Built on the Tk thread by
+    build_view_model, from the scanner's published snapshot rather than under its lock.
+    """
+
+    event_set: str
+    event_type: str
+    pack: int
+    pick: int
+    metrics: Any
+    tier_data: Dict
+    taken_cards: List
+    pack_cards: List
+    missing_cards: List
+    picked_cards: List
+    draft_id: str
+    start_time: Any
+    event_string: str
+    recommendations: List
+    signal_scores: Dict[str, float]
+    colors: List[str]
+
+
 class DraftOrchestrator(threading.Thread):
-    def __init__(self, scanner, configuration, refresh_callback):
+    def __init__(
+        self,
+        scanner,
+        configuration,
+        refresh_callback,
+        config_file=CONFIG_FILE,
+        draft_store_file=None,
+    ):
         super().__init__()
         self.scanner = scanner
         self.config = configuration
+        self.config_file = config_file
         self.refresh_callback = refresh_callback
 
         self.loading = False
@@ -29,6 +70,26 @@ class DraftOrchestrator(threading.Thread):
         # Thread-safe queue for file swaps
         self._file_swap_queue = queue.Queue()
 
+        # Parsed past drafts; history selections are served from here when indexed
+        self.draft_store = DraftStore(
+            draft_store_file
+            or os.path.join(constants.TEMP_FOLDER, constants.DRAFT_STORE_FILE_NAME)
+        )
+        self._indexer_thread = None
+
+        # Background dataset loads: a newer request supersedes an older one, whose
+        # result is dropped instead of installed
+        self.pending_dataset = None
+        self._dataset_generation = 0
+        self._dataset_thread = None
+
+        # Event-driven wakeups: the watcher (owned by run()) unblocks the loop when
+        # the log grows, and the UI notifier pushes queued messages to the UI thread
+        self.watcher = None
+        self._ui_notify = None
+        self._ui_pending = threading.Event()
+        self._ui_notify_thread = None
+
         # Live tracking
         self.live_log_path = configuration.settings.arena_log_location
         self._last_live_file_size = -1
@@ -84,19 +145,89 @@ class DraftOrchestrator(threading.Thread):
     def set_file_and_scan(self, filepath):
         """Thread-safe way for the UI to request a log file change."""
         self._file_swap_queue.put(filepath)
+        self._wake()
 
     def trigger_full_scan(self):
         """Thread-safe way for the UI to demand a deep log scan."""
         self._force_full_scan_event.set()
+        self._wake()
 
     def stop(self):
         self._stop_event.set()
+        self._ui_pending.set()
+        self._wake()
 
     def request_math_update(self):
         self._force_math_event.set()
+        self._wake()
+
+    def start_draft_indexing(self):
+        """Indexes past draft logs into the draft store on a background thread."""
+        if self._indexer_thread and self._indexer_thread.is_alive():
+            return
+        indexer = DraftLogIndexer(
+            self.draft_store, self.scanner.set_list, self.scanner.sets_location
+        )
+
+        def index():
+            try:
+                count = indexer.index_folder(constants.DRAFT_LOG_FOLDER)
+                if count:
+                    logger.info(f"Indexed {count} past draft logs")
+            except Exception as e:
+                logger.error(f"Draft log indexing failed: {e}")
+
+        self._indexer_thread = threading.Thread(target=index, daemon=True)
+        self._indexer_thread.start()
+
+    def _store_parsed_draft(self, filepath):
+        """Adds a past draft that was just parsed in full to the draft store."""
+        if not os.path.basename(filepath).startswith(constants.DRAFT_LOG_PREFIX):
+            return
+        try:
+            with self.scanner.lock:
+                state = self.scanner.export_state()
+            self.draft_store.upsert([draft_record(filepath, state)])
+        except Exception as e:
+            logger.error(f"Failed to store parsed draft: {e}")
+
+    def _wake(self):
+        """Interrupts the watcher wait so queued requests are handled immediately."""
+        if self.watcher:
+            self.watcher.wake()
+
+    def set_ui_notifier(self, callback):
+        """
+        Registers a callable (e.g. a Tk virtual event) that is fired whenever new
+        messages are queued. It runs on a dedicated thread so the orchestrator never
+        blocks on the UI thread while holding the scanner lock.
+        """
+        self._ui_notify = callback
+        if self._ui_notify_thread is None:
+            self._ui_notify_thread = threading.Thread(
+                target=self._ui_notify_loop, daemon=True
+            )
+            self._ui_notify_thread.start()
+
+    def _ui_notify_loop(self):
+        while not self._stop_event.is_set():
+            self._ui_pending.wait()
+            self._ui_pending.clear()
+            if self._stop_event.is_set() or not self._ui_notify:
+                continue
+            try:
+                self._ui_notify()
+            except Exception as e:
+                logger.debug(f"UI notification dropped: {e}")
+
+    def _post(self, message):
+        """Queues a message for the UI and wakes it."""
+        self.update_queue.put(message)
+        self._ui_pending.set()
 
     def run(self):
         logger.info("Background Watchdog started.")
+        self.watcher = create_file_watcher()
         while not self._stop_event.is_set():
 
             # Automatically snap back to the live draft log ONLY if a draft event is detected
@@ -129,25 +260,34 @@ class DraftOrchestrator(threading.Thread):
 
             if new_file:
                 self.loading = True
-                self.update_queue.put({"status": "Scanning Log..."})
+                self._post({"status": "Scanning Log..."})
                 try:
+                    is_live = new_file == getattr(self, "live_log_path", None)
+                    stored = None if is_live else self.draft_store.get(new_file)
                     self.scanner.set_arena_file(new_file)
 
-                    if new_file != getattr(self, "live_log_path", None):
+                    if not is_live:
                         self.scanner.log_enable(False)
                     else:
                         self.scanner.log_enable(self.config.settings.draft_log_enabled)
 
-                    self.scanner.draft_start_search()
-                    self.sync_dataset_to_event()
+                    if stored:
+                        # Indexed past draft: restore it instead of re-parsing the log
+                        self.scanner.restore_indexed_draft(stored["state"])
+                        self.sync_dataset_to_event(background=True)
+                    else:
+                        self.scanner.draft_start_search()
+                        self.sync_dataset_to_event(background=True)
 
-                    self.update_queue.put({"status": "Parsing Picks..."})
-                    self.scanner.draft_data_search()
+                        self._post({"status": "Parsing Picks..."})
+                        self.scanner.draft_data_search()
+                        if not is_live:
+                            self._store_parsed_draft(new_file)
                 except Exception as e:
                     logger.error(f"Error processing file swap: {e}")
                 finally:
                     self.loading = False
-                    self.update_queue.put("REFRESH")
+                    self._post("REFRESH")
 
             # 2. Check if file changed OR if a manual event was triggered
             if not self.loading and (
@@ -158,8 +298,15 @@ class DraftOrchestrator(threading.Thread):
                 # Acquire lock briefly, do work, release
                 self.step_process()
 
-            # Yield to the UI thread between polls
-            time.sleep(0.5)
+            # Sleep until the log changes, a UI request arrives or the watcher times out
+            self.watcher.watch([self.scanner.arena_file, self.live_log_path])
+            if self.watcher.wait():
+                # Log activity alone still wakes the UI (status indicator)
+                self._ui_pending.set()
+
+        watcher, self.watcher = self.watcher, None
+        watcher.close()
+        self.scanner.flush_log_index()
 
     def _file_has_changed(self):
         """Returns True if the log file size has changed since the last scan.
@@ -182,7 +329,7 @@ class DraftOrchestrator(threading.Thread):
                 log_changed = self.check_for_updates(force=force)
                 if log_changed or self._force_math_event.is_set():
                     self._force_math_event.clear()
-                    self.update_queue.put("REFRESH")
+                    self._post("REFRESH")
             except Exception as e:
                 logger.error(f"Logic Step Error: {e}")
 
@@ -202,18 +349,22 @@ class DraftOrchestrator(threading.Thread):
             return False
 
         changed = False
+        # Single pass over the new bytes: event starts and pack/pick data together
+        new_event, data_update = self.scanner.scan_log()
+
         # SEARCH 1: Did the user join a new event?
-        if self.scanner.draft_start_search():
+        if new_event:
             changed, self.new_event_detected = True, True
-            self.sync_dataset_to_event()  # Guarantee card dictionary is mapped immediately
+            # Loads on a worker; picks keep parsing and fill in when it is installed
+            self.sync_dataset_to_event(background=True)
 
         # SEARCH 2: Is there new pack/pick data?
-        if self.scanner.draft_data_search():
+        if data_update:
             changed = True
 
             # Failsafe: If we recovered cards from the log but the dataset is missing in memory, load it
             if not self.scanner.set_data._dataset and self.scanner.draft_sets:
-                self.sync_dataset_to_event()
+                self.sync_dataset_to_event(background=True)
 
         # MOCK-SAFE FIRST RUN CHECK:
         # We use try/except to handle MagicMocks in unit tests
@@ -229,9 +380,70 @@ class DraftOrchestrator(threading.Thread):
                 changed = True
         return changed
 
+    def build_view_model(self) -> DraftViewModel:
+        """
+        Resolves the scanner's latest published DraftSnapshot and runs the
+        advisor/signal math for one UI refresh. Never takes the scanner lock, so
+        the UI thread cannot stall behind a parse or a card database lookup.
+        """
+        scanner = self.scanner
+        snapshot = scanner.retrieve_snapshot()
+        es, et = scanner.retrieve_current_limited_event(snapshot)
+        pk, pi = scanner.retrieve_current_pack_and_pick(snapshot)
+        metrics = scanner.retrieve_set_metrics()
+        tier_data = scanner.retrieve_tier_data(snapshot)
+        taken_cards = scanner.retrieve_taken_cards(snapshot)
+        pack_cards = scanner.retrieve_current_pack_cards(snapshot)
+        missing_cards = scanner.retrieve_current_missing_cards(snapshot)
+        picked_cards = scanner.retrieve_current_picked_cards(snapshot)
+        history = scanner.retrieve_draft_history(snapshot)
+        draft_id = snapshot.draft_id
+        start_time = snapshot.start_time
+        event_string = snapshot.event_string
+
+        advisor = DraftAdvisor(metrics, taken_cards)
+        recommendations = advisor.evaluate_pack(pack_cards, pi)
+
+        sig_calc = SignalCalculator(metrics)
+        scores = {c: 0.0 for c in constants.CARD_COLORS}
+        for entry in history:
+            if entry["Pack"] == 2:
+                continue
+            h_pack = scanner.set_data.get_data_by_id(entry["Cards"])
+            for c, v in sig_calc.calculate_pack_signals(h_pack, entry["Pick"]).items():
+                scores[c] += v
+
+        colors = filter_options(
+            taken_cards, self.config.settings.deck_filter, metrics, self.config
+        )
+
+        return DraftViewModel(
+            event_set=es,
+            event_type=et,
+            pack=pk,
+            pick=pi,
+            metrics=metrics,
+            tier_data=tier_data,
+            taken_cards=taken_cards,
+            pack_cards=pack_cards,
+            missing_cards=missing_cards,
+            picked_cards=picked_cards,
+            draft_id=draft_id,
+            start_time=start_time,
+            event_string=event_string,
+            recommendations=recommendations,
+            signal_scores=scores,
+            colors=colors,
+        )
+
     def sync_dataset_to_event(
-        self, target_set=None, target_format=None, target_user=None
+        self, target_set=None, target_format=None, target_user=None, background=False
     ):
+        """
+        Loads the dataset matching the current event. With background=True the
+        load runs on a worker thread (see preload_dataset) and this returns as soon
+        as it is queued.
+        """
         with self.scanner.lock:
             event_set, _ = self.scanner.retrieve_current_limited_event()
             s_code = target_set or event_set
@@ -245,13 +457,77 @@ class DraftOrchestrator(threading.Thread):
                         self.config.card_data.latest_dataset == os.path.basename(path)
                         and self.scanner.set_data._dataset is not None
                     ):
+                        self._dataset_generation += 1
+                        self.pending_dataset = None
+                        return True
+                    if self.pending_dataset == path:
+                        return True
+
+                    if background and path not in self.scanner.dataset_cache:
+                        self.preload_dataset(path, s_code)
                         return True
 
                     # Notify UI of heavy operation
-                    self.update_queue.put({"status": f"Loading {s_code} Dataset..."})
+                    self._post({"status": f"Loading {s_code} Dataset..."})
 
+                    self._dataset_generation += 1
+                    self.pending_dataset = None
                     self.scanner.retrieve_set_data(path)
-                    self.config.card_data.latest_dataset = os.path.basename(path)
-                    write_configuration(self.config)
+                    self._set_latest_dataset(path)
                     return True
             return False
+
+    def load_selected_dataset(self, path):
+        """
+        Loads a dataset the user picked, superseding any event preload still
+        running so its install cannot overwrite the choice.
+        """
+        with self.scanner.lock:
+            self._dataset_generation += 1
+            self.pending_dataset = None
+        return self.scanner.retrieve_set_data(path)
+
+    def preload_dataset(self, path, s_code):
+        """
+        Loads a dataset into a staging Dataset on a worker thread and installs it
+        when ready, reporting progress through update_queue. The scanner keeps
+        parsing the log meanwhile; the tables fill in on the REFRESH that follows
+        the install.
+        """
+        with self.scanner.lock:
+            self._dataset_generation += 1
+            generation = self._dataset_generation
+            self.pending_dataset = path
+        self._post({"status": f"Loading {s_code} Dataset..."})
+
+        def load():
+            try:
+                result, set_data, metrics = self.scanner.load_set_data(path)
+                with self.scanner.lock:
+                    if generation != self._dataset_generation:
+                        logger.info(f"Dropped superseded dataset load: {path}")
+                        return
+                    self.pending_dataset = None
+                    if result == Result.VALID:
+                        self.scanner.install_set_data(set_data, metrics)
+                        self._set_latest_dataset(path)
+                if result != Result.VALID:
+                    # latest_dataset is left alone so the next event sync retries
+                    logger.error(f"Failed to load dataset {path}: {result}")
+                    self._post({"status": f"Failed to load {s_code} Dataset"})
+                    return
+                self._post({"status": f"{s_code} Dataset Loaded"})
+                self._post("REFRESH")
+            except Exception as e:
+                logger.error(f"Background dataset load failed: {e}")
+                with self.scanner.lock:
+                    if generation == self._dataset_generation:
+                        self.pending_dataset = None
+
+        self._dataset_thread = threading.Thread(target=load, daemon=True)
+        self._dataset_thread.start()
+        return self._dataset_thread
+
+    def _set_latest_dataset(self, path):
+        self.config.card_data.latest_dataset = os.path.basename(path)
+        write_configuration(self.config, self.config_file)
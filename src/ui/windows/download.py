@@ -300,6 +300,10 @@ class DownloadWindow(ttk.Frame):
         ):
             try:
                 os.remove(filepath)
+                from src.compiled_dataset import compiled_dataset_path
+
+                if os.path.exists(compiled_dataset_path(filepath)):
+                    os.remove(compiled_dataset_path(filepath))
                 from src.utils import invalidate_local_set_cache
 
                 invalidate_local_set_cache()
@@ -327,6 +327,9 @@ class CompactOverlay(tb.Toplevel):
         evt = self.app_context.vars["selected_event"].get()
         grp = self.app_context.vars["selected_group"].get()
         filt = self.app_context.vars["deck_filter"].get()
+        # One lock-free snapshot per refresh, so every field comes from the same parse
+        scanner = self.orchestrator.scanner
+        snapshot = scanner.retrieve_snapshot()
 
         if filt == constants.FILTER_OPTION_AUTO:
             active_color = colors[0] if colors else "All Decks"
@@ -350,24 +353,24 @@ class CompactOverlay(tb.Toplevel):
 
         # Graceful fallback if no data is loaded
         if not evt:
-            _, evt = (
-                self.app_context.orchestrator.scanner.retrieve_current_limited_event()
-            )
+            _, evt = scanner.retrieve_current_limited_event(snapshot)
             grp = "No Data"
 
         self.lbl_info.config(text=f"{evt} ({grp}) | {filt}")
 
         self.current_pack_cards = pack_cards or []
-        taken_cards = self.orchestrator.scanner.retrieve_taken_cards()
+        taken_cards = scanner.retrieve_taken_cards(snapshot)
         self.current_pool_cards = stack_cards(taken_cards) if taken_cards else []
-        missing_cards = self.orchestrator.scanner.retrieve_current_missing_cards()
+        missing_cards = scanner.retrieve_current_missing_cards(snapshot)
         self.current_missing_cards = missing_cards
 
-        pk, pi = self.orchestrator.scanner.retrieve_current_pack_and_pick()
+        pk, pi = scanner.retrieve_current_pack_and_pick(snapshot)
         self.lbl_status.config(text=f"P{pk} / P{pi}")
 
         self.advisor_panel.update_recommendations(recommendations)
-        self.signal_meter.update_values(self.app_context._calculate_signals(metrics))
+        self.signal_meter.update_values(
+            self.app_context._calculate_signals(metrics, snapshot)
+        )
 
         if taken_cards:
             deck_metrics = get_deck_metrics(taken_cards)
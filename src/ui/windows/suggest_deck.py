@@ -365,12 +365,14 @@ class SuggestDeckPanel(ttk.Frame):
         try:
             from src.card_logic import simulate_deck
 
-            stats = simulate_deck(deck_list, iterations=10000)
+            stats = simulate_deck(
+                deck_list, iterations=10000, tolerance=constants.SIMULATION_TOLERANCE
+            )
             self.after(0, lambda: self._show_sim_results(stats))
         except Exception as e:
             self.after(0, lambda e=e: self._show_sim_error(str(e)))
 
-    def _show_sim_loading(self, msg="Running 10,000 Monte Carlo Simulations..."):
+    def _show_sim_loading(self, msg="Running up to 10,000 Monte Carlo Simulations..."):
         sim_frame = getattr(self, "sim_frame", None)
         if not sim_frame or not sim_frame.winfo_exists():
             return
@@ -422,7 +424,10 @@ class SuggestDeckPanel(ttk.Frame):
             ).pack(pady=Theme.scaled_val(20))
             return
 
-        def _add_stat(label, value, thresholds, reverse=False, is_percent=True):
+        margins = stats.get("intervals", {})
+
+        def _add_stat(label, key, thresholds, reverse=False, is_percent=True):
+            value = stats[key]
             frame = ttk.Frame(sim_frame)
             frame.pack(fill="x", pady=Theme.scaled_val(2))
             ttk.Label(frame, text=label, font=Theme.scaled_font(10, "bold")).pack(
@@ -447,6 +452,10 @@ class SuggestDeckPanel(ttk.Frame):
                     icon, color = "🔴 Poor", "danger"
 
             val_str = f"{value:.1f}%" if is_percent else f"{value:.2f}"
+            if key in margins:
+                # 95% confidence half-width of the simulated value
+                margin = margins[key]
+                val_str += f" ±{margin:.1f}%" if is_percent else f" ±{margin:.2f}"
 
             right_frame = ttk.Frame(frame)
             right_frame.pack(side="right")
@@ -455,7 +464,7 @@ class SuggestDeckPanel(ttk.Frame):
                 right_frame,
                 text=val_str,
                 font=Theme.scaled_font(10, "bold"),
-                width=6,
+                width=13 if key in margins else 6,
                 anchor="e",
             ).pack(side="left", padx=Theme.scaled_val((0, 6)))
 
@@ -474,11 +483,11 @@ class SuggestDeckPanel(ttk.Frame):
             font=Theme.scaled_font(10, "bold"),
         ).pack(anchor="w", pady=Theme.scaled_val((0, 5)))
 
-        _add_stat("T2 Play (2-Drop):", stats["cast_t2"], (65, 50))
-        _add_stat("T3 Play (3-Drop):", stats["cast_t3"], (65, 50))
-        _add_stat("T4 Play (4-Drop):", stats["cast_t4"], (55, 40))
-        _add_stat("Perfect Curve (T2-T4):", stats["curve_out"], (25, 15))
-        _add_stat("Removal by Turn 4:", stats["removal_t4"], (60, 45))
+        _add_stat("T2 Play (2-Drop):", "cast_t2", (65, 50))
+        _add_stat("T3 Play (3-Drop):", "cast_t3", (65, 50))
+        _add_stat("T4 Play (4-Drop):", "cast_t4", (55, 40))
+        _add_stat("Perfect Curve (T2-T4):", "curve_out", (25, 15))
+        _add_stat("Removal by Turn 4:", "removal_t4", (60, 45))
 
         ttk.Separator(sim_frame).pack(fill="x", pady=Theme.scaled_val(8))
 
@@ -489,16 +498,12 @@ class SuggestDeckPanel(ttk.Frame):
             font=Theme.scaled_font(10, "bold"),
         ).pack(anchor="w", pady=Theme.scaled_val((0, 5)))
 
-        _add_stat("Mulligan Rate:", stats["mulligans"], (15, 25), reverse=True)
-        _add_stat(
-            "Avg. Hand Size:", stats["avg_hand_size"], (6.8, 6.5), is_percent=False
-        )
-        _add_stat("Missed 3rd Land Drop:", stats["screw_t3"], (15, 25), reverse=True)
-        _add_stat("Missed 4th Land Drop:", stats["screw_t4"], (25, 35), reverse=True)
-        _add_stat(
-            "Color Screwed (T3):", stats["color_screw_t3"], (10, 20), reverse=True
-        )
-        _add_stat("Mana Flooded (T5):", stats["flood_t5"], (20, 30), reverse=True)
+        _add_stat("Mulligan Rate:", "mulligans", (15, 25), reverse=True)
+        _add_stat("Avg. Hand Size:", "avg_hand_size", (6.8, 6.5), is_percent=False)
+        _add_stat("Missed 3rd Land Drop:", "screw_t3", (15, 25), reverse=True)
+        _add_stat("Missed 4th Land Drop:", "screw_t4", (25, 35), reverse=True)
+        _add_stat("Color Screwed (T3):", "color_screw_t3", (10, 20), reverse=True)
+        _add_stat("Mana Flooded (T5):", "flood_t5", (20, 30), reverse=True)
 
         ttk.Separator(sim_frame).pack(fill="x", pady=Theme.scaled_val(8))
 
@@ -1,9 +1,12 @@
 import json
 import os
+import re
 import time
 import platform
+import threading
 import subprocess
 from enum import Enum
+from datetime import datetime
 from typing import List
 from src.constants import (
     LIMITED_TYPES_DICT,
@@ -22,6 +25,7 @@ from src.constants import (
     DATA_SECTION_IMAGES,
     FILTER_OPTION_ALL_DECKS,
 )
+from src.dataset_catalog import DatasetCatalog
 from src.logger import create_logger
 
 logger = create_logger()
@@ -35,6 +39,118 @@ class Result(Enum):
     ERROR_UNREADABLE_FILE = 2
 
 
+class TimedLock:
+    """
+    Re-entrant lock that records contention: how often an acquire found the lock
+    held and how long blocking acquires waited. An uncontended acquire costs one
+    extra non-blocking attempt.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if self._lock.acquire(blocking=False):
+            self._record(True, 0.0)
+            return True
+        if not blocking:
+            self._record(False, 0.0)
+            return False
+
+        start = time.perf_counter()
+        acquired = self._lock.acquire(timeout=timeout)
+        self._record(acquired, time.perf_counter() - start, contended=True)
+        return acquired
+
+    def release(self):
+        self._lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def _record(self, acquired: bool, waited: float, contended: bool = False):
+        with self._stats_lock:
+            if acquired:
+                self.acquisitions += 1
+            else:
+                self.busy += 1
+            if contended:
+                self.contended += 1
+                self.wait_time += waited
+                self.max_wait = max(self.max_wait, waited)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "acquisitions": self.acquisitions,
+                "busy": self.busy,
+                "contended": self.contended,
+                "wait_ms": self.wait_time * 1000,
+                "max_wait_ms": self.max_wait * 1000,
+            }
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.acquisitions = 0
+            self.busy = 0  # Non-blocking attempts that found the lock held
+            self.contended = 0  # Blocking attempts that had to wait
+            self.wait_time = 0.0
+            self.max_wait = 0.0
+
+
+_JSON_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?")
+
+
+def _may_be_json(text):
+    """Cheap pre-check: False only for text that json.loads can never decode."""
+    stripped = text.strip()
+    head = stripped[:1]
+    if not head:
+        return False
+    if head in '{["tfnNI':
+        return True
+    if head in "-0123456789":
+        return stripped == "-Infinity" or _JSON_NUMBER.fullmatch(stripped) is not None
+    return False
+
+
+def _decode_json_string(text):
+    """
+    Decode a (possibly double-encoded) JSON string one level deep. Dictionaries are
+    returned with their values untouched; undecodable text is returned unchanged.
+    Includes sanitization for malformed, unescaped MTGA logs.
+    """
+    # Plain values (ids, names, card lists) would otherwise pay for two failed parses
+    if not _may_be_json(text):
+        return text
+    try:
+        parsed = json.loads(text)
+    except json.JSONDecodeError:
+        # MTG Arena occasionally outputs broken, unescaped JSON (e.g. "request":"{"DraftId":"123"}")
+        # We intercept this, strip the outer string quotes, and reconstruct it into a valid nested dict.
+        sanitized = (
+            text.strip()
+            .replace('"request":"{', '"request":{')
+            .replace('"Payload":"{', '"Payload":{')
+        )
+        if sanitized.endswith('}"}'):
+            sanitized = sanitized[:-3] + "}}"
+
+        try:
+            parsed = json.loads(sanitized)
+        except:
+            return text
+    if isinstance(parsed, str):
+        return _decode_json_string(parsed)
+    return parsed
+
+
 def process_json(obj):
     """
     Convert JSON string with escape characters to a nested dictionary.
@@ -43,26 +159,8 @@ def process_json(obj):
     if isinstance(obj, dict):
         return {key: process_json(value) for key, value in obj.items()}
     elif isinstance(obj, str):
-        try:
-            parsed_json = json.loads(obj)
-            return process_json(parsed_json)
-        except json.JSONDecodeError:
-            # MTG Arena occasionally outputs broken, unescaped JSON (e.g. "request":"{"DraftId":"123"}")
-            # We intercept this, strip the outer string quotes, and reconstruct it into a valid nested dict.
-            sanitized = (
-                obj.strip()
-                .replace('"request":"{', '"request":{')
-                .replace('"Payload":"{', '"Payload":{')
-            )
-            if sanitized.endswith('}"}'):
-                sanitized = sanitized[:-3] + "}}"
-
-            try:
-                parsed_sanitized = json.loads(sanitized)
-                return process_json(parsed_sanitized)
-            except:
-                pass
-            return obj
+        decoded = _decode_json_string(obj)
+        return obj if decoded is obj else process_json(decoded)
     else:
         return obj
 
@@ -83,7 +181,79 @@ def json_find(key, obj):
     return result
 
 
+def json_find_keys(keys, obj):
+    """
+    Retrieve several keys from a raw JSON payload (string or dictionary) in one
+    traversal. Returns {key: value} for every key found, matching
+    json_find(key, process_json(obj)), but nested JSON strings are only decoded
+    when they could contain a key that is still missing.
+    """
+    node = _decode_json_string(obj) if isinstance(obj, str) else obj
+    if not isinstance(node, dict):
+        return {}
+    return _find_keys(node, list(keys))
+
+
+def _find_keys(node, keys):
+    found = {}
+    remaining = []
+    for key in keys:
+        if key in node:
+            # json_find stops at the first level holding the key, even when it is null
+            value = process_json(node[key])
+            if value is not None:
+                found[key] = value
+        else:
+            remaining.append(key)
+
+    for value in node.values():
+        if not remaining:
+            break
+        if isinstance(value, str):
+            # A nested payload can only hold a key whose name appears in its text
+            if not any(key in value for key in remaining):
+                continue
+            value = _decode_json_string(value)
+        if not isinstance(value, dict):
+            continue
+        nested = _find_keys(value, remaining)
+        if nested:
+            found.update(nested)
+            remaining = [key for key in remaining if key not in nested]
+    return found
+
+
 _LOCAL_SET_CACHE = {"mtime": 0.0, "files": []}
+_DATASET_CATALOGS = {}
+_DATASET_CATALOG_LOCK = threading.Lock()
+
+
+def get_dataset_catalog(folder: str = None) -> DatasetCatalog:
+    """Returns the shared catalog for a Sets folder, loading it on first use"""
+    folder = folder or SETS_FOLDER
+    with _DATASET_CATALOG_LOCK:
+        catalog = _DATASET_CATALOGS.get(folder)
+        if catalog is None:
+            catalog = DatasetCatalog(folder)
+            _DATASET_CATALOGS[folder] = catalog
+    return catalog
+
+
+def catalog_dataset(file_location: str, json_data: dict = None) -> Result:
+    """
+    Records a dataset that was just written in its folder's catalog. Pass the
+    already-validated json_data to skip re-reading the file.
+    """
+    result = Result.VALID
+    if json_data is None:
+        result, json_data = check_file_integrity(file_location)
+    catalog = get_dataset_catalog(os.path.dirname(file_location))
+    catalog.record(
+        os.path.basename(file_location),
+        json_data if result == Result.VALID else None,
+    )
+    catalog.save()
+    return result
 
 
 def invalidate_local_set_cache():
@@ -110,10 +280,13 @@ def retrieve_local_set_list(codes=None, names=None):
     ):
         all_files = _LOCAL_SET_CACHE["files"]
     else:
-        # CACHE MISS - Deep Scan (Runs only on boot or when a new dataset is downloaded)
+        # CACHE MISS - Catalog Scan: only datasets missing from the catalog, or
+        # changed since they were recorded, are parsed
         all_files = []
         if os.path.exists(SETS_FOLDER):
-            for file in os.listdir(SETS_FOLDER):
+            catalog = get_dataset_catalog(SETS_FOLDER)
+            files = os.listdir(SETS_FOLDER)
+            for file in files:
                 try:
                     # Read without codes/names filter to cache the raw underlying data
                     dataset_info = read_dataset_info(file, None, None)
@@ -121,6 +294,13 @@ def retrieve_local_set_list(codes=None, names=None):
                         all_files.append(dataset_info)
                 except Exception as error:
                     error_list.append(error)
+            catalog.prune(files)
+            catalog.save()
+            try:
+                # Saving the catalog touches the folder
+                current_mtime = os.path.getmtime(SETS_FOLDER)
+            except OSError:
+                current_mtime = 0.0
         _LOCAL_SET_CACHE["mtime"] = current_mtime
         _LOCAL_SET_CACHE["files"] = all_files
 
@@ -172,6 +352,38 @@ def retrieve_local_set_list(codes=None, names=None):
     return file_list, error_list
 
 
+def expand_card_records(json_data: dict) -> dict:
+    """
+    Converts a schema 4 dataset, where card_ratings holds one record per card and
+    id_index maps arena ids to record keys, to the per-arena-id card_ratings the
+    client reads. Every printing of a card shares one record dict. Schema 5
+    deck_colors are filled back in from stat_defaults.
+    """
+    stat_defaults = json_data.pop("stat_defaults", None)
+    if isinstance(stat_defaults, dict):
+        archetypes = stat_defaults.get("archetypes", [])
+        defaults = stat_defaults.get("stats", {})
+        for card in (json_data.get("card_ratings") or {}).values():
+            sparse = card.get(DATA_FIELD_DECK_COLORS) or {}
+            deck_colors = {
+                archetype: {**defaults, **sparse.get(archetype, {})}
+                for archetype in archetypes
+            }
+            for archetype, stats in sparse.items():
+                deck_colors.setdefault(archetype, {**defaults, **stats})
+            card[DATA_FIELD_DECK_COLORS] = deck_colors
+
+    id_index = json_data.pop("id_index", None)
+    if isinstance(id_index, dict):
+        records = json_data.get("card_ratings") or {}
+        json_data["card_ratings"] = {
+            arena_id: records[key]
+            for arena_id, key in id_index.items()
+            if key in records
+        }
+    return json_data
+
+
 def check_file_integrity(filename):
     """Extracts data from a file to determine if it's formatted correctly"""
     result = Result.VALID
@@ -184,7 +396,7 @@ def check_file_integrity(filename):
         return Result.ERROR_MISSING_FILE, json_data
 
     try:
-        json_data = json.loads(json_data)
+        json_data = expand_card_records(json.loads(json_data))
 
         if json_data.get("meta"):
             meta = json_data["meta"]
@@ -231,6 +443,29 @@ def check_file_integrity(filename):
     return result, json_data
 
 
+# Timestamp formats MTGA has used in Player.log, across locales and versions
+_LOG_TIME_FORMATS = (
+    "%m/%d/%Y %I:%M:%S %p",
+    "%d/%m/%Y %I:%M:%S %p",
+    "%m/%d/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S",
+    "%d.%m.%Y %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+)
+
+
+def parse_log_time(text: str):
+    """Converts a Player.log timestamp (e.g. "4/7/2024 7:01:02 PM") to epoch seconds."""
+    text = text.strip().rstrip(":")
+    for time_format in _LOG_TIME_FORMATS:
+        try:
+            return datetime.strptime(text, time_format).timestamp()
+        except ValueError:
+            continue
+    return None
+
+
 def detect_string(search_line: str, search_strings: List[str]) -> int:
     """
     Robustly identifies the start of a JSON block in an Arena log line.
@@ -276,6 +511,23 @@ def clean_string(input_string: str, uppercase: bool = True) -> str:
     return input_string.upper() if uppercase else input_string
 
 
+def read_dataset_meta(filename: str):
+    """
+    Returns the meta section of a dataset in the Sets folder, or None if the file
+    is invalid. The catalog answers for unchanged files; anything else is
+    validated in full and recorded.
+    """
+    catalog = get_dataset_catalog(SETS_FOLDER)
+    entry = catalog.lookup(filename)
+    if entry is not None:
+        return entry["meta"] if entry["valid"] else None
+
+    result, json_data = check_file_integrity(os.path.join(SETS_FOLDER, filename))
+    valid = result == Result.VALID
+    catalog.record(filename, json_data if valid else None)
+    return json_data["meta"] if valid else None
+
+
 def read_dataset_info(filename: str, codes=None, names=None):
     """Reads the meta section of a dataset file"""
     name_segments = filename.split("_")
@@ -319,19 +571,19 @@ def read_dataset_info(filename: str, codes=None, names=None):
         set_name = set_code
 
     file_location = os.path.join(SETS_FOLDER, filename)
-    result, json_data = check_file_integrity(file_location)
+    meta = read_dataset_meta(filename)
 
-    if result == Result.VALID:
-        if json_data["meta"]["version"] == 1:
-            start_date, end_date = json_data["meta"]["date_range"].split("->")
+    if meta is not None:
+        if meta["version"] == 1:
+            start_date, end_date = meta["date_range"].split("->")
         else:
-            start_date = json_data["meta"]["start_date"]
-            end_date = json_data["meta"]["end_date"]
+            start_date = meta["start_date"]
+            end_date = meta["end_date"]
 
-        collection_date = json_data["meta"].get("collection_date", "")
+        collection_date = meta.get("collection_date", "")
 
-        if "game_count" in json_data["meta"]:
-            game_count = int(json_data["meta"]["game_count"])
+        if "game_count" in meta:
+            game_count = int(meta["game_count"])
         else:
             game_count = 0
 
@@ -9,7 +9,6 @@ from src.ui.styles import Theme
 from unittest.mock import patch
 from ttkbootstrap.style import StyleBuilderTTK
 
-
 # Global singleton for Tkinter root
 _shared_root = None
 
@@ -108,28 +107,50 @@ def patch_tk_lifecycle(monkeypatch, session_tk_root):
             pass
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolate_temp_folder(tmp_path_factory):
+    """Points TEMP_FOLDER at a temporary directory so compiled datasets, draft
+    journals and log indexes written by tests never land in the real Temp folder.
+    Session scoped so module and session fixtures that open datasets are covered too.
+    """
+    from src import constants
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            constants, "TEMP_FOLDER", str(tmp_path_factory.mktemp("Temp"))
+        )
+        yield
+
+
 @pytest.fixture(autouse=True)
-def clean_draft_state():
-    """Ensures the active draft state file is wiped before and after every test
-    so the log scanner doesn't accidentally resume a draft from a previous test!"""
+def clean_draft_state(isolate_temp_folder):
+    """Ensures the active draft state and log index files are wiped before and after
+    every test so the log scanner doesn't accidentally resume a draft from a previous test!
+    """
     import os
     from src import constants
 
-    state_file = os.path.join(constants.TEMP_FOLDER, "active_draft_state.json")
+    state_files = [
+        os.path.join(constants.TEMP_FOLDER, "active_draft_state.json"),
+        os.path.join(constants.TEMP_FOLDER, "active_draft_state.journal"),
+        os.path.join(constants.TEMP_FOLDER, constants.LOG_INDEX_FILE_NAME),
+    ]
 
-    if os.path.exists(state_file):
-        try:
-            os.remove(state_file)
-        except Exception:
-            pass
+    for state_file in state_files:
+        if os.path.exists(state_file):
+            try:
+                os.remove(state_file)
+            except Exception:
+                pass
 
     yield
 
-    if os.path.exists(state_file):
-        try:
-            os.remove(state_file)
-        except Exception:
-            pass
+    for state_file in state_files:
+        if os.path.exists(state_file):
+            try:
+                os.remove(state_file)
+            except Exception:
+                pass
 
 
 @pytest.fixture
@@ -6,10 +6,17 @@ import responses
 import re
 from datetime import datetime, timezone
 
+from server import config
 from server.utils import APIClient
 from server.main import get_scheduled_events
 from server.extract import extract_scryfall_data, extract_scryfall_tags
-from server.transform import transform_payload, parse_scryfall_types
+from server.transform import (
+    DEFAULT_ARCHETYPE_STATS,
+    legacy_payload,
+    transform_payload,
+    parse_scryfall_types,
+)
+from src.utils import expand_card_records
 
 
 @pytest.fixture
@@ -191,7 +198,8 @@ def test_transform_payload_merging():
     assert payload["meta"]["game_count"] == 5000
 
     # Verify Root Card Properties
-    card = payload["card_ratings"]["123"]
+    assert payload["id_index"] == {"123": "Lightning Bolt"}
+    card = payload["card_ratings"][payload["id_index"]["123"]]
     assert card["name"] == "Lightning Bolt"
     assert card["types"] == ["Instant"]
     assert card["tags"] == ["removal", "burn"]
@@ -203,6 +211,115 @@ def test_transform_payload_merging():
     assert payload["color_ratings"]["UR"] == 55.3
 
 
+def test_transform_payload_one_record_per_card():
+    """Verifies that every printing of a card points at a single card record."""
+    scryfall_mock = {
+        "Lightning Bolt": {"arena_ids": [123, 456], "cmc": 1, "types": ["Instant"]},
+        "Plains": {"arena_ids": [1, 2, 3], "types": ["Land", "Basic"]},
+    }
+    seventeenlands_mock = {
+        "All Decks": {"Lightning Bolt": {"gihwr": 62.5, "arena_id": 789}},
+    }
+
+    payload = transform_payload(
+        "M10",
+        "PremierDraft",
+        scryfall_mock,
+        seventeenlands_mock,
+        {},
+        {},
+        "2019-01-01",
+        "2024-05-01",
+        5000,
+    )
+
+    assert payload["meta"]["version"] == config.DATASET_SCHEMA_VERSION
+    assert sorted(payload["card_ratings"]) == ["Lightning Bolt", "Plains"]
+    assert payload["id_index"] == {
+        "123": "Lightning Bolt",
+        "456": "Lightning Bolt",
+        "789": "Lightning Bolt",
+        "1": "Plains",
+        "2": "Plains",
+        "3": "Plains",
+    }
+
+
+def test_transform_payload_sparse_stats_expand_to_dense():
+    """Verifies that default stats are omitted on disk and restored by the client."""
+    scryfall_mock = {
+        "Lightning Bolt": {"arena_ids": [123], "cmc": 1, "types": ["Instant"]},
+        "Plains": {"arena_ids": [1], "types": ["Land", "Basic"]},
+    }
+    seventeenlands_mock = {
+        "All Decks": {"Lightning Bolt": {"gihwr": 62.5, "alsa": 2.1, "samples": 5000}},
+        "UR": {"Lightning Bolt": {"gihwr": 64.0, "samples": 1000}},
+    }
+
+    payload = transform_payload(
+        "M10",
+        "PremierDraft",
+        scryfall_mock,
+        seventeenlands_mock,
+        {},
+        {},
+        "2019-01-01",
+        "2024-05-01",
+        5000,
+    )
+
+    bolt = payload["card_ratings"]["Lightning Bolt"]["deck_colors"]
+    assert bolt == {
+        "All Decks": {"gihwr": 62.5, "alsa": 2.1, "samples": 5000},
+        "UR": {"gihwr": 64.0, "samples": 1000},
+    }
+    assert payload["card_ratings"]["Plains"]["deck_colors"] == {}
+
+    expanded = expand_card_records(json.loads(json.dumps(payload)))
+    assert "stat_defaults" not in expanded
+    for card in expanded["card_ratings"].values():
+        assert list(card["deck_colors"]) == config.ARCHETYPES
+        for stats in card["deck_colors"].values():
+            assert set(stats) == set(DEFAULT_ARCHETYPE_STATS)
+    bolt = expanded["card_ratings"]["123"]["deck_colors"]
+    assert bolt["UR"]["gihwr"] == 64.0 and bolt["UR"]["alsa"] == 0.0
+    assert bolt["All Decks"]["alsa"] == 2.1
+    assert bolt["WU"] == DEFAULT_ARCHETYPE_STATS
+
+
+def test_legacy_payload_matches_expanded_schema():
+    """Verifies that the schema 3 copy for older clients holds the cards the client expands."""
+    scryfall_mock = {
+        "Lightning Bolt": {"arena_ids": [123, 456], "cmc": 1, "types": ["Instant"]},
+        "Plains": {"arena_ids": [1], "types": ["Land", "Basic"]},
+    }
+    seventeenlands_mock = {
+        "All Decks": {"Lightning Bolt": {"gihwr": 62.5, "alsa": 2.1, "samples": 5000}},
+        "UR": {"Lightning Bolt": {"gihwr": 64.0, "samples": 1000}},
+    }
+    payload = transform_payload(
+        "M10",
+        "PremierDraft",
+        scryfall_mock,
+        seventeenlands_mock,
+        {},
+        {},
+        "2019-01-01",
+        "2024-05-01",
+        5000,
+    )
+
+    legacy = json.loads(json.dumps(legacy_payload(payload)))
+    expanded = expand_card_records(json.loads(json.dumps(payload)))
+
+    assert legacy["meta"]["version"] == config.LEGACY_DATASET_SCHEMA_VERSION
+    assert "id_index" not in legacy and "stat_defaults" not in legacy
+    assert legacy["card_ratings"] == expanded["card_ratings"]
+    assert sorted(legacy["card_ratings"]) == ["1", "123", "456"]
+    # The compact payload is left as it was
+    assert payload["card_ratings"]["Plains"]["deck_colors"] == {}
+
+
 def test_parse_scryfall_types():
     """Ensure we correctly strip supertypes and split tribal lines, including DFCs."""
     types, subtypes = parse_scryfall_types("Legendary Creature — Human Ninja")
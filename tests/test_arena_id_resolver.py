@@ -0,0 +1,139 @@
+"""
+tests/test_arena_id_resolver.py
+Tests for the batched, persisted Arena grpId resolver.
+"""
+
+import os
+import sqlite3
+import pytest
+from unittest.mock import patch
+from src import constants
+from src.arena_id_resolver import ArenaIdResolver
+from src.dataset import Dataset
+
+CARDS = {
+    90001: "Lightning Strike",
+    90002: "Lightning Strike",
+    90003: "Divine Verdict",
+}
+
+
+def _create_database(folder, name="Raw_CardDatabase_abc123.mtga", cards=CARDS):
+    os.makedirs(folder, exist_ok=True)
+    connection = sqlite3.connect(os.path.join(folder, name))
+    connection.execute("CREATE TABLE Cards (GrpId INTEGER, TitleId INTEGER)")
+    connection.execute("CREATE TABLE Localizations_enUS (LocId INTEGER, Loc TEXT)")
+    titles = {title: index for index, title in enumerate(set(cards.values()))}
+    connection.executemany(
+        "INSERT INTO Cards VALUES (?, ?)",
+        [(grp_id, titles[title]) for grp_id, title in cards.items()],
+    )
+    connection.executemany(
+        "INSERT INTO Localizations_enUS VALUES (?, ?)",
+        [(loc_id, title) for title, loc_id in titles.items()],
+    )
+    connection.commit()
+    connection.close()
+
+
+@pytest.fixture
+def arena_path(tmp_path):
+    path = tmp_path / "MTGA_Data"
+    _create_database(str(path / constants.LOCAL_DOWNLOADS_DATA))
+    return str(path)
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return str(tmp_path / "Temp" / constants.ARENA_ID_CACHE_FILE_NAME)
+
+
+def test_resolve_batches_unknown_ids(arena_path, cache_file):
+    resolver = ArenaIdResolver(arena_path, cache_file)
+
+    names = resolver.resolve(["90001", "90003", "99999", "90001"])
+
+    assert names == {
+        "90001": "Lightning Strike",
+        "90003": "Divine Verdict",
+        "99999": "99999",
+    }
+    assert resolver.queries == 1
+
+    # Every id is cached, including the one the database does not know
+    resolver.resolve(["90001", "99999"])
+    assert resolver.queries == 1
+    resolver.close()
+
+
+def test_resolutions_persist_across_instances(arena_path, cache_file):
+    first = ArenaIdResolver(arena_path, cache_file)
+    first.resolve(["90002"])
+    first.close()
+
+    second = ArenaIdResolver(arena_path, cache_file)
+    assert second.resolve(["90002"]) == {"90002": "Lightning Strike"}
+    assert second.queries == 0
+    second.close()
+
+
+def test_new_database_invalidates_cache(arena_path, cache_file):
+    resolver = ArenaIdResolver(arena_path, cache_file)
+    resolver.resolve(["90003"])
+    resolver.close()
+
+    raw_folder = os.path.join(arena_path, constants.LOCAL_DOWNLOADS_DATA)
+    os.remove(os.path.join(raw_folder, "Raw_CardDatabase_abc123.mtga"))
+    _create_database(
+        raw_folder, "Raw_CardDatabase_def456.mtga", {90003: "Divine Verdict (A)"}
+    )
+
+    resolver = ArenaIdResolver(arena_path, cache_file)
+    assert resolver.resolve(["90003"]) == {"90003": "Divine Verdict (A)"}
+    assert resolver.queries == 1
+    resolver.close()
+
+
+def test_warm_up_resolves_printings_by_name(arena_path, cache_file):
+    resolver = ArenaIdResolver(arena_path, cache_file)
+
+    assert resolver.warm_up(["Lightning Strike"]) == 2
+    assert resolver.warm_up(["Lightning Strike"]) == 0
+    queries = resolver.queries
+
+    assert resolver.resolve(["90001", "90002"]) == {
+        "90001": "Lightning Strike",
+        "90002": "Lightning Strike",
+    }
+    assert resolver.queries == queries
+    resolver.close()
+
+
+def test_missing_database_returns_ids(tmp_path, cache_file):
+    resolver = ArenaIdResolver(str(tmp_path / "missing"), cache_file)
+    assert resolver.resolve(["90001"]) == {"90001": "90001"}
+    assert resolver.warm_up(["Lightning Strike"]) == 0
+    assert not os.path.exists(cache_file)
+
+
+def test_dataset_resolves_pack_in_one_batch(arena_path, cache_file):
+    dataset = Dataset(retrieve_unknown=True, db_path=arena_path)
+    dataset._dataset = {
+        "card_ratings": {"1": {constants.DATA_FIELD_NAME: "Divine Verdict"}}
+    }
+    dataset._id_index = {"Divine Verdict": "1"}
+    resolver = ArenaIdResolver(arena_path, cache_file)
+
+    with patch("src.dataset.get_arena_id_resolver", return_value=resolver):
+        cards = dataset.get_data_by_id([1, 90003, 90001, 99999])
+
+    assert resolver.queries == 1
+    assert [c[constants.DATA_FIELD_NAME] for c in cards] == [
+        "Divine Verdict",
+        "Divine Verdict",
+        "Lightning Strike",
+        "99999",
+    ]
+    # The new printing now maps to the dataset's record
+    assert dataset.get_card_ratings()["90003"] is cards[0]
+    resolver.close()
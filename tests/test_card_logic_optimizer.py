@@ -49,7 +49,7 @@ def base_deck_and_sb():
     return base_deck, base_sb
 
 
-def mock_simulator_results(deck, iterations):
+def mock_simulator_results(deck, iterations, seed=None):
     """
     Returns a mocked stats dictionary. We artificially boost the score if the
     'Premium 2-Drop' is in the deck to force the optimizer to select that permutation.
@@ -113,3 +113,22 @@ def test_optimize_deck_rejects_invalid_deck_sizes():
 
     assert final_stats is None
     assert final_deck == deck
+
+
+@patch("src.card_logic.simulate_deck", side_effect=mock_simulator_results)
+def test_optimize_deck_screens_permutations_on_shared_shuffles(
+    mock_sim, base_deck_and_sb
+):
+    """Permutations are screened with one seed, aligned to the base deck's slots."""
+    base_deck, base_sb = base_deck_and_sb
+
+    optimize_deck(base_deck, base_sb, archetype_key="G", colors=["G"])
+
+    screenings = mock_sim.call_args_list[:-1]
+    assert len({call.kwargs["seed"] for call in screenings}) == 1
+    base_slots = [c["name"] for c in screenings[0].args[0]]
+    for call in screenings[1:]:
+        slots = [c["name"] for c in call.args[0]]
+        assert len(slots) == 40
+        # A one-card swap leaves the other 39 slots unchanged
+        assert sum(a != b for a, b in zip(base_slots, slots)) == 1
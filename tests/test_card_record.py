@@ -0,0 +1,64 @@
+"""
+tests/test_card_record.py
+Tests for the compact CardRecord view and the card_stat accessor.
+"""
+
+import os
+import pytest
+from src import constants
+from src.dataset import Dataset
+from src.card_record import CardRecord, card_stat
+from src.card_logic import get_card_rating
+
+OTJ_PREMIER_SNAPSHOT = os.path.join(
+    os.getcwd(), "tests", "data", "OTJ_PremierDraft_Data_2024_5_3.json"
+)
+
+
+@pytest.fixture
+def compiled_dataset(tmp_path, monkeypatch):
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path))
+    Dataset().open_file(OTJ_PREMIER_SNAPSHOT)
+    dataset = Dataset()
+    dataset.open_file(OTJ_PREMIER_SNAPSHOT)
+    return dataset
+
+
+def test_records_match_card_dicts(compiled_dataset):
+    ids = list(compiled_dataset.get_card_ratings())
+    records = compiled_dataset.get_records_by_id(ids)
+    cards = compiled_dataset.get_data_by_id(ids)
+
+    assert all(isinstance(r, CardRecord) for r in records)
+    for record, card in zip(records, cards):
+        assert dict(record) == card
+        assert record.get("rarity") == card.get("rarity")
+        assert record.get("missing_key", "x") == "x"
+        for archetype in list(card["deck_colors"]) + ["XYZ"]:
+            for field in ("gihwr", "alsa", "ngp", "missing_field"):
+                assert card_stat(record, archetype, field) == card_stat(
+                    card, archetype, field
+                )
+        assert get_card_rating(record, ["W", "U"]) == get_card_rating(card, ["W", "U"])
+
+
+def test_records_fall_back_for_unknown_ids(compiled_dataset):
+    records = compiled_dataset.get_records_by_id(["87050", "999999999"])
+    assert len(records) == 1
+    assert records[0]["name"] == "Rest in Peace"
+
+
+def test_records_are_dicts_without_compiled_dataset(tmp_path, monkeypatch):
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path))
+    dataset = Dataset()
+    # The first open reads the JSON, and compiles it for later opens
+    dataset.open_file(OTJ_PREMIER_SNAPSHOT)
+    records = dataset.get_records_by_id(["87050"])
+    assert type(records[0]) is dict
+
+
+def test_card_record_has_no_instance_dict(compiled_dataset):
+    record = compiled_dataset.get_records_by_id(["87050"])[0]
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(KeyError):
+        record["missing_key"]
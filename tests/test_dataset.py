@@ -1,7 +1,13 @@
 import pytest
 import os
 import json
+from src import constants
 from src.dataset import Dataset
+from src.compiled_dataset import (
+    CompiledCardRatings,
+    compiled_dataset_path,
+    load_compiled_dataset,
+)
 from src.utils import Result
 from src.constants import DATA_FIELD_GIHWR
 from unittest.mock import patch
@@ -617,3 +623,121 @@ def test_dataset_normalization_on_load(tmp_path):
         card_colors = cards["1"]["deck_colors"]
         assert "WG" in card_colors
         assert "GW" not in card_colors
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    ["OTJ_PremierDraft_Data_2024_5_3.json", "MKM_PremierDraft_Data_2024_5_3.json"],
+)
+def test_compiled_dataset_matches_json(file_name, tmp_path, monkeypatch):
+    """
+    Verify that the compiled dataset written on the first load returns exactly
+    what the JSON load returns, without reading the JSON again.
+    """
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path))
+    location = os.path.join(os.getcwd(), "tests", "data", file_name)
+
+    from_json = Dataset()
+    assert from_json.open_file(location) == Result.VALID
+    assert os.path.exists(compiled_dataset_path(location))
+
+    with patch("src.dataset.check_file_integrity") as integrity:
+        compiled = Dataset()
+        assert compiled.open_file(location) == Result.VALID
+        integrity.assert_not_called()
+
+    assert isinstance(compiled.get_card_ratings(), CompiledCardRatings)
+    assert dict(compiled.get_card_ratings()) == from_json.get_card_ratings()
+    assert compiled.get_color_ratings() == from_json.get_color_ratings()
+    names = sorted(from_json.get_all_names())
+    assert sorted(compiled.get_all_names()) == names
+    assert compiled.get_ids_by_name(names) == from_json.get_ids_by_name(names)
+    assert compiled.get_card_archetypes_by_field(
+        names[0], DATA_FIELD_GIHWR
+    ) == from_json.get_card_archetypes_by_field(names[0], DATA_FIELD_GIHWR)
+
+
+def test_compiled_dataset_builds_cards_lazily(tmp_path, monkeypatch):
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path))
+    Dataset().open_file(OTJ_PREMIER_SNAPSHOT)
+
+    dataset = Dataset()
+    dataset.open_file(OTJ_PREMIER_SNAPSHOT)
+    ratings = dataset.get_card_ratings()
+    assert len(ratings) > 400 and not ratings._cards
+
+    first = dataset.get_data_by_name(["Rest in Peace"])[0]
+    assert dataset.get_data_by_id([87050])[0] is first
+    assert len(ratings._cards) == 1
+
+
+def test_compiled_dataset_stale_after_source_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path / "Temp"))
+    location = tmp_path / "OTJ_PremierDraft_All_Data.json"
+    with open(OTJ_PREMIER_SNAPSHOT, "r", encoding="utf-8") as source:
+        location.write_text(source.read(), encoding="utf-8")
+
+    Dataset().open_file(str(location))
+    assert load_compiled_dataset(str(location)) is not None
+
+    os.utime(location, (1, 1))
+    assert load_compiled_dataset(str(location)) is None
+    # Reopening recompiles against the new mtime
+    Dataset().open_file(str(location))
+    assert load_compiled_dataset(str(location)) is not None
+
+
+def test_loaded_compiled_dataset_does_not_hold_its_file(tmp_path, monkeypatch):
+    """
+    Verify that a recompile can replace, and the download window delete, the
+    compiled file of a dataset that is still loaded (both fail on Windows while
+    the file is mapped).
+    """
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path / "Temp"))
+    location = tmp_path / "OTJ_PremierDraft_All_Data.json"
+    with open(OTJ_PREMIER_SNAPSHOT, "r", encoding="utf-8") as source:
+        location.write_text(source.read(), encoding="utf-8")
+    Dataset().open_file(str(location))
+    loaded = Dataset()
+    loaded.open_file(str(location))
+
+    os.utime(location, (1, 1))
+    Dataset().open_file(str(location))
+    assert load_compiled_dataset(str(location)) is not None
+    os.remove(compiled_dataset_path(str(location)))
+
+    # Cards are still built lazily from the loaded copy
+    expected = Dataset()
+    expected.open_file(OTJ_PREMIER_SNAPSHOT)
+    assert loaded.get_data_by_id([87050]) == expected.get_data_by_id([87050])
+
+
+def test_schema_4_dataset_shares_card_records(tmp_path, monkeypatch):
+    """
+    Verify that a dataset with one record per card and an id_index loads like the
+    per-arena-id layout, with every printing resolving to the same card.
+    """
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path / "Temp"))
+    with open(OTJ_PREMIER_SNAPSHOT, "r", encoding="utf-8") as source:
+        legacy = json.load(source)
+
+    records, id_index = {}, {}
+    for arena_id, card in legacy["card_ratings"].items():
+        records.setdefault(card["name"], card)
+        id_index[arena_id] = card["name"]
+    deduplicated = dict(legacy, card_ratings=records, id_index=id_index)
+    deduplicated["meta"] = dict(legacy["meta"], version=4.0)
+    location = tmp_path / "OTJ_PremierDraft_All_Data.json"
+    location.write_text(json.dumps(deduplicated), encoding="utf-8")
+    assert location.stat().st_size < os.path.getsize(OTJ_PREMIER_SNAPSHOT)
+
+    expected = Dataset()
+    expected.open_file(OTJ_PREMIER_SNAPSHOT)
+    for _ in range(2):  # JSON load, then the compiled load
+        dataset = Dataset()
+        assert dataset.open_file(str(location)) == Result.VALID
+        ratings = dataset.get_card_ratings()
+        assert sorted(ratings) == sorted(legacy["card_ratings"])
+        assert ratings["73807"] is ratings["87050"]
+        assert ratings["73807"]["name"] == "Rest in Peace"
+        assert sorted(dataset.get_all_names()) == sorted(expected.get_all_names())
@@ -0,0 +1,160 @@
+"""
+tests/test_dataset_cache.py
+Tests for the LRU of loaded datasets that the scanner swaps between.
+"""
+
+import os
+import json
+import shutil
+import pytest
+from unittest.mock import MagicMock, patch
+from src import constants
+from src.dataset import Dataset
+from src.dataset_cache import DatasetCache
+from src.log_scanner import ArenaScanner
+from src.utils import Result
+
+TEST_DATASET = os.path.join(
+    os.getcwd(), "tests", "data", "OTJ_PremierDraft_Data_2024_5_3.json"
+)
+
+
+@pytest.fixture
+def datasets(tmp_path, monkeypatch):
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path / "Temp"))
+    paths = []
+    for name in ("OTJ_PremierDraft_All_Data.json", "OTJ_TradDraft_All_Data.json"):
+        path = tmp_path / name
+        shutil.copyfile(TEST_DATASET, path)
+        paths.append(str(path))
+    return paths
+
+
+def _load(path):
+    dataset = Dataset()
+    assert dataset.open_file(path) == Result.VALID
+    return dataset
+
+
+def test_cache_returns_loaded_pair(datasets):
+    cache = DatasetCache(64)
+    dataset, metrics = _load(datasets[0]), object()
+    cache.put(datasets[0], dataset, metrics)
+
+    assert cache.get(datasets[0]) == (dataset, metrics)
+    assert cache.get(datasets[1]) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_drops_changed_file(datasets):
+    cache = DatasetCache(64)
+    cache.put(datasets[0], _load(datasets[0]), object())
+
+    stat = os.stat(datasets[0])
+    os.utime(datasets[0], (stat.st_atime, stat.st_mtime + 10))
+
+    # A refreshed file is not reported as cached, even before get drops it
+    assert datasets[0] not in cache
+    assert cache.get(datasets[0]) is None
+    assert datasets[0] not in cache
+
+
+def test_cache_evicts_least_recently_used(datasets, tmp_path):
+    third = str(tmp_path / "OTJ_PremierDraft_Top_Data.json")
+    shutil.copyfile(TEST_DATASET, third)
+    cache = DatasetCache(64)
+
+    # Room for two entries: the third evicts the least recently used one
+    with patch(
+        "src.dataset_cache.estimate_dataset_bytes",
+        return_value=cache.budget_bytes // 2,
+    ):
+        cache.put(datasets[0], _load(datasets[0]), None)
+        cache.put(datasets[1], _load(datasets[1]), None)
+        cache.get(datasets[0])
+        cache.put(third, _load(third), None)
+
+    assert datasets[0] in cache
+    assert datasets[1] not in cache
+    assert third in cache
+
+
+def test_cache_keeps_newest_entry_over_budget(datasets):
+    cache = DatasetCache(1)
+    with patch(
+        "src.dataset_cache.estimate_dataset_bytes",
+        return_value=cache.budget_bytes + 1,
+    ):
+        cache.put(datasets[0], _load(datasets[0]), None)
+        cache.put(datasets[1], _load(datasets[1]), None)
+
+    assert len(cache) == 1
+    assert datasets[1] in cache
+
+
+def test_cache_disabled_with_zero_budget(datasets):
+    cache = DatasetCache(0)
+    cache.put(datasets[0], _load(datasets[0]), None)
+    assert len(cache) == 0
+
+
+def test_scanner_swaps_cached_dataset(datasets):
+    scanner = ArenaScanner("log.txt", MagicMock(), retrieve_unknown=False)
+    premier, trad = datasets
+
+    assert scanner.retrieve_set_data(premier) == Result.VALID
+    premier_data = scanner.set_data
+    premier_metrics = scanner.retrieve_set_metrics()
+    assert scanner.retrieve_set_data(trad) == Result.VALID
+    assert scanner.set_data is not premier_data
+
+    # Switching back reuses the loaded dataset and its metrics without a reload
+    with patch.object(Dataset, "open_file") as open_file:
+        assert scanner.retrieve_set_data(premier) == Result.VALID
+    open_file.assert_not_called()
+    assert scanner.set_data is premier_data
+    assert scanner.retrieve_set_metrics() is premier_metrics
+    assert premier_data.get_card_ratings()
+
+
+def test_scanner_full_clear_keeps_cached_dataset(datasets):
+    scanner = ArenaScanner("log.txt", MagicMock(), retrieve_unknown=False)
+    scanner.retrieve_set_data(datasets[0])
+    cached = scanner.set_data
+
+    scanner.clear_draft(True)
+
+    assert scanner.set_data is not cached
+    assert scanner.set_data._dataset is None
+    assert cached.get_card_ratings()
+    assert scanner.dataset_cache.get(datasets[0])[0] is cached
+
+
+def test_scanner_caches_compiled_copy_of_json_dataset(datasets):
+    scanner = ArenaScanner("log.txt", MagicMock(), retrieve_unknown=False)
+    assert scanner.retrieve_set_data(datasets[0]) == Result.VALID
+
+    # The first open decoded the JSON, but the compiled copy is what stays loaded
+    cached, _ = scanner.dataset_cache.get(datasets[0])
+    assert cached is scanner.set_data
+    assert cached._table is not None
+    assert cached.get_card_ratings()
+
+
+def test_cache_keeps_two_full_size_datasets(tmp_path, monkeypatch):
+    from src.compiled_dataset import compiled_dataset_path
+
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path / "Temp"))
+    os.makedirs(os.path.dirname(compiled_dataset_path("any.json")))
+    cache = DatasetCache()
+    paths = []
+    for name in ("OTJ_PremierDraft_All_Data.json", "MKM_PremierDraft_All_Data.json"):
+        # A 23 MB dataset compiles to about 7.5 MB
+        path = str(tmp_path / name)
+        for location, size_mb in ((path, 23), (compiled_dataset_path(path), 7.5)):
+            with open(location, "wb") as f:
+                f.truncate(int(size_mb * 1024 * 1024))
+        cache.put(path, MagicMock(_table=object()), object())
+        paths.append(path)
+
+    assert all(path in cache for path in paths)
@@ -0,0 +1,109 @@
+"""
+tests/test_dataset_catalog.py
+Tests for the dataset sidecar catalog used to list local datasets.
+"""
+
+import os
+import json
+import pytest
+from unittest.mock import patch
+import src.utils
+from src import constants
+from src.utils import (
+    Result,
+    catalog_dataset,
+    check_file_integrity,
+    retrieve_local_set_list,
+)
+from src.dataset_catalog import DatasetCatalog
+
+
+def _dataset(game_count):
+    return {
+        "meta": {
+            "version": 2,
+            "start_date": "2024-04-16",
+            "end_date": "2024-05-07",
+            "collection_date": "2024-05-08 10:00:00",
+            "game_count": game_count,
+        },
+        "card_ratings": {
+            str(i): {constants.DATA_FIELD_NAME: f"Card {i}"} for i in range(12)
+        },
+    }
+
+
+@pytest.fixture
+def sets_folder(tmp_path, monkeypatch):
+    folder = tmp_path / "Sets"
+    folder.mkdir()
+    for name, games in (
+        ("OTJ_PremierDraft_All_Data.json", 100),
+        ("MKM_QuickDraft_All_Data.json", 200),
+    ):
+        (folder / name).write_text(json.dumps(_dataset(games)))
+    (folder / "OTJ_PremierDraft_Top_Data.json").write_text('{"meta": {}}')
+
+    monkeypatch.setattr(src.utils, "SETS_FOLDER", str(folder))
+    monkeypatch.setattr(src.utils, "_DATASET_CATALOGS", {})
+    monkeypatch.setattr(src.utils, "_LOCAL_SET_CACHE", {"mtime": 0.0, "files": []})
+    return folder
+
+
+def _list_datasets():
+    """Runs a cold listing and returns (file_list, number of full-file parses)."""
+    src.utils.invalidate_local_set_cache()
+    with patch(
+        "src.utils.check_file_integrity", side_effect=check_file_integrity
+    ) as integrity:
+        file_list, errors = retrieve_local_set_list()
+    assert not errors
+    return sorted(file_list), integrity.call_count
+
+
+def test_listing_reads_catalog_instead_of_datasets(sets_folder):
+    first, parses = _list_datasets()
+    assert parses == 3
+    assert [(f[0], f[1], f[5]) for f in first] == [
+        ("MKM", "QuickDraft", 200),
+        ("OTJ", "PremierDraft", 100),
+    ]
+
+    # A fresh process only has the catalog file to go on
+    src.utils._DATASET_CATALOGS.clear()
+    second, parses = _list_datasets()
+    assert parses == 0
+    assert second == first
+
+    entry = DatasetCatalog(str(sets_folder)).lookup("OTJ_PremierDraft_All_Data.json")
+    assert entry["card_count"] == 12
+    assert entry["meta"]["game_count"] == 100
+    assert len(entry["hash"]) == 64
+
+
+def test_changed_and_deleted_datasets(sets_folder):
+    _list_datasets()
+
+    changed = sets_folder / "MKM_QuickDraft_All_Data.json"
+    changed.write_text(json.dumps(_dataset(999)))
+    os.utime(changed, (1, 1))
+    os.remove(sets_folder / "OTJ_PremierDraft_All_Data.json")
+
+    file_list, parses = _list_datasets()
+    assert parses == 1
+    assert [(f[0], f[5]) for f in file_list] == [("MKM", 999)]
+    catalog = DatasetCatalog(str(sets_folder))
+    assert catalog.lookup("OTJ_PremierDraft_All_Data.json") is None
+
+
+def test_catalog_dataset_records_new_file(sets_folder):
+    location = sets_folder / "DSK_PremierDraft_All_Data.json"
+    data = _dataset(50)
+    location.write_text(json.dumps(data))
+
+    assert catalog_dataset(str(location), data) == Result.VALID
+    assert DatasetCatalog(str(sets_folder)).lookup(location.name)["valid"]
+
+    file_list, parses = _list_datasets()
+    assert parses == 3  # The two fixture datasets and the invalid one
+    assert "DSK" in [f[0] for f in file_list]
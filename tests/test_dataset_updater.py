@@ -98,3 +98,75 @@ def test_sync_datasets_skips_existing_hashes(mock_get, updater, tmp_path):
 
     # Assert: Network was only hit twice (Health + Manifest), meaning file download was skipped
     assert mock_get.call_count == 2
+
+
+@patch("src.dataset_updater.requests.get")
+def test_sync_datasets_skips_newer_schema(mock_get, updater, tmp_path):
+    mock_manifest_response = MagicMock()
+    mock_manifest_response.status_code = 200
+    mock_manifest_response.json.return_value = {
+        "datasets": {
+            "MH3_PremierDraft_All": {
+                "hash": "future_hash",
+                "filename": "MH3_PremierDraft_All_Data.json.gz",
+                "schema": 99,
+            }
+        }
+    }
+
+    mock_get.side_effect = [
+        MagicMock(
+            status_code=200, json=lambda: {"pipeline_run": {"status": "SUCCESS"}}
+        ),
+        mock_manifest_response,
+    ]
+
+    updater.sync_datasets(MagicMock())
+
+    assert mock_get.call_count == 2
+    assert not (tmp_path / "MH3_PremierDraft_All_Data.json").exists()
+
+
+@patch("src.dataset_updater.requests.get")
+def test_sync_datasets_prefers_compact_schema(mock_get, updater, tmp_path):
+    mock_manifest_response = MagicMock()
+    mock_manifest_response.status_code = 200
+    mock_manifest_response.json.return_value = {
+        "datasets": {
+            "MH3_PremierDraft_All": {
+                "hash": "legacy_hash",
+                "filename": "MH3_PremierDraft_All_Data.json.gz",
+                "schema": 3,
+            }
+        },
+        "compact_datasets": {
+            "MH3_PremierDraft_All": {
+                "hash": "compact_hash",
+                "filename": "compact/MH3_PremierDraft_All_Data.json.gz",
+                "schema": 5,
+            }
+        },
+    }
+    mock_gz_response = MagicMock()
+    mock_gz_response.status_code = 200
+    mock_gz_response.content = gzip.compress(b'{"mock_card": "data"}')
+
+    mock_get.side_effect = [
+        MagicMock(
+            status_code=200, json=lambda: {"pipeline_run": {"status": "SUCCESS"}}
+        ),
+        mock_manifest_response,
+        mock_gz_response,
+    ]
+
+    updater.sync_datasets(MagicMock())
+
+    assert (
+        mock_get.call_args_list[-1]
+        .args[0]
+        .endswith("compact/MH3_PremierDraft_All_Data.json.gz")
+    )
+    # Saved under the usual local name
+    assert (tmp_path / "MH3_PremierDraft_All_Data.json").exists()
+    local_manifest = updater.get_local_manifest()
+    assert local_manifest["datasets"]["MH3_PremierDraft_All"]["hash"] == "compact_hash"
@@ -0,0 +1,74 @@
+"""
+tests/test_deck_analytics.py
+Tests for the exact mana analytics.
+"""
+
+import numpy as np
+import pytest
+from math import comb, sqrt
+from src.deck_analytics import ANALYTIC_KEYS, exact_mana_stats
+from src.deck_simulation import encode_deck
+from tests.test_deck_simulation import _legacy_counts
+
+
+def _land(name, colors, count=1):
+    return {"name": name, "types": ["Land", "Basic"], "colors": colors, "count": count}
+
+
+def _spell(name, mana_cost, cmc, count=1, tags=None):
+    return {
+        "name": name,
+        "types": ["Creature"],
+        "mana_cost": mana_cost,
+        "cmc": cmc,
+        "count": count,
+        "tags": tags or [],
+    }
+
+
+MIXED_DECK = [
+    _land("Forest", ["G"], 16),
+    _spell("Elf", "{G}", 1, 3),
+    _spell("Bear", "{1}{G}", 2, 6),
+    _spell("Fight", "{1}{G}", 2, 3, tags=["removal"]),
+    _spell("Ape", "{2}{G}", 3, 5),
+    _spell("Wurm", "{4}{G}", 5, 4),
+    _spell("Hydra", "{5}{G}{G}", 7, 3, tags=["removal"]),
+]
+
+
+def test_keep_seven_is_hypergeometric():
+    stats = exact_mana_stats(encode_deck(MIXED_DECK))
+
+    keep_7 = sum(comb(16, k) * comb(24, 7 - k) for k in range(2, 6)) / comb(40, 7)
+    assert stats["keep_7"] == pytest.approx(keep_7 * 100)
+    assert stats["keep_7"] + stats["keep_6"] + stats["keep_5"] == pytest.approx(100)
+    assert stats["mulligans"] == pytest.approx(100 - stats["keep_7"])
+
+
+def test_all_lands_always_mulligans_to_five():
+    stats = exact_mana_stats(encode_deck([_land("Forest", ["G"], 40)]))
+
+    assert stats["keep_5"] == pytest.approx(100)
+    assert stats["avg_hand_size"] == pytest.approx(5)
+    assert stats["flood_t5"] == pytest.approx(100)
+    assert stats["screw_t3"] == stats["screw_t4"] == stats["removal_t4"] == 0
+
+
+def test_exact_stats_match_monte_carlo():
+    # simulate_deck no longer samples these stats, so check against the per-game loop
+    games = 20000
+    rng = np.random.default_rng(5)
+    orders = [rng.permutation(40).tolist() for _ in range(games)]
+    simulated = _legacy_counts(MIXED_DECK, orders)
+    exact = exact_mana_stats(encode_deck(MIXED_DECK))
+
+    for key in ANALYTIC_KEYS:
+        if key == "avg_hand_size":
+            # The hand size's standard deviation is well under 1 card
+            assert exact[key] == pytest.approx(simulated[key] / games, abs=0.02)
+            continue
+        rate = simulated[key] / games
+        # Within four standard errors of the simulated rate
+        error = 4 * max(sqrt(rate * (1 - rate) / games), 1 / games)
+        assert exact[key] == pytest.approx(rate * 100, abs=error * 100)
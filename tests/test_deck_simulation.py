@@ -0,0 +1,379 @@
+"""
+tests/test_deck_simulation.py
+Tests for the vectorized Monte Carlo deck simulator.
+"""
+
+import re
+import numpy as np
+import pytest
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock
+from src.card_logic import get_functional_cmc, simulate_deck
+from src.deck_analytics import ANALYTIC_KEYS
+from src.deck_simulation import (
+    BLOCK_SIZE,
+    ROUND_BLOCKS,
+    SAMPLED_KEYS,
+    STAT_KEYS,
+    SimulationExecutor,
+    align_deck_slots,
+    encode_deck,
+    intervals,
+    play_blocks,
+    play_games,
+    run_simulation,
+    split_blocks,
+)
+
+
+def _land(name, colors, count=1):
+    return {"name": name, "types": ["Land", "Basic"], "colors": colors, "count": count}
+
+
+def _spell(name, mana_cost, cmc, count=1, tags=None):
+    return {
+        "name": name,
+        "types": ["Creature"],
+        "mana_cost": mana_cost,
+        "cmc": cmc,
+        "count": count,
+        "tags": tags or [],
+    }
+
+
+def _games(deck_list, orders, first_option_only=False):
+    """Plays the games whose shuffles are the given card orders."""
+    deck = encode_deck(deck_list, first_option_only)
+    keys = np.argsort(np.array(orders), axis=1).astype(float)
+    return play_games(deck, keys)
+
+
+def test_short_deck_returns_none():
+    assert (
+        simulate_deck([_land("Forest", ["G"], 16), _spell("Bear", "{1}{G}", 2, 23)])
+        is None
+    )
+
+
+def test_simulate_deck_reports_every_stat():
+    deck = [_land("Forest", ["G"], 17), _spell("Bear", "{1}{G}", 2, 23)]
+    stats = simulate_deck(deck, iterations=500)
+
+    assert all(key in stats for key in STAT_KEYS)
+    assert stats["iterations"] == 500
+    # Only the simulated stats carry a sampling error
+    assert set(stats["intervals"]) == set(STAT_KEYS) - set(ANALYTIC_KEYS)
+    assert stats["keep_7"] + stats["keep_6"] + stats["keep_5"] == pytest.approx(100)
+    assert 5 <= stats["avg_hand_size"] <= 7
+    # Mono-colored spells off basics of their color are never color screwed
+    assert stats["color_screw_t3"] == 0
+    assert stats["removal_t4"] == 0
+    assert stats["cast_t3"] == stats["cast_t4"] == stats["curve_out"] == 0
+    assert 0 < stats["cast_t2"] <= 100
+
+
+def test_mulligan_bottoms_highest_cmc():
+    # 40 cards in index order: 7 spells, then 3 lands, 3 giants and a bear, then
+    # the rest
+    deck = [
+        _spell("Seven", "{6}{G}", 7, 7),
+        _land("Forest", ["G"], 3),
+        _spell("Giant", "{5}{G}", 6, 3),
+        _spell("Bear", "{1}{G}", 2),
+        _land("Forest", ["G"], 14),
+        _spell("Elf", "{G}", 1, 12),
+    ]
+    counts = _games(deck, [list(range(40))])
+
+    # One mulligan bottoms a giant rather than the last card of the hand, so the
+    # bear is cast on turn 2
+    assert counts["cast_t2"] == 1
+    assert counts["cast_t3"] == counts["color_screw_t3"] == 0
+
+
+def test_hybrid_pips_pay_with_any_color():
+    deck = [
+        _land("Island", ["U"], 17),
+        _spell("Hybrid", "{1}{W/U}", 2, 23),
+    ]
+    # Hand of 3 Islands and 4 spells
+    order = [0, 1, 2, 17, 18, 19, 20] + list(range(3, 17)) + list(range(21, 40))
+
+    assert _games(deck, [order])["cast_t2"] == 1
+    assert _games(deck, [order])["color_screw_t3"] == 0
+    # The custom deck panel pays a hybrid pip with its first color only
+    first_option = _games(deck, [order], first_option_only=True)
+    assert first_option["cast_t2"] == 0
+    assert first_option["color_screw_t3"] == 1
+
+
+def _legacy_counts(deck_list, orders, first_option_only=False):
+    """
+    The per-game loop simulate_deck used before it was vectorized, replaying the
+    given card orders instead of shuffling. first_option_only keeps only a hybrid
+    pip's first color, like the custom deck panel's copy of the loop.
+    """
+    flat_deck = []
+    for c in deck_list:
+        is_land = "Land" in c.get("types", [])
+        colors_produced = set()
+        if is_land:
+            colors_produced.update(c.get("colors", []))
+            text = str(c.get("text", "")).lower()
+            if "any color" in text or "fixing_ramp" in c.get("tags", []):
+                colors_produced.update(["W", "U", "B", "R", "G"])
+
+        pips = []
+        if not is_land:
+            for pip in re.findall(r"\{(.*?)\}", c.get("mana_cost", "")):
+                opts = [opt for opt in pip.split("/") if opt in "WUBRG"]
+                if opts:
+                    pips.append(opts[:1] if first_option_only else opts)
+
+        for _ in range(int(c.get("count", 1))):
+            flat_deck.append(
+                {
+                    "is_land": is_land,
+                    "is_removal": "removal" in c.get("tags", []),
+                    "colors_produced": colors_produced,
+                    "cmc": get_functional_cmc(c),
+                    "pips": pips,
+                }
+            )
+
+    def can_pay(spell, color_sources):
+        temp_sources = color_sources.copy()
+        for pip_opts in spell["pips"]:
+            for opt in pip_opts:
+                if temp_sources.get(opt, 0) > 0:
+                    temp_sources[opt] -= 1
+                    break
+            else:
+                return False
+        return True
+
+    def sources(lands):
+        color_sources = {"W": 0, "U": 0, "B": 0, "R": 0, "G": 0}
+        for land in lands:
+            for color in land["colors_produced"]:
+                color_sources[color] += 1
+        return color_sources
+
+    def can_cast(state, target_cmc):
+        available_lands = [c for c in state if c["is_land"]]
+        if len(available_lands) < target_cmc:
+            return False
+        spells = [c for c in state if not c["is_land"] and c["cmc"] == target_cmc]
+        color_sources = sources(available_lands)
+        return any(can_pay(s, color_sources) for s in spells)
+
+    stats = dict.fromkeys(STAT_KEYS, 0)
+    for order in orders:
+        game_deck = [flat_deck[i] for i in order]
+
+        mull_count = 0
+        lands = sum(1 for c in game_deck[0:7] if c["is_land"])
+        if lands < 2 or lands > 5:
+            mull_count = 1
+            lands = sum(1 for c in game_deck[7:14] if c["is_land"])
+            if lands < 2 or lands > 4:
+                mull_count = 2
+        if mull_count > 0:
+            stats["mulligans"] += 1
+
+        kept_size = 7 - mull_count
+        stats["avg_hand_size"] += kept_size
+        start_idx = mull_count * 7
+        current_7 = game_deck[start_idx : start_idx + 7]
+        if kept_size < 7:
+            current_7.sort(key=lambda x: x["cmc"])
+        game_state = current_7[:kept_size] + game_deck[start_idx + 7 :]
+
+        t2_state = game_state[: kept_size + 1]
+        t3_state = game_state[: kept_size + 2]
+        t4_state = game_state[: kept_size + 3]
+        t5_state = game_state[: kept_size + 4]
+
+        lands_t3 = [c for c in t3_state if c["is_land"]]
+        stats["screw_t3"] += len(lands_t3) < 3
+        stats["screw_t4"] += sum(1 for c in t4_state if c["is_land"]) < 4
+        stats["flood_t5"] += sum(1 for c in t5_state if c["is_land"]) >= 6
+        stats["removal_t4"] += any(c["is_removal"] for c in t4_state)
+
+        c2 = can_cast(t2_state, 2)
+        c3 = can_cast(t3_state, 3)
+        c4 = can_cast(t4_state, 4)
+        stats["cast_t2"] += c2
+        stats["cast_t3"] += c3
+        stats["cast_t4"] += c4
+        stats["curve_out"] += c2 and c3 and c4
+
+        if len(lands_t3) >= 3:
+            color_sources = sources(lands_t3)
+            t3_spells = [c for c in t3_state if not c["is_land"] and c["cmc"] <= 3]
+            stats["color_screw_t3"] += not all(
+                can_pay(s, color_sources) for s in t3_spells
+            )
+    return stats
+
+
+PARITY_DECK = [
+    _land("Plains", ["W"], 7),
+    _land("Island", ["U"], 8),
+    dict(_land("Prism", [], 2), tags=["fixing_ramp"]),
+    _spell("Sprite", "{W/U}", 1, 3),
+    _spell("Twins", "{1}{W/U}{W/U}", 3, 3),
+    _spell("Envoy", "{W}{U}", 2, 4),
+    _spell("Shade", "{2}{B}", 3, 3),
+    _spell("Denial", "{3}{U}", 4, 4, tags=["removal"]),
+    _spell("Knight", "{1}{W}", 2, 4),
+    _spell("Angel", "{4}{W}{W}", 6, 2),
+]
+
+
+@pytest.mark.parametrize("first_option_only", [False, True])
+def test_play_games_matches_legacy_loop(first_option_only):
+    # The same shuffles give the per-game loop's counts, for both hybrid pip rules
+    rng = np.random.default_rng(21)
+    orders = [rng.permutation(40).tolist() for _ in range(3000)]
+
+    counts = _games(PARITY_DECK, orders, first_option_only)
+    legacy = _legacy_counts(PARITY_DECK, orders, first_option_only)
+
+    assert counts == {key: legacy[key] for key in SAMPLED_KEYS}
+    assert legacy["mulligans"] and legacy["color_screw_t3"] and legacy["curve_out"]
+
+
+TWO_COLOR_DECK = [
+    _land("Plains", ["W"], 8),
+    _land("Island", ["U"], 9),
+    _spell("Strike", "{1}{W}", 2, 11, tags=["removal"]),
+    _spell("Drake", "{2}{U}", 3, 12),
+]
+
+
+def test_run_simulation_splits_blocks(monkeypatch):
+    monkeypatch.setattr("src.deck_simulation.BLOCK_SIZE", 300)
+    assert split_blocks(1000) == [(0, 300), (1, 300), (2, 300), (3, 100)]
+
+    stats = run_simulation(TWO_COLOR_DECK, iterations=1000, seed=7)
+    for key in stats["intervals"]:
+        if key != "avg_hand_size":
+            # Every simulated rate is a whole number of the 1000 games
+            assert stats[key] * 10 == pytest.approx(round(stats[key] * 10))
+    assert 0 < stats["removal_t4"] < 100
+
+
+def test_seed_makes_runs_reproducible():
+    first = simulate_deck(TWO_COLOR_DECK, iterations=2500, seed=11)
+    assert simulate_deck(TWO_COLOR_DECK, iterations=2500, seed=11) == first
+    assert simulate_deck(TWO_COLOR_DECK, iterations=2500, seed=12) != first
+
+
+def test_pool_matches_in_process(monkeypatch):
+    # Shards are merged exactly, so the pool gives the in-process counts
+    monkeypatch.setattr("src.deck_simulation.BLOCK_SIZE", 250)
+    deck = encode_deck(TWO_COLOR_DECK)
+    entropy = np.random.SeedSequence(3).entropy
+    local = SimulationExecutor(max_workers=1).count(deck, 2000, entropy)
+
+    executor = SimulationExecutor(max_workers=2)
+    try:
+        assert executor.count(deck, 2000, entropy) == local
+    finally:
+        executor.shutdown()
+
+
+def test_broken_pool_falls_back_in_process(monkeypatch):
+    deck = encode_deck(TWO_COLOR_DECK)
+    entropy = np.random.SeedSequence(5).entropy
+    expected = play_blocks(deck, entropy, split_blocks(5000))
+    executor = SimulationExecutor(max_workers=2)
+    broken = MagicMock()
+    broken.submit.side_effect = BrokenProcessPool("worker died")
+    monkeypatch.setattr(executor, "_executor", broken)
+
+    assert executor.count(deck, 5000, entropy) == expected
+    broken.shutdown.assert_called_once()
+    assert executor._executor is None
+
+
+def test_tolerance_stops_early_within_budget():
+    stats = simulate_deck(TWO_COLOR_DECK, iterations=20000, seed=2, tolerance=1.5)
+
+    assert stats["iterations"] < 20000
+    assert stats["iterations"] % (ROUND_BLOCKS * BLOCK_SIZE) == 0
+    rates = {k: w for k, w in stats["intervals"].items() if k != "avg_hand_size"}
+    assert max(rates.values()) <= 1.5
+    # Stopping one round earlier would have missed the tolerance
+    shorter = simulate_deck(
+        TWO_COLOR_DECK,
+        iterations=stats["iterations"] - ROUND_BLOCKS * BLOCK_SIZE,
+        seed=2,
+    )
+    assert max(w for k, w in shorter["intervals"].items() if k != "avg_hand_size") > 1.5
+
+
+def test_tolerance_respects_budget():
+    stats = simulate_deck(TWO_COLOR_DECK, iterations=3000, seed=2, tolerance=0.1)
+    assert stats["iterations"] == 3000
+
+
+def test_tolerance_run_on_pool_matches_in_process(monkeypatch):
+    # The whole budget is queued on the pool, but rounds are still checked in order
+    monkeypatch.setattr("src.deck_simulation.BLOCK_SIZE", 250)
+    monkeypatch.setattr(
+        "src.deck_simulation.get_simulation_executor",
+        lambda: SimulationExecutor(max_workers=1),
+    )
+    local = simulate_deck(TWO_COLOR_DECK, iterations=20000, seed=4, tolerance=2.5)
+    assert local["iterations"] < 20000
+
+    executor = SimulationExecutor(max_workers=2)
+    monkeypatch.setattr("src.deck_simulation.get_simulation_executor", lambda: executor)
+    try:
+        pooled = simulate_deck(TWO_COLOR_DECK, iterations=20000, seed=4, tolerance=2.5)
+    finally:
+        executor.shutdown()
+    assert pooled == local
+
+
+def test_wilson_interval_for_certain_outcomes():
+    # Rates of 0% and 100% still get a positive half-width
+    counts = dict.fromkeys(SAMPLED_KEYS, 0)
+    counts.update(cast_t2=1000)
+    half_widths = intervals(counts, 1000)
+
+    assert half_widths["cast_t2"] == half_widths["cast_t3"]
+    assert half_widths["cast_t3"] == pytest.approx(0.19, abs=0.01)
+
+
+def test_align_deck_slots_puts_swapped_card_in_freed_slot():
+    base = [_land("Forest", ["G"], 2), _spell("Bear", "{1}{G}", 2, 2)]
+    deck = [
+        _spell("Elf", "{G}", 1),
+        _land("Forest", ["G"]),
+        _spell("Bear", "{1}{G}", 2, 2),
+    ]
+
+    aligned = align_deck_slots(base, deck)
+
+    assert [c["name"] for c in aligned] == ["Forest", "Elf", "Bear", "Bear"]
+    assert all(c["count"] == 1 for c in aligned)
+
+
+def test_aligned_decks_share_shuffles():
+    # Swapping a spell for a twin with another name changes nothing game by game
+    swapped = [dict(card) for card in TWO_COLOR_DECK]
+    swapped[3] = dict(swapped[3], count=11)
+    swapped.insert(0, _spell("Drake Twin", "{2}{U}", 3))
+
+    base_stats = simulate_deck(
+        align_deck_slots(TWO_COLOR_DECK, TWO_COLOR_DECK), iterations=3000, seed=4
+    )
+    swapped_stats = simulate_deck(
+        align_deck_slots(TWO_COLOR_DECK, swapped), iterations=3000, seed=4
+    )
+    assert swapped_stats == base_stats
+    # Without alignment the twin moves every card after it to another slot
+    assert simulate_deck(swapped, iterations=3000, seed=4) != base_stats
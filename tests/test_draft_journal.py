@@ -0,0 +1,165 @@
+"""
+tests/test_draft_journal.py
+Test suite for the snapshot + append-only draft journal.
+"""
+
+import os
+import json
+import pytest
+import src.constants as constants
+from src.draft_journal import DraftJournal
+from src.log_scanner import ArenaScanner
+from tests.test_log_scanner_data import (
+    TEST_SETS,
+    OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7,
+    OTJ_QUICK_DRAFT_ENTRIES,
+)
+
+TEST_SETS_DIRECTORY = os.path.join(os.getcwd(), "tests", "data")
+
+STATE_FIELDS = [
+    "draft_type",
+    "draft_sets",
+    "event_string",
+    "current_draft_id",
+    "taken_cards",
+    "picked_cards",
+    "initial_pack",
+    "pack_cards",
+    "current_pack",
+    "current_pick",
+    "previous_scanned_pack",
+    "previous_picked_pack",
+    "current_picked_pick",
+    "draft_history",
+]
+
+
+@pytest.fixture
+def temp_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path))
+    return tmp_path
+
+
+def _run_draft(temp_folder, entries):
+    log_path = str(temp_folder / "Player.log")
+    scanner = ArenaScanner(log_path, TEST_SETS, sets_location=TEST_SETS_DIRECTORY)
+    scanner.log_enable(False)
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        for _, _, entry_string in entries:
+            log_file.write(f"{entry_string}\n")
+            log_file.flush()
+            scanner.scan_log()
+    scanner.journal.close()
+    return scanner
+
+
+def _fields(scanner):
+    return {field: getattr(scanner, field) for field in STATE_FIELDS}
+
+
+@pytest.mark.parametrize(
+    "entries", [OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7, OTJ_QUICK_DRAFT_ENTRIES]
+)
+def test_journal_replay_matches_memory(temp_folder, entries):
+    """Verify that snapshot + journal replay rebuilds exactly the in-memory draft state."""
+    scanner = _run_draft(temp_folder, entries)
+    assert os.path.getsize(scanner.journal.journal_file) > 0
+
+    restored = ArenaScanner(
+        scanner.arena_file, TEST_SETS, sets_location=TEST_SETS_DIRECTORY
+    )
+    assert _fields(restored) == _fields(scanner)
+
+
+def test_journal_pick_records_are_compact(temp_folder):
+    """Verify that a pick appends only its delta instead of rewriting the full draft history."""
+    scanner = _run_draft(temp_folder, OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7)
+    with open(scanner.journal.journal_file, "r", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+
+    assert records
+    for record in records[1:]:
+        assert "draft_history" not in record.get("set", {})
+        assert "taken_cards" not in record.get("set", {})
+        assert len(record.get("append", {}).get("draft_history", [])) <= 1
+        assert len(record.get("append", {}).get("taken_cards", [])) <= 1
+
+
+def test_journal_compaction(temp_folder, monkeypatch):
+    """Verify that the journal is folded into the snapshot after the configured record count."""
+    monkeypatch.setattr(constants, "DRAFT_JOURNAL_COMPACT_RECORDS", 3)
+    scanner = _run_draft(temp_folder, OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7)
+
+    with open(scanner.state_file, "r", encoding="utf-8") as f:
+        assert json.load(f)["journal_seq"] > 0
+    with open(scanner.journal.journal_file, "r", encoding="utf-8") as f:
+        assert len(f.readlines()) <= 3
+
+    restored = ArenaScanner(
+        scanner.arena_file, TEST_SETS, sets_location=TEST_SETS_DIRECTORY
+    )
+    assert _fields(restored) == _fields(scanner)
+
+
+def test_journal_ignores_torn_and_orphaned_records(tmp_path):
+    """Verify that a crash mid-append or a journal without a snapshot cannot corrupt the state."""
+    journal = DraftJournal(str(tmp_path / "state.json"))
+    journal.save({"taken_cards": ["1"], "current_pick": 1})
+    journal.save({"taken_cards": ["1", "2"], "current_pick": 2})
+    journal.close()
+    with open(journal.journal_file, "a", encoding="utf-8") as f:
+        f.write('{"set":{"current_pick":9')
+
+    assert DraftJournal(journal.state_file).load() == {
+        "taken_cards": ["1", "2"],
+        "current_pick": 2,
+    }
+
+    os.remove(journal.state_file)
+    assert DraftJournal(journal.state_file).load() is None
+
+
+def test_journal_skips_records_already_in_snapshot(tmp_path):
+    """Verify that records left behind by a crash between snapshot and truncate are not replayed twice."""
+    journal = DraftJournal(str(tmp_path / "state.json"))
+    journal.save({"taken_cards": ["1"]})
+    journal.save({"taken_cards": ["1", "2"]})
+    journal.close()
+    with open(journal.journal_file, "r", encoding="utf-8") as f:
+        stale_records = f.read()
+
+    journal = DraftJournal(journal.state_file)
+    journal.compact(journal.load())
+    with open(journal.journal_file, "w", encoding="utf-8") as f:
+        f.write(stale_records)
+
+    assert DraftJournal(journal.state_file).load() == {"taken_cards": ["1", "2"]}
+
+
+def test_named_save_skips_untouched_lists(tmp_path):
+    """Verify that a save naming its changed lists neither compares the others nor rereads the grown prefix."""
+
+    class Uncomparable(dict):
+        def __eq__(self, other):
+            raise AssertionError("compared")
+
+        __hash__ = dict.__hash__
+
+    journal = DraftJournal(str(tmp_path / "state.json"))
+    history = [Uncomparable(Pack=1, Pick=1)]
+    taken = [Uncomparable(id="1")]
+    journal.save({"taken_cards": taken, "draft_history": history, "current_pick": 1})
+
+    taken.append("2")
+    journal.save(
+        {"taken_cards": taken, "draft_history": history, "current_pick": 2},
+        changed=("taken_cards",),
+    )
+    journal.close()
+
+    assert DraftJournal(journal.state_file).load() == {
+        "taken_cards": [{"id": "1"}, "2"],
+        "draft_history": [{"Pack": 1, "Pick": 1}],
+        "current_pick": 2,
+    }
@@ -0,0 +1,161 @@
+"""
+tests/test_draft_store.py
+Tests for the SQLite draft store and the parallel draft log indexer.
+"""
+
+import os
+import pytest
+from src import constants
+from src.log_scanner import ArenaScanner
+from src.draft_store import DraftStore, DraftLogIndexer, parse_draft_log
+from tests.test_log_scanner_data import (
+    TEST_SETS,
+    OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7,
+    OTJ_QUICK_DRAFT_ENTRIES,
+    MKM_PREMIER_DRAFT_ENTRIES,
+)
+
+TEST_SETS_DIRECTORY = os.path.join(os.getcwd(), "tests", "data")
+
+DRAFT_LOGS = {
+    "DraftLog_OTJ_PremierDraft_a.log": OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7,
+    "DraftLog_OTJ_QuickDraft_b.log": OTJ_QUICK_DRAFT_ENTRIES,
+    "DraftLog_MKM_PremierDraft_c.log": MKM_PREMIER_DRAFT_ENTRIES,
+}
+
+
+@pytest.fixture
+def log_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path / "Temp"))
+    folder = tmp_path / "Logs"
+    folder.mkdir()
+    for name, entries in DRAFT_LOGS.items():
+        with open(folder / name, "w", encoding="utf-8") as log:
+            for _, _, line in entries:
+                log.write(line + "\n")
+    (folder / "notes.txt").write_text("not a draft log")
+    return folder
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DraftStore(str(tmp_path / "draft_store.db"))
+
+
+def _indexer(store, max_workers):
+    return DraftLogIndexer(
+        store, TEST_SETS, sets_location=TEST_SETS_DIRECTORY, max_workers=max_workers
+    )
+
+
+def test_parallel_index_matches_sequential_parse(log_folder, store, tmp_path):
+    assert _indexer(store, max_workers=2).index_folder(str(log_folder)) == 3
+
+    sequential = DraftStore(str(tmp_path / "sequential.db"))
+    assert _indexer(sequential, max_workers=1).index_folder(str(log_folder)) == 3
+
+    for name in DRAFT_LOGS:
+        path = str(log_folder / name)
+        parallel_record = store.get(path)
+        sequential_record = sequential.get(path)
+        assert parallel_record is not None
+        assert parallel_record["state"] == sequential_record["state"]
+        assert parallel_record["state"]["taken_cards"]
+
+
+def test_index_parse_matches_scanner(log_folder):
+    """A stored draft holds exactly what a direct scanner pass over the log sees."""
+    path = str(log_folder / "DraftLog_OTJ_PremierDraft_a.log")
+    record = parse_draft_log(path, TEST_SETS, TEST_SETS_DIRECTORY)
+
+    scanner = ArenaScanner(
+        path, TEST_SETS, sets_location=TEST_SETS_DIRECTORY, retrieve_unknown=False
+    )
+    scanner.log_enable(False)
+    scanner.draft_start_search()
+    scanner.draft_data_search()
+
+    assert record["state"] == scanner.export_state()
+    assert record["set_code"] == "OTJ"
+    assert record["event_type"] == "PremierDraft"
+    assert record["picks"] == len(scanner.taken_cards)
+
+
+def test_parse_leaves_live_draft_state_alone(log_folder):
+    """A worker never reads or rewrites the live journal and log index."""
+    live_log = str(log_folder / "DraftLog_OTJ_PremierDraft_a.log")
+    live = ArenaScanner(
+        live_log, TEST_SETS, sets_location=TEST_SETS_DIRECTORY, retrieve_unknown=False
+    )
+    live.log_enable(False)
+    live.draft_start_search()
+    live.draft_data_search()
+    live.journal.close()
+
+    # Recreate the log so the live index entry for it no longer matches
+    with open(live_log, "rb") as src, open(live_log + ".new", "wb") as dst:
+        dst.write(src.read())
+    os.replace(live_log + ".new", live_log)
+
+    def _live_files():
+        folder = constants.TEMP_FOLDER
+        return {
+            name: open(os.path.join(folder, name), "rb").read()
+            for name in os.listdir(folder)
+            if os.path.isfile(os.path.join(folder, name))
+        }
+
+    before = _live_files()
+    assert before
+
+    record = parse_draft_log(live_log, TEST_SETS, TEST_SETS_DIRECTORY)
+
+    assert record["set_code"] == "OTJ"
+    assert _live_files() == before
+
+
+def test_query_filters(log_folder, store):
+    _indexer(store, max_workers=1).index_folder(str(log_folder))
+
+    assert len(store.query()) == 3
+    assert {r["set_code"] for r in store.query(set_code="OTJ")} == {"OTJ"}
+    assert len(store.query(set_code="OTJ")) == 2
+    premier = store.query(event_type="PremierDraft")
+    assert {r["set_code"] for r in premier} == {"OTJ", "MKM"}
+    assert store.query(set_code="DSK") == []
+
+
+def test_reindex_only_changed_logs(log_folder, store):
+    indexer = _indexer(store, max_workers=1)
+    indexer.index_folder(str(log_folder))
+    assert indexer.index_folder(str(log_folder)) == 0
+
+    changed = log_folder / "DraftLog_MKM_PremierDraft_c.log"
+    with open(changed, "a", encoding="utf-8") as log:
+        log.write("Unrelated line\n")
+    assert store.get(str(changed)) is None
+    assert indexer.pending(str(log_folder)) == [str(changed)]
+    assert indexer.index_folder(str(log_folder)) == 1
+    assert store.get(str(changed)) is not None
+
+    os.remove(log_folder / "DraftLog_OTJ_QuickDraft_b.log")
+    indexer.pending(str(log_folder))
+    assert len(store.query()) == 2
+
+
+def test_restore_indexed_draft_skips_reparse(log_folder, store):
+    path = str(log_folder / "DraftLog_OTJ_PremierDraft_a.log")
+    _indexer(store, max_workers=1).index_folder(str(log_folder))
+    record = store.get(path)
+
+    scanner = ArenaScanner(
+        path, TEST_SETS, sets_location=TEST_SETS_DIRECTORY, retrieve_unknown=False
+    )
+    scanner.log_enable(False)
+    scanner.restore_indexed_draft(record["state"])
+
+    assert scanner.export_state() == record["state"]
+    assert scanner.retrieve_current_limited_event() == ("OTJ", "PremierDraft")
+    # Every cursor is at the end of the log, so nothing is parsed again
+    assert scanner.draft_start_search() is False
+    assert not scanner.draft_data_search()
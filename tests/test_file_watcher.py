@@ -0,0 +1,91 @@
+"""
+tests/test_file_watcher.py
+Test suite for the inotify and polling file watchers.
+"""
+
+import sys
+import time
+import threading
+import pytest
+from src.file_watcher import (
+    PollingFileWatcher,
+    InotifyFileWatcher,
+    create_file_watcher,
+)
+
+
+def _inotify_watcher():
+    try:
+        return InotifyFileWatcher(timeout=2.0)
+    except (OSError, AttributeError):
+        pytest.skip("inotify is not available on this platform")
+
+
+@pytest.fixture(params=["polling", "inotify"])
+def watcher(request):
+    if request.param == "polling":
+        instance = PollingFileWatcher(interval=0.05)
+    else:
+        instance = _inotify_watcher()
+    yield instance
+    instance.close()
+
+
+def test_watcher_detects_log_growth(tmp_path, watcher):
+    """Verify that appending to the watched file wakes the watcher."""
+    log_path = tmp_path / "Player.log"
+    log_path.write_text("start\n")
+    watcher.watch([str(log_path)])
+
+    with open(log_path, "a") as log_file:
+        log_file.write("[UnityCrossThreadLogger]Draft.Notify {}\n")
+
+    assert watcher.wait(timeout=2.0) is True
+
+
+def test_watcher_times_out_without_changes(tmp_path, watcher):
+    """Verify that an idle file (or an unrelated file in the same folder) does not wake the watcher."""
+    log_path = tmp_path / "Player.log"
+    log_path.write_text("start\n")
+    watcher.watch([str(log_path)])
+    (tmp_path / "other.txt").write_text("noise\n")
+
+    assert watcher.wait(timeout=0.1) is False
+
+
+def test_watcher_wake_interrupts_wait(tmp_path, watcher):
+    """Verify that wake() from another thread returns a blocked wait() early."""
+    log_path = tmp_path / "Player.log"
+    log_path.write_text("start\n")
+    watcher.watch([str(log_path)])
+
+    threading.Timer(0.05, watcher.wake).start()
+    start = time.monotonic()
+    assert watcher.wait(timeout=5.0) is False
+    assert time.monotonic() - start < 2.0
+
+
+def test_inotify_watcher_follows_recreated_log(tmp_path):
+    """Verify that a log deleted and recreated by MTGA on restart still wakes the watcher."""
+    watcher = _inotify_watcher()
+    log_path = tmp_path / "Player.log"
+    log_path.write_text("old session\n")
+    watcher.watch([str(log_path)])
+
+    log_path.unlink()
+    assert watcher.wait(timeout=2.0) is True
+    log_path.write_text("new session\n")
+    assert watcher.wait(timeout=2.0) is True
+    watcher.close()
+
+
+def test_create_file_watcher_platform_backend():
+    """Verify that Linux prefers the inotify backend and every platform gets a watcher."""
+    watcher = create_file_watcher()
+    try:
+        if sys.platform.startswith("linux"):
+            assert isinstance(watcher, (InotifyFileWatcher, PollingFileWatcher))
+        else:
+            assert isinstance(watcher, PollingFileWatcher)
+    finally:
+        watcher.close()
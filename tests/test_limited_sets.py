@@ -1,9 +1,11 @@
 import pytest
 import os
+import re
 import json
 import datetime
 import urllib.request
 from unittest.mock import patch
+from src import constants
 from src.limited_sets import (
     LimitedSets,
     SetInfo,
@@ -11,6 +13,7 @@ from src.limited_sets import (
     LIMITED_SETS_VERSION,
     REPLACE_PHRASE_DATE_SHIFT,
 )
+from tests.test_log_scanner_data import TEST_SETS as SCANNER_TEST_SETS
 
 # Test data
 SETS_FILE_LOCATION = os.path.join(os.getcwd(), "Temp", "unit_test_sets.json")
@@ -905,3 +908,130 @@ def test_substitute_string_date_shift(mock_cache, mock_urlopen, limited_sets):
         mock_date.min = datetime.date.min
         output_sets = limited_sets.retrieve_limited_sets()
     assert "Cube" in output_sets.data
+
+
+def legacy_check_special_event(set_list, event_name):
+    """ArenaScanner.__check_special_event before the compiled classifier."""
+    for event in set_list.special_events:
+        if event.type in constants.LIMITED_TYPES_DICT and all(
+            x in event_name for x in event.keywords
+        ):
+            number_of_players = (
+                4
+                if constants.PICK_TWO_EVENT_STRING in event_name
+                else event.number_of_players
+            )
+            return (
+                True,
+                event.type,
+                event.label[:12],
+                [event.set_code],
+                (number_of_players),
+            )
+    return False, "", "", "", 8
+
+
+def legacy_check_standard_event(set_list, event_name):
+    """ArenaScanner.__check_standard_event before the compiled classifier."""
+    event_match = False
+    event_type = ""
+    event_label = ""
+    event_set = []
+    number_of_players = 8
+    event_sections = event_name.split("_")
+
+    events = [i for i in constants.LIMITED_TYPES_DICT for x in event_sections if i in x]
+    if not events and [
+        i for i in constants.DRAFT_DETECTION_CATCH_ALL for x in event_sections if i in x
+    ]:
+        events.append(constants.LIMITED_TYPE_STRING_DRAFT_PREMIER)
+
+    if events:
+        upper_sections = [sec.upper() for sec in event_sections]
+        for i in sorted(
+            set_list.data.values(), key=lambda v: len(v.set_code), reverse=True
+        ):
+            if not i.set_code:
+                continue
+            normalized_code = i.set_code.replace("-", " ").replace("CUBE", " CUBE ")
+            code_parts = normalized_code.split()
+            if all(
+                any(part.upper() in sec for sec in upper_sections)
+                for part in code_parts
+            ):
+                event_set = [i.set_code]
+                break
+
+        if not event_set:
+            for section in event_sections:
+                if any(ev in section for ev in events) or section.isdigit():
+                    continue
+                if 3 <= len(section) <= 4 and section.isalnum():
+                    event_set = [section.upper()]
+                    break
+
+        event_set = ["UNKN"] if not event_set else event_set
+
+        if events[0] == constants.LIMITED_TYPE_STRING_SEALED:
+            event_type = (
+                constants.LIMITED_TYPE_STRING_TRAD_SEALED
+                if "Trad" in event_sections
+                else constants.LIMITED_TYPE_STRING_SEALED
+            )
+        else:
+            event_type = events[0]
+
+        event_label = event_type
+        event_match = True
+        number_of_players = 4 if constants.PICK_TWO_EVENT_STRING in event_name else 8
+
+    return event_match, event_type, event_label, event_set, number_of_players
+
+
+def historical_event_names():
+    """Every EventName captured in the test fixtures, plus edge cases."""
+    names = {
+        "PremierDraft_OTJ",
+        "Sealed_OTJ_Trad_20240416",
+        "TradSealed_MKM_20240206",
+        "BotDraft_DMU_20220901",
+        "PickTwoQuickDraft_OM1_20251001",
+        "PickTwoTradDraft_OM1_20251001",
+        "CubeDraft_Arena_20251028",
+        "MidWeekDraft_Chaos_20240101",
+        "QualifierPlayIn_Draft_MH3_20240707",
+        "Jumpstart_J22_20221201",
+        "draft_zzz_1",
+        "Constructed_Event_2024",
+        "",
+    }
+    pattern = re.compile(r'EventName[\\"]*:[\\"]*([A-Za-z0-9_.-]+)')
+    tests_folder = os.path.dirname(os.path.abspath(__file__))
+    for file_name in os.listdir(tests_folder):
+        if file_name.endswith(".py"):
+            with open(os.path.join(tests_folder, file_name), encoding="utf-8") as f:
+                names.update(pattern.findall(f.read()))
+    return sorted(names)
+
+
+@pytest.mark.parametrize(
+    "set_list",
+    [
+        SetDictionary(data=CHECKED_SETS_COMBINED, latest_set="OM1"),
+        SCANNER_TEST_SETS,
+    ],
+    ids=["combined", "scanner"],
+)
+def test_event_classifier_matches_legacy(set_list):
+    names = historical_event_names()
+    assert len(names) > 25
+
+    classifier = set_list.event_classifier()
+    for name in names:
+        expected = legacy_check_special_event(set_list, name)
+        if not expected[0]:
+            expected = legacy_check_standard_event(set_list, name)
+        assert classifier.classify(name) == expected, name
+        # Memoized second lookup returns the same (fresh) result
+        assert classifier.classify(name) == expected, name
+    assert set_list.event_classifier() is classifier
@@ -4,6 +4,7 @@ import queue
 from unittest.mock import patch, MagicMock
 from src.ui.orchestrator import DraftOrchestrator
 from src.configuration import Configuration
+from src.utils import Result
 
 
 @pytest.fixture
@@ -92,3 +93,177 @@ def test_file_swap_queue_processing(orchestrator):
 
     # Verify scanner was updated
     orchestrator.scanner.set_arena_file.assert_called_with("historical_draft_2.log")
+
+
+def test_ui_notifier_fires_on_refresh(orchestrator):
+    """Verify that queued UI messages are pushed through the registered notifier."""
+    import threading
+
+    notified = threading.Event()
+    orchestrator.set_ui_notifier(notified.set)
+    orchestrator.check_for_updates = MagicMock(return_value=True)
+
+    orchestrator.step_process()
+
+    assert notified.wait(timeout=2.0)
+    assert orchestrator.update_queue.get_nowait() == "REFRESH"
+    orchestrator.stop()
+
+
+def test_stop_wakes_watcher(tmp_path, orchestrator):
+    """Verify that stop() interrupts the watcher instead of waiting out its timeout."""
+    import time
+
+    log_path = tmp_path / "Player.log"
+    log_path.write_text("start\n")
+    orchestrator.scanner.arena_file = str(log_path)
+    orchestrator.live_log_path = str(log_path)
+    orchestrator._file_has_changed = MagicMock(return_value=False)
+
+    orchestrator.start()
+    time.sleep(0.2)
+    start = time.monotonic()
+    orchestrator.stop()
+    orchestrator.join(timeout=3.0)
+
+    assert not orchestrator.is_alive()
+    assert time.monotonic() - start < 2.0
+
+
+def _drain(update_queue):
+    messages = []
+    while not update_queue.empty():
+        messages.append(update_queue.get_nowait())
+    return messages
+
+
+def _slow_load(release):
+    """load_set_data stand-in that waits for release and stages the path itself."""
+
+    def load_set_data(file):
+        release.wait(timeout=2.0)
+        return Result.VALID, file, None
+
+    return load_set_data
+
+
+def _dataset_sources(orchestrator, sources):
+    scanner = orchestrator.scanner
+    scanner.retrieve_current_limited_event.return_value = ("OTJ", "PremierDraft")
+    scanner.retrieve_data_sources.return_value = sources
+    scanner.set_data._dataset = None
+    scanner.dataset_cache = set()
+
+
+@patch("src.ui.orchestrator.write_configuration")
+def test_background_dataset_load_installs_when_ready(mock_write, orchestrator):
+    """Verify that an event's dataset loads on a worker while the caller moves on."""
+    import threading
+
+    path = "/sets/OTJ_PremierDraft_All_Data.json"
+    _dataset_sources(orchestrator, {"[OTJ] PremierDraft (All)": path})
+    release = threading.Event()
+    staged = (MagicMock(), MagicMock())
+
+    def load_set_data(file):
+        release.wait(timeout=2.0)
+        return (Result.VALID, *staged)
+
+    orchestrator.scanner.load_set_data.side_effect = load_set_data
+
+    # Returns before the load finishes; nothing is installed yet
+    assert orchestrator.sync_dataset_to_event(background=True) is True
+    assert orchestrator.pending_dataset == path
+    orchestrator.scanner.install_set_data.assert_not_called()
+
+    # A repeat request for the same dataset does not start a second load
+    loader = orchestrator._dataset_thread
+    orchestrator.sync_dataset_to_event(background=True)
+    assert orchestrator._dataset_thread is loader
+
+    release.set()
+    loader.join(timeout=2.0)
+
+    orchestrator.scanner.install_set_data.assert_called_once_with(*staged)
+    assert orchestrator.pending_dataset is None
+    assert orchestrator.config.card_data.latest_dataset == os.path.basename(path)
+    messages = _drain(orchestrator.update_queue)
+    assert messages[0] == {"status": "Loading OTJ Dataset..."}
+    assert messages[-1] == "REFRESH"
+
+
+@patch("src.ui.orchestrator.write_configuration")
+def test_superseded_dataset_load_is_dropped(mock_write, orchestrator):
+    """Verify that a slow load finishing after a newer request is not installed."""
+    import threading
+
+    old_path, new_path = "/sets/OTJ_Premier.json", "/sets/OTJ_Trad.json"
+    _dataset_sources(orchestrator, {"[OTJ] PremierDraft (All)": old_path})
+    release = threading.Event()
+    orchestrator.scanner.load_set_data.side_effect = _slow_load(release)
+
+    orchestrator.sync_dataset_to_event(background=True)
+    old_loader = orchestrator._dataset_thread
+    orchestrator.scanner.retrieve_data_sources.return_value = {
+        "[OTJ] TradDraft (All)": new_path
+    }
+    orchestrator.sync_dataset_to_event(background=True)
+    new_loader = orchestrator._dataset_thread
+
+    release.set()
+    old_loader.join(timeout=2.0)
+    new_loader.join(timeout=2.0)
+
+    installed = [c.args[0] for c in orchestrator.scanner.install_set_data.mock_calls]
+    assert installed == [new_path]
+    assert orchestrator.config.card_data.latest_dataset == os.path.basename(new_path)
+
+
+@patch("src.ui.orchestrator.write_configuration")
+def test_selected_dataset_supersedes_event_preload(mock_write, orchestrator):
+    """Verify that a dataset the user picks is not overwritten by a slower event preload."""
+    import threading
+
+    event_path, chosen_path = "/sets/OTJ_Premier.json", "/sets/OTJ_Premier_Top.json"
+    _dataset_sources(orchestrator, {"[OTJ] PremierDraft (All)": event_path})
+    orchestrator.config.card_data.latest_dataset = "chosen.json"
+    release = threading.Event()
+    orchestrator.scanner.load_set_data.side_effect = _slow_load(release)
+
+    orchestrator.sync_dataset_to_event(background=True)
+    loader = orchestrator._dataset_thread
+    orchestrator.load_selected_dataset(chosen_path)
+    release.set()
+    loader.join(timeout=2.0)
+
+    orchestrator.scanner.retrieve_set_data.assert_called_once_with(chosen_path)
+    orchestrator.scanner.install_set_data.assert_not_called()
+    assert orchestrator.pending_dataset is None
+    assert orchestrator.config.card_data.latest_dataset == "chosen.json"
+
+
+@patch("src.ui.orchestrator.write_configuration")
+def test_failed_dataset_preload_is_not_installed(mock_write, orchestrator):
+    """Verify that a failed background load reports failure and is retried on the next sync."""
+    path = "/sets/OTJ_PremierDraft_All_Data.json"
+    _dataset_sources(orchestrator, {"[OTJ] PremierDraft (All)": path})
+    orchestrator.config.card_data.latest_dataset = "previous.json"
+    orchestrator.scanner.load_set_data.return_value = (
+        Result.ERROR_UNREADABLE_FILE,
+        MagicMock(),
+        MagicMock(),
+    )
+
+    orchestrator.sync_dataset_to_event(background=True)
+    orchestrator._dataset_thread.join(timeout=2.0)
+
+    orchestrator.scanner.install_set_data.assert_not_called()
+    mock_write.assert_not_called()
+    assert orchestrator.pending_dataset is None
+    assert orchestrator.config.card_data.latest_dataset == "previous.json"
+    messages = _drain(orchestrator.update_queue)
+    assert messages[-1] == {"status": "Failed to load OTJ Dataset"}
+
+    orchestrator.sync_dataset_to_event(background=True)
+    orchestrator._dataset_thread.join(timeout=2.0)
+    assert orchestrator.scanner.load_set_data.call_count == 2
@@ -3,10 +3,11 @@ tests/test_log_scanner.py
 Test suite for the ArenaScanner class logic.
 """
 
+import dataclasses
 import pytest
 import os
 from unittest.mock import patch, MagicMock
-from src.log_scanner import ArenaScanner
+from src.log_scanner import ArenaScanner, LogRoute
 from tests.test_log_scanner_data import (
     TEST_SETS,
     TDM_PREMIER_DRAFT_ENTRIES_2025_4_8,
@@ -122,6 +123,28 @@ def event_test_cases(input_scanner, event_label, entry_label, expected, entry_st
         expected.picks == picks
     ), f"Test Failed: Picks, Set: {event_label}, {entry_label}, Expected: {expected.picks}, Actual: {picks}"
 
+    # Verify that the published snapshot (lock-free UI reads) matches the live state
+    snapshot = input_scanner.retrieve_snapshot()
+    assert input_scanner.retrieve_current_limited_event(snapshot) == (
+        expected.current_set,
+        expected.current_event,
+    ), f"Test Failed: Snapshot Event, Set: {event_label}, {entry_label}"
+    assert input_scanner.retrieve_current_pack_and_pick(snapshot) == (
+        expected.current_pack,
+        expected.current_pick,
+    ), f"Test Failed: Snapshot Pack/Pick, Set: {event_label}, {entry_label}"
+    assert (
+        [x["name"] for x in input_scanner.retrieve_current_pack_cards(snapshot)],
+        [x["name"] for x in input_scanner.retrieve_taken_cards(snapshot)],
+        [x["name"] for x in input_scanner.retrieve_current_missing_cards(snapshot)],
+        [x["name"] for x in input_scanner.retrieve_current_picked_cards(snapshot)],
+    ) == (
+        expected.pack,
+        expected.card_pool,
+        expected.missing,
+        expected.picks,
+    ), f"Test Failed: Snapshot Cards, Set: {event_label}, {entry_label}"
+
 
 @pytest.mark.parametrize(
     "entry_label, expected, entry_string", TDM_PREMIER_DRAFT_ENTRIES_2025_4_8
@@ -419,3 +442,302 @@ def test_draft_state_recovery(function_scanner):
     assert new_scanner.current_pick == 1
     assert new_scanner.current_draft_id == "87b408d1-43e0-4fb5-8c74-a1257fde087c"
     assert len(new_scanner.pack_cards[0]) == len(function_scanner.pack_cards[0])
+
+
+def test_scan_log_single_pass(function_scanner):
+    """
+    Verify that the multiplexed tailer detects the event start and parses pack data
+    in one pass, opening Player.log only once and leaving every cursor at EOF.
+    """
+    P1P1_PICK_ENTRY = r'[UnityCrossThreadLogger]==> Event_PlayerDraftMakePick {"id":"3","request":"{\"DraftId\":\"87b408d1-43e0-4fb5-8c74-a1257fde087c\",\"Pack\":1,\"Pick\":1,\"GrpId\":90459}"}'
+    with open(
+        TEST_LOG_FILE_LOCATION, "a", encoding="utf-8", errors="replace"
+    ) as log_file:
+        log_file.write(f"{OTJ_EVENT_ENTRY}\n{OTJ_P1P1_ENTRY}\n{P1P1_PICK_ENTRY}\n")
+
+    real_open = open
+    log_opens = []
+
+    def counting_open(file, *args, **kwargs):
+        if file == TEST_LOG_FILE_LOCATION:
+            log_opens.append(file)
+        return real_open(file, *args, **kwargs)
+
+    with patch("src.log_scanner.open", side_effect=counting_open, create=True):
+        new_event, data_update = function_scanner.scan_log()
+
+    assert new_event is True
+    assert data_update is True
+    assert len(log_opens) == 1
+    assert function_scanner.retrieve_current_pack_and_pick() == (1, 1)
+    assert function_scanner.taken_cards == ["90459"]
+
+    file_size = os.path.getsize(TEST_LOG_FILE_LOCATION)
+    for attr in ["search_offset", "pack_offset", "pick_offset", "pool_offset"]:
+        assert getattr(function_scanner, attr) == file_size
+
+    # Nothing new in the log: a second poll reports no changes
+    assert function_scanner.scan_log() == (False, False)
+
+
+@pytest.mark.parametrize(
+    "entries",
+    [
+        OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7,
+        OTJ_QUICK_DRAFT_ENTRIES,
+        DSK_SEALED_ENTRIES_2024_9_24,
+        POWERED_CUBE_DRAFT_ENTRIES,
+    ],
+)
+def test_mmap_scan_mode_matches_readline(tmp_path, entries):
+    """
+    Verify that the mmap byte scanner produces the exact same draft state and cursors
+    as the readline scanner, including timestamps and fuzzy (reformatted) event strings.
+    """
+    import src.constants as constants
+
+    log_path = str(tmp_path / "Player.log")
+    with open(log_path, "w", encoding="utf-8", newline="") as log_file:
+        log_file.write("[UnityCrossThreadLogger]4/7/2024 7:01:02 PM\r\n")
+        log_file.write("Unrelated Unity output {with braces}\n")
+        for _, _, entry_string in entries:
+            log_file.write(f"{entry_string}\n")
+            log_file.write("[UnityCrossThreadLogger]4/7/2024 7:05:00 PM\n")
+
+    results = []
+    for mode in [constants.LOG_SCAN_MODE_READLINE, constants.LOG_SCAN_MODE_MMAP]:
+        scanner = ArenaScanner(
+            log_path,
+            TEST_SETS,
+            sets_location=TEST_SETS_DIRECTORY,
+            scan_mode=mode,
+        )
+        scanner.state_file = str(tmp_path / f"{mode}_state.json")
+        scanner.clear_draft(True)
+        scanner.log_enable(False)
+        scan_result = scanner.scan_log()
+        results.append(
+            (
+                scan_result,
+                scanner.retrieve_current_limited_event(),
+                scanner.retrieve_current_pack_and_pick(),
+                scanner.taken_cards,
+                scanner.draft_history,
+                scanner._last_seen_timestamp,
+                scanner.draft_start_time,
+                scanner.search_offset,
+                scanner.pack_offset,
+                scanner.pick_offset,
+                scanner.pool_offset,
+            )
+        )
+
+    assert results[0] == results[1]
+    assert results[1][-1] == os.path.getsize(log_path)
+
+
+def test_mmap_scan_mode_fuzzy_match(tmp_path):
+    """Verify that the byte prefilter keeps detect_string's case/underscore-insensitive matching."""
+    import src.constants as constants
+
+    log_path = str(tmp_path / "Player.log")
+    fuzzy_entry = OTJ_EVENT_ENTRY.replace("Event_Join", "EVENT JOIN")
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        log_file.write(f"{fuzzy_entry}\n")
+
+    scanner = ArenaScanner(
+        log_path,
+        TEST_SETS,
+        sets_location=TEST_SETS_DIRECTORY,
+        scan_mode=constants.LOG_SCAN_MODE_MMAP,
+    )
+    scanner.state_file = str(tmp_path / "state.json")
+    scanner.log_enable(False)
+
+    assert scanner.draft_start_search() is True
+    assert scanner.retrieve_current_limited_event() == ("OTJ", "PremierDraft")
+
+
+def _write_indexed_draft(tmp_path, monkeypatch):
+    """Writes a premier draft log and scans it once so the log index is populated."""
+    import src.constants as constants
+
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path))
+    log_path = str(tmp_path / "Player.log")
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        log_file.write("Unrelated Unity output\n" * 50)
+        for _, _, entry_string in OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7:
+            log_file.write(f"{entry_string}\n")
+
+    scanner = ArenaScanner(log_path, TEST_SETS, sets_location=TEST_SETS_DIRECTORY)
+    scanner.log_enable(False)
+    scanner.scan_log()
+    return log_path, scanner
+
+
+def _scanner_snapshot(scanner):
+    return (
+        scanner.retrieve_current_limited_event(),
+        scanner.retrieve_current_pack_and_pick(),
+        scanner.taken_cards,
+        scanner.search_offset,
+        scanner.pack_offset,
+        scanner.pick_offset,
+        scanner.pool_offset,
+    )
+
+
+def test_log_index_resumes_from_last_scanned_offset(tmp_path, monkeypatch):
+    """Verify that a restart with a matching draft state resumes every cursor from the index."""
+    log_path, scanner = _write_indexed_draft(tmp_path, monkeypatch)
+    expected = _scanner_snapshot(scanner)
+    assert os.path.exists(scanner.log_index.index_file)
+
+    restarted = ArenaScanner(log_path, TEST_SETS, sets_location=TEST_SETS_DIRECTORY)
+    restarted.log_enable(False)
+
+    assert _scanner_snapshot(restarted) == expected
+    assert restarted.scan_log() == (False, False)
+
+
+def test_log_index_replays_from_last_draft_start(tmp_path, monkeypatch):
+    """Verify that a restart without draft state seeks to the last draft start instead of byte 0."""
+    log_path, scanner = _write_indexed_draft(tmp_path, monkeypatch)
+    expected = _scanner_snapshot(scanner)
+    last_start = max(scanner._event_offsets["search_offset"])
+    os.remove(scanner.state_file)
+
+    restarted = ArenaScanner(log_path, TEST_SETS, sets_location=TEST_SETS_DIRECTORY)
+    restarted.log_enable(False)
+    assert restarted.search_offset == last_start > 0
+
+    assert restarted.draft_start_search() is True
+    restarted.draft_data_search()
+    assert _scanner_snapshot(restarted) == expected
+
+
+def test_log_index_discarded_when_head_changes(tmp_path, monkeypatch):
+    """Verify that a rewritten log with a different head falls back to a full scan."""
+    log_path, scanner = _write_indexed_draft(tmp_path, monkeypatch)
+    with open(log_path, "r+", encoding="utf-8") as log_file:
+        log_file.write("Different Unity output\n")
+
+    restarted = ArenaScanner(log_path, TEST_SETS, sets_location=TEST_SETS_DIRECTORY)
+    assert restarted.search_offset == 0
+    assert restarted.log_index.load(log_path) is None
+
+
+def test_log_index_save_throttled_during_draft(tmp_path, monkeypatch):
+    """Verify that picks only mark the index dirty and a flush persists the latest cursors."""
+    import src.constants as constants
+
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path))
+    log_path = str(tmp_path / "Player.log")
+    entries = OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        log_file.write(f"{entries[0][2]}\n")
+
+    scanner = ArenaScanner(log_path, TEST_SETS, sets_location=TEST_SETS_DIRECTORY)
+    scanner.log_enable(False)
+    saves = []
+    save = scanner.log_index.save
+    monkeypatch.setattr(
+        scanner.log_index,
+        "save",
+        lambda *args, **kwargs: saves.append(args[1]) or save(*args, **kwargs),
+    )
+
+    for _, _, entry_string in entries:
+        with open(log_path, "a", encoding="utf-8") as log_file:
+            log_file.write(f"{entry_string}\n")
+        scanner.scan_log()
+    assert len(saves) == 1
+
+    scanner.flush_log_index()
+    assert len(saves) == 2
+    expected = _scanner_snapshot(scanner)
+
+    restarted = ArenaScanner(log_path, TEST_SETS, sets_location=TEST_SETS_DIRECTORY)
+    restarted.log_enable(False)
+    assert _scanner_snapshot(restarted) == expected
+
+
+def test_log_index_keeps_only_current_draft_offsets(tmp_path, monkeypatch):
+    """Verify that event offsets from drafts before the last draft start are not stored."""
+    log_path, scanner = _write_indexed_draft(tmp_path, monkeypatch)
+    first_start = max(scanner._event_offsets["search_offset"])
+    with open(log_path, "a", encoding="utf-8") as log_file:
+        for _, _, entry_string in MKM_PREMIER_DRAFT_ENTRIES:
+            log_file.write(f"{entry_string}\n")
+    scanner.scan_log()
+    scanner.flush_log_index()
+
+    events = scanner.log_index.load(log_path)["events"]
+    last_start = max(events["search_offset"])
+    assert last_start > first_start
+    assert all(
+        offset >= last_start for offsets in events.values() for offset in offsets
+    )
+
+
+def test_snapshot_swapped_not_mutated(function_scanner):
+    """Verify that a published snapshot is frozen and later parses publish a new one."""
+    entries = OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7
+    with open(TEST_LOG_FILE_LOCATION, "a", encoding="utf-8") as log_file:
+        for _, _, entry_string in entries[:2]:
+            log_file.write(f"{entry_string}\n")
+    function_scanner.draft_start_search()
+    function_scanner.draft_data_search()
+    first = function_scanner.retrieve_snapshot()
+    assert first.current_pick == entries[1][1].current_pick
+
+    with open(TEST_LOG_FILE_LOCATION, "a", encoding="utf-8") as log_file:
+        for _, _, entry_string in entries[2:]:
+            log_file.write(f"{entry_string}\n")
+    function_scanner.draft_data_search()
+    latest = function_scanner.retrieve_snapshot()
+
+    assert latest is not first and latest.version > first.version
+    assert first.current_pick == entries[1][1].current_pick
+    assert len(latest.taken_ids) > len(first.taken_ids)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.current_pick = 99
+
+
+def test_snapshot_reads_skip_scanner_lock(function_scanner):
+    """Verify that snapshot-based reads never touch the lock the parser holds."""
+    snapshot = function_scanner.retrieve_snapshot()
+    function_scanner.lock.reset_stats()
+    function_scanner.retrieve_current_pack_cards(snapshot)
+    function_scanner.retrieve_taken_cards(snapshot)
+    function_scanner.retrieve_current_pack_and_pick(snapshot)
+    function_scanner.retrieve_draft_history(snapshot)
+    assert function_scanner.lock_stats()["acquisitions"] == 0
+
+    function_scanner.retrieve_current_pack_and_pick()
+    assert function_scanner.lock_stats()["acquisitions"] == 1
+
+
+def test_snapshot_published_when_handler_returns_false(function_scanner):
+    """Verify that state changed by a handler reporting no update still reaches the snapshot."""
+    with open(TEST_LOG_FILE_LOCATION, "a", encoding="utf-8") as log_file:
+        log_file.write('[UnityCrossThreadLogger]==> Revisit pack {"PackNumber":1}\n')
+
+    def _revisit_pack(line):
+        # Like a pack for an earlier pick: the state changes, the high-water mark does not
+        with function_scanner.lock:
+            function_scanner.pack_cards = [["90001", "90002"]]
+            function_scanner._save_state()
+        return False
+
+    # The mmap prefilter only knows the built-in parser patterns
+    function_scanner.scan_mode = "readline"
+    first = function_scanner.retrieve_snapshot()
+    updated = function_scanner._tail_log(
+        lambda: (LogRoute("pack_offset", ("Revisit pack",), _revisit_pack),)
+    )
+
+    latest = function_scanner.retrieve_snapshot()
+    assert not updated
+    assert latest.version > first.version
+    assert latest.pack_slots == (("90001", "90002"),)
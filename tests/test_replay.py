@@ -0,0 +1,74 @@
+"""
+tests/test_replay.py
+Tests for the deterministic log replay harness.
+"""
+
+import os
+import pytest
+from src import constants
+from src.replay import LogReplayer, parse_timestamp, read_replay_lines
+from tests.test_log_scanner_data import (
+    TEST_SETS,
+    OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7,
+)
+
+TEST_SETS_DIRECTORY = os.path.join(os.getcwd(), "tests", "data")
+
+
+@pytest.fixture
+def draft_log(tmp_path):
+    """A DraftLog-style recording: one timestamped line per scanner entry."""
+    path = tmp_path / "DraftLog_OTJ_PremierDraft_test.log"
+    with open(path, "w", encoding="utf-8") as log:
+        for index, (_, _, line) in enumerate(OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7):
+            log.write(f"<07052024 19:{index // 60:02d}:{index % 60:02d}>,{line}\n")
+    return str(path)
+
+
+def test_parse_timestamp_formats():
+    assert parse_timestamp("<07052024 19:00:05>,[UnityCrossThreadLogger]x") - (
+        parse_timestamp("<07052024 19:00:00>,[UnityCrossThreadLogger]x")
+    ) == pytest.approx(5)
+    assert parse_timestamp("[UnityCrossThreadLogger]4/7/2024 7:01:02 PM") - (
+        parse_timestamp("[UnityCrossThreadLogger]4/7/2024 7:00:02 PM")
+    ) == pytest.approx(60)
+    assert parse_timestamp('[UnityCrossThreadLogger]==> Event_Join {"id":1}') is None
+
+
+def test_read_replay_lines_carries_timestamps(tmp_path):
+    path = tmp_path / "Player.log"
+    path.write_text(
+        "[UnityCrossThreadLogger]4/7/2024 7:01:02 PM\n"
+        "[UnityCrossThreadLogger]==> Event_Join {}\n"
+        "Unrelated line\n"
+    )
+    lines = read_replay_lines(str(path), draft_only=True)
+    assert len(lines) == 1
+    assert lines[0][0] == parse_timestamp("[UnityCrossThreadLogger]4/7/2024 7:01:02 PM")
+
+
+def test_replay_reports_pick_latency(draft_log, tmp_path, monkeypatch):
+    """Every pack/pick line is detected, queued and rendered, in that order."""
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path))
+    replayer = LogReplayer(
+        draft_log, TEST_SETS, speed=0, sets_location=TEST_SETS_DIRECTORY
+    )
+    report = replayer.run()
+
+    expected = sum(
+        1 for _, results, _ in OTJ_PREMIER_DRAFT_ENTRIES_2024_5_7 if results.data_update
+    )
+    assert len(report.samples) >= expected
+    assert all(s.rendered is not None for s in report.samples)
+    for sample in report.samples:
+        assert sample.written <= sample.detected <= sample.queued <= sample.rendered
+
+    summary = report.summary()
+    assert summary["total"]["count"] == len(report.samples)
+    assert summary["total"]["p50"] <= summary["total"]["p95"] <= summary["total"]["p99"]
+    # The replay keeps its draft journal, log index and draft store out of the
+    # caller's Temp folder
+    assert constants.TEMP_FOLDER == str(tmp_path)
+    assert not os.path.exists(tmp_path / "active_draft_state.json")
+    assert not os.path.exists(tmp_path / constants.LOG_INDEX_FILE_NAME)
+    assert not os.path.exists(tmp_path / constants.DRAFT_STORE_FILE_NAME)
@@ -159,4 +159,113 @@ def test_metrics_unknown_field(otj_premier):
     mean, std = otj_premier.get_metrics("All Decks", "Unknown Field")
     
     assert mean == 0.0
-    assert std == 0.0 
\ No newline at end of file
+    assert std == 0.0 
+
+def test_metrics_match_compiled_dataset(tmp_path, monkeypatch, otj_premier):
+    # The compiled dataset's stats array gives the same metrics and texture as the JSON dicts
+    from src import constants
+
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path))
+    # The first open compiles the dataset, the second reads the compiled form
+    Dataset().open_file(OTJ_PREMIER_SNAPSHOT)
+    dataset = Dataset()
+    dataset.open_file(OTJ_PREMIER_SNAPSHOT)
+    assert dataset._table is not None
+    compiled = SetMetrics(dataset, 1)
+
+    for colors, field, _, _ in OTJ_PREMIER_EXPECTED_RESULTS:
+        assert compiled.get_metrics(colors, field) == otj_premier.get_metrics(colors, field)
+    assert compiled.format_texture == otj_premier.format_texture
+    assert any(sum(roles.values()) for roles in compiled.format_texture.values())
+
+
+def test_metrics_match_statistics_module(otj_premier):
+    # The array statistics agree with statistics.mean/pstdev to float precision
+    import statistics
+    from src.constants import DATA_FIELD_DECK_COLORS, DATA_FIELD_NAME
+
+    dataset = Dataset()
+    dataset.open_file(OTJ_PREMIER_SNAPSHOT)
+    metrics = SetMetrics(dataset, 1)
+
+    for colors, field in (("All Decks", DATA_FIELD_GIHWR), ("URG", DATA_FIELD_OHWR)):
+        values, seen = [], set()
+        for card in dataset.get_card_ratings().values():
+            if card[DATA_FIELD_NAME] in seen:
+                continue
+            seen.add(card[DATA_FIELD_NAME])
+            value = card[DATA_FIELD_DECK_COLORS].get(colors, {}).get(field, 0.0)
+            if value != 0.0:
+                values.append(round(value, 1))
+        expected = metrics._color_metrics[field][colors]
+        assert expected.mean == pytest.approx(statistics.mean(values), abs=1e-12)
+        assert expected.std == pytest.approx(statistics.pstdev(values), abs=1e-12)
+
+
+def test_percentile_matches_normal_dist(otj_premier):
+    # Array input gives the same percentiles as one NormalDist per win rate
+    import statistics
+    import numpy as np
+
+    winrates = [45.0, 52.37, 54.7, 61.2]
+    mean, std = otj_premier.get_metrics("WU", DATA_FIELD_GIHWR)
+    expected = [
+        round(statistics.NormalDist(mu=mean, sigma=std).cdf(w) * 100, 2)
+        for w in winrates
+    ]
+
+    assert otj_premier.calculate_percentile(winrates[1], "WU", DATA_FIELD_GIHWR) == expected[1]
+    percentiles = otj_premier.calculate_percentile(np.array(winrates), "WU", DATA_FIELD_GIHWR)
+    assert percentiles.tolist() == expected
+
+
+def test_persisted_metrics_skip_recompute(tmp_path, monkeypatch, otj_premier):
+    # The second load reads the stored metrics instead of computing them
+    from unittest.mock import patch
+    from src import constants
+    from src.set_metrics import load_set_metrics, set_metrics_path
+
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path))
+    dataset = Dataset()
+    dataset.open_file(OTJ_PREMIER_SNAPSHOT)
+    first = load_set_metrics(dataset, OTJ_PREMIER_SNAPSHOT, 1)
+    assert os.path.exists(set_metrics_path(OTJ_PREMIER_SNAPSHOT))
+
+    with patch.object(SetMetrics, "generate_metrics") as generate:
+        second = load_set_metrics(dataset, OTJ_PREMIER_SNAPSHOT, 1)
+    generate.assert_not_called()
+
+    for colors, field, _, _ in OTJ_PREMIER_EXPECTED_RESULTS:
+        assert second.get_metrics(colors, field) == otj_premier.get_metrics(colors, field)
+    assert second.format_texture == first.format_texture == otj_premier.format_texture
+
+
+def test_persisted_metrics_invalidate(tmp_path, monkeypatch):
+    # A new metrics version, a different rounding or changed file content recomputes
+    import shutil
+    from unittest.mock import patch
+    from src import constants
+    from src.set_metrics import load_set_metrics
+
+    monkeypatch.setattr(constants, "TEMP_FOLDER", str(tmp_path / "Temp"))
+    location = str(tmp_path / "OTJ_PremierDraft_All_Data.json")
+    shutil.copyfile(OTJ_PREMIER_SNAPSHOT, location)
+    dataset = Dataset()
+    dataset.open_file(location)
+    load_set_metrics(dataset, location, 1)
+
+    def generate_calls(digits=1):
+        with patch.object(SetMetrics, "generate_metrics") as generate:
+            load_set_metrics(dataset, location, digits)
+        return generate.call_count
+
+    assert generate_calls() == 0
+    assert generate_calls(digits=2) == 1
+
+    monkeypatch.setattr(constants, "SET_METRICS_VERSION", constants.SET_METRICS_VERSION + 1)
+    assert generate_calls() == 1
+    assert generate_calls() == 0
+
+    with open(location, "a", encoding="utf-8") as f:
+        f.write(" ")
+    assert generate_calls() == 1
@@ -1,8 +1,10 @@
 import pytest
+import time
+import threading
 import os
 from src.constants import SETS_FOLDER, BASE_DIR
 from src.utils import retrieve_local_set_list, Result
-from src.utils import normalize_color_string
+from src.utils import normalize_color_string, TimedLock
 from unittest.mock import patch
 
 MOCKED_SET_CODES = ["MH3", "OTJ"]
@@ -110,3 +112,106 @@ def test_normalize_color_string(input_color, expected_output):
     Verify that color strings are normalized to WUBRG order.
     """
     assert normalize_color_string(input_color) == expected_output
+
+
+def _captured_payloads():
+    from tests import test_log_scanner_data as data
+
+    payloads = []
+    for name in dir(data):
+        entries = getattr(data, name)
+        if name.endswith("_ENTRIES") or "_ENTRIES_" in name or name.endswith("_ENTRY"):
+            if isinstance(entries, str):
+                entries = [(name, None, entries)]
+            for _, _, line in entries:
+                if "{" in line:
+                    payloads.append(line[line.find("{") :])
+    return payloads
+
+
+def test_json_find_keys_matches_json_find():
+    """Verify that the targeted decoder returns exactly what process_json + json_find would on captured log lines."""
+    from src import log_scanner
+    from src.utils import process_json, json_find, json_find_keys
+
+    keys = set()
+    for name in dir(log_scanner):
+        if name.endswith("_KEYS"):
+            keys.update(getattr(log_scanner, name))
+    keys.update(["CardPool", "InternalEventName", "Course", "request", "Payload"])
+
+    payloads = _captured_payloads()
+    assert len(payloads) > 50
+
+    for payload in payloads:
+        processed = process_json(payload)
+        expected = {
+            key: json_find(key, processed)
+            for key in keys
+            if json_find(key, processed) is not None
+        }
+        assert json_find_keys(keys, payload) == expected
+
+
+@pytest.mark.parametrize(
+    "payload, keys, expected",
+    [
+        # Nested request strings are decoded on the way to a wanted key
+        (
+            '{"id":"3","request":"{\\"DraftId\\":\\"abc\\",\\"Pack\\":\\"2\\"}"}',
+            ("DraftId", "Pack"),
+            {"DraftId": "abc", "Pack": 2},
+        ),
+        # Malformed, unescaped MTGA payloads are sanitized like process_json
+        (
+            '{"id":"1","request":"{"EventName":"PremierDraft_OTJ"}"}',
+            ("EventName",),
+            {"EventName": "PremierDraft_OTJ"},
+        ),
+        # A null at a shallower level does not hide a deeper match in a sibling
+        (
+            '{"a":{"GrpId":null},"b":"{\\"GrpId\\":90459}"}',
+            ("GrpId",),
+            {"GrpId": 90459},
+        ),
+        # Missing keys and non-JSON text are simply absent
+        ("not json", ("GrpId",), {}),
+    ],
+)
+def test_json_find_keys_cases(payload, keys, expected):
+    from src.utils import json_find_keys
+
+    assert json_find_keys(keys, payload) == expected
+
+
+def test_timed_lock_counts_contention():
+    lock = TimedLock()
+    held = threading.Event()
+
+    def holder():
+        with lock:
+            held.set()
+            time.sleep(0.05)
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    held.wait()
+    assert lock.acquire(blocking=False) is False
+    with lock:
+        pass
+    thread.join()
+
+    # Reentrant for the owning thread
+    with lock:
+        with lock:
+            pass
+
+    stats = lock.stats()
+    assert stats["busy"] == 1
+    assert stats["contended"] == 1
+    assert stats["acquisitions"] == 4
+    assert stats["max_wait_ms"] >= 30
+    assert stats["wait_ms"] >= stats["max_wait_ms"]
+
+    lock.reset_stats()
+    assert lock.stats()["acquisitions"] == 0